@@ -701,6 +701,20 @@ export default function App() {
     }
   };
 
+  // Warm the backend stream URL cache for the next few JioSaavn tracks in the queue
+  useEffect(() => {
+    const upcoming = queue
+      .slice(queueIndex + 1, queueIndex + 4)
+      .filter(t => t.saavn_id && !t.stream_url)
+      .map(t => t.saavn_id);
+    if (upcoming.length === 0) return;
+    fetch('/api/music/stream/prefetch', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ ids: upcoming }),
+    }).catch(e => console.warn('Stream prefetch failed:', e));
+  }, [queue, queueIndex]);
+
   // Sync YouTube player time
   useEffect(() => {
     let timer: any;
@@ -3,7 +3,6 @@ API Fetcher for Lyrica
 Fetches songs (YouTube) and concerts (Ticketmaster) and stores them in MongoDB.
 """
 
-import requests
 import sys
 import os
 from datetime import datetime
@@ -15,8 +14,8 @@ except Exception:
     pass
 
 from api.config import APIConfig
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+from utils.http_client import http_get
+from utils.youtube_quota import youtube_quota, is_quota_error
 from models.user import User
 
 # ===========================================
@@ -53,20 +52,30 @@ def fetch_songs_from_youtube():
         print("YOUTUBE_API_KEY not found in environment variables. Skipping YouTube fetch.")
         return
 
+    # Background fetch: may not dip into the share reserved for user-facing search
+    if not youtube_quota.try_spend("videos.list", user_facing=False):
+        print("YouTube quota budget for background fetches is used up. Skipping YouTube fetch.")
+        return
+
     try:
-        youtube = build('youtube', 'v3', developerKey=api_key)
-
-        # Get the most popular music videos for the US
-        request = youtube.videos().list(
-            part="snippet",
-            chart="mostPopular",
-            regionCode="US",
-            videoCategoryId="10", # 10 is the category for Music
-            maxResults=10
-        )
-        response = request.execute()
-
-        items = response.get('items', [])
+        # Get the most popular music videos for the US (videos.list over the shared HTTP client)
+        resp = http_get("https://www.googleapis.com/youtube/v3/videos", params={
+            "part": "snippet",
+            "chart": "mostPopular",
+            "regionCode": "US",
+            "videoCategoryId": "10", # 10 is the category for Music
+            "maxResults": 10,
+            "key": api_key
+        })
+        if is_quota_error(resp):
+            youtube_quota.record_exhausted()
+            print("YouTube API quota exceeded. Please wait until it resets (Pacific Time).")
+            return
+        if not resp.ok:
+            log_api_error("YouTube Videos", resp.status_code, resp.text)
+            return
+
+        items = resp.json().get('items', [])
         if not items:
             print("No popular music videos found on YouTube.")
             return
@@ -102,11 +111,6 @@ def fetch_songs_from_youtube():
 
         print(f"Stored {stored_count} new songs from YouTube.")
 
-    except HttpError as e:
-        if e.resp.status == 403 and 'quotaExceeded' in str(e.content):
-            print("YouTube API quota exceeded. Please wait until it resets (Pacific Time).")
-        else:
-            log_api_error("YouTube Videos", e.resp.status, e.content)
     except Exception as e:
         print(f"An unexpected error occurred while fetching from YouTube: {e}")
 
@@ -123,7 +127,7 @@ def fetch_concerts():
         return
         
     url = f"https://app.ticketmaster.com/discovery/v2/events.json?classificationName=music&size=10&apikey={api_key}"
-    resp = requests.get(url)
+    resp = http_get(url)
     
     if resp.status_code == 200:
         response_json = resp.json()
@@ -13,6 +13,11 @@ try:
 except ImportError:
     pass
 
+# Optional upstream record/replay transport (UPSTREAM_MODE=record|replay) for offline benchmarking
+if os.getenv("UPSTREAM_MODE"):
+    from utils.upstream_replay import install as install_upstream_replay
+    install_upstream_replay()
+
 from flask import Flask, jsonify, request, send_from_directory
 from werkzeug.utils import safe_join
 from flask_login import LoginManager, current_user
@@ -42,9 +42,14 @@ class ArtistModel:
             # Indexes for analytics lookups
             db.artist_analytics.create_index([("artistId", 1)], unique=True)
             
+            # Range indexes for the staleness sweeper
+            for field in ("lastAggregated", "bio_cached_at", "mb_cached_at", "saavn_cached_at"):
+                db.artists.create_index([(field, 1)])
+            
             # Indexes for persistent aggregation queue
             db.aggregation_queue.create_index([("artistId", 1)], unique=True)
             db.aggregation_queue.create_index([("status", 1), ("priority", 1), ("createdAt", 1)])
+            db.aggregation_queue.create_index([("status", 1), ("nextRunAt", 1)])
             
             # Indexes for source health tracking
             db.source_health.create_index([("source", 1)], unique=True)
@@ -63,6 +68,9 @@ class ArtistModel:
             db.search_queries.create_index([("query", 1)])
             db.search_queries.create_index([("timestamp", -1)])
             
+            # Indexes for maintenance job checkpoints (batch reclassification etc.)
+            db.maintenance_jobs.create_index([("job", 1)], unique=True)
+            
             # Indexes for general search index collection
             db.search_index.create_index([("text", 1)])
             db.search_index.create_index([("type", 1), ("artistId", 1)])
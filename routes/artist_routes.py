@@ -7,7 +7,12 @@ from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
 from datetime import datetime, timezone, timedelta
 from models.artist import ArtistModel
-from utils.artist_aggregator import seed_database, trigger_background_refresh, SEED_ARTISTS_METADATA, EMOTION_KEYWORDS
+from utils.http_cache import cached_get, cache_stats
+from utils.http_client import http_get, client_stats
+from utils.saavn_client import saavn_get, saavn_client
+from utils.youtube_quota import youtube_quota
+from utils.circuit_breaker import breaker_snapshots
+from utils.artist_aggregator import seed_database, trigger_background_refresh, source_breaker, source_metrics, staleness_sweeper, SEED_ARTISTS_METADATA, EMOTION_KEYWORDS
 
 artist_bp = Blueprint("artist", __name__)
 
@@ -23,28 +28,22 @@ def is_placeholder_image(url):
         return True
     return False
 
-def get_jiosaavn_artist_info(artist_id, artist_name):
+def get_jiosaavn_artist_info(artist_id, artist_name, force=False):
+    """
+    Cached JioSaavn artist id and image. Only a cold cache (or force=True, used by the
+    staleness sweeper) goes to the network; expiring entries are refreshed in the background.
+    """
     db = ArtistModel.get_db()
     artist = db.artists.find_one({"artistId": artist_id})
-    if artist:
+    if artist and not force:
         saavn_id = artist.get("saavn_artist_id")
-        saavn_image = artist.get("saavn_image")
-        cached_at = artist.get("saavn_cached_at")
-        if saavn_id and cached_at:
-            if isinstance(cached_at, str):
-                try:
-                    cached_at = datetime.fromisoformat(cached_at)
-                except ValueError:
-                    cached_at = None
-            if cached_at:
-                age = datetime.utcnow() - cached_at
-                if age.total_seconds() < 24 * 3600:
-                    return saavn_id, saavn_image
+        if saavn_id and artist.get("saavn_cached_at"):
+            return saavn_id, artist.get("saavn_image")
 
     # Fetch from JioSaavn API
     try:
-        r = requests.get(
-            "https://saavn.dev/api/search/artists",
+        r = saavn_get(
+            "/search/artists",
             params={"query": artist_name, "limit": 1},
             timeout=3
         )
@@ -72,6 +71,42 @@ def get_jiosaavn_artist_info(artist_id, artist_name):
         return artist.get("saavn_artist_id"), artist.get("saavn_image")
     return None, None
 
+def refresh_lastfm_bio(artist_id, artist_name):
+    """Fetch the Last.fm bio and tags into the artist document. Returns the fields written."""
+    db = ArtistModel.get_db()
+    api_key = os.getenv("LASTFM_API_KEY", "b25b9595548c7e052445b23d91b48d2c")
+    try:
+        lfm_r = cached_get(
+            "http://ws.audioscrobbler.com/2.0/",
+            params={
+                "method": "artist.getinfo",
+                "artist": artist_name,
+                "api_key": api_key,
+                "format": "json"
+            },
+            timeout=4
+        )
+        if lfm_r.status_code == 200:
+            lfm_data = lfm_r.json()
+            lfm_artist = lfm_data.get("artist", {})
+            bio_summary = lfm_artist.get("bio", {}).get("summary", "")
+            if "<a href" in bio_summary:
+                bio_summary = bio_summary.split("<a href")[0].strip()
+            
+            tags = [t.get("name") for t in lfm_artist.get("tags", {}).get("tag", []) if t.get("name")]
+            
+            update_fields = {"bio_cached_at": datetime.utcnow()}
+            if bio_summary:
+                update_fields["bio"] = bio_summary
+            if tags:
+                update_fields["genres"] = tags
+            
+            db.artists.update_one({"artistId": artist_id}, {"$set": update_fields})
+            return update_fields
+    except Exception as e:
+        print(f"Error fetching Last.fm bio for {artist_name}: {e}")
+    return {}
+
 # Adjacency transitions for emotion journey BFS
 EMOTION_TRANSITIONS = {
     "euphoric":   ["hopeful", "romantic"],
@@ -106,19 +141,16 @@ def get_health_stats():
     queue_pending = db.aggregation_queue.count_documents({"status": "pending"})
     queue_running = db.aggregation_queue.count_documents({"status": "running"})
     queue_complete = db.aggregation_queue.count_documents({"status": "complete"})
-    queue_failed = db.aggregation_queue.count_documents({"status": "failed"})
+    queue_retrying = db.aggregation_queue.count_documents({"status": "pending", "attempts": {"$gt": 0}})
+    queue_dead = db.aggregation_queue.count_documents({"status": "dead"})
     
-    # Query source health metrics
-    health_docs = list(db.source_health.find())
+    # Source health: persisted totals merged with the unflushed in-memory metrics
+    health_docs = {doc["source"]: doc for doc in db.source_health.find()}
     source_health = {}
-    for doc in health_docs:
-        source_health[doc["source"]] = {
-            "lastRequest": doc.get("lastRequest").isoformat() if doc.get("lastRequest") else None,
-            "requestsToday": doc.get("requestsToday", 0),
-            "successCount": doc.get("successCount", 0),
-            "failureCount": doc.get("failureCount", 0),
-            "isRateLimited": doc.get("isRateLimited", False)
-        }
+    for source in sorted(set(health_docs) | set(source_metrics.pending_sources())):
+        entry = source_metrics.merged_view(health_docs.get(source), source)
+        entry["circuit"] = source_breaker(source).snapshot()
+        source_health[source] = entry
 
     return jsonify({
         "status": "online",
@@ -135,7 +167,8 @@ def get_health_stats():
             "pending": queue_pending,
             "running": queue_running,
             "complete": queue_complete,
-            "failed": queue_failed
+            "retrying": queue_retrying,
+            "dead": queue_dead
         },
         "sourceHealth": source_health,
         "aggregatedArtists": queue_complete,
@@ -146,15 +179,20 @@ def get_health_stats():
         "artist_graph": {
             "count": graph_count
         },
-        "source_health": source_health
+        "source_health": source_health,
+        "httpCache": cache_stats(),
+        "httpClient": client_stats(),
+        "saavnMirrors": saavn_client.stats(),
+        "youtubeQuota": youtube_quota.status(),
+        "circuitBreakers": breaker_snapshots()
     }), 200
 
 
 @artist_bp.route("/<artist_id>", methods=["GET"])
 def get_artist_profile(artist_id):
     """
-    Get core artist metadata. If not present in DB, seeds it and triggers background refresh.
-    If cache is older than 7 days, triggers background refresh.
+    Get core artist metadata. If not present in DB, seeds it and triggers background aggregation.
+    Expiring data is refreshed by the background staleness sweeper, never from this read path.
     Returns cached metadata immediately.
     """
     seed_database()
@@ -176,61 +214,13 @@ def get_artist_profile(artist_id):
 
     artist_name = artist.get("name", artist_id)
 
-    # Cache expiration check (7 days)
-    last_updated = artist.get("lastAggregated")
-    if last_updated:
-        if hasattr(last_updated, "tzinfo") and last_updated.tzinfo is not None:
-            now = datetime.now(timezone.utc)
-        else:
-            now = datetime.utcnow()
-        if (now - last_updated) > timedelta(days=7):
-            trigger_background_refresh(artist_id)
-
-    # 1. Last.fm Bio Caching (TTL: 7 days)
-    bio_cached_at = artist.get("bio_cached_at")
-    need_bio_refresh = True
-    if bio_cached_at:
-        if isinstance(bio_cached_at, str):
-            try:
-                bio_cached_at = datetime.fromisoformat(bio_cached_at)
-            except ValueError:
-                bio_cached_at = None
-        if bio_cached_at and (datetime.utcnow() - bio_cached_at).total_seconds() < 7 * 24 * 3600:
-            need_bio_refresh = False
-
-    if need_bio_refresh:
-        api_key = os.getenv("LASTFM_API_KEY", "b25b9595548c7e052445b23d91b48d2c")
-        try:
-            lfm_r = requests.get(
-                "http://ws.audioscrobbler.com/2.0/",
-                params={
-                    "method": "artist.getinfo",
-                    "artist": artist_name,
-                    "api_key": api_key,
-                    "format": "json"
-                },
-                timeout=4
-            )
-            if lfm_r.status_code == 200:
-                lfm_data = lfm_r.json()
-                lfm_artist = lfm_data.get("artist", {})
-                bio_summary = lfm_artist.get("bio", {}).get("summary", "")
-                if "<a href" in bio_summary:
-                    bio_summary = bio_summary.split("<a href")[0].strip()
-                
-                tags = [t.get("name") for t in lfm_artist.get("tags", {}).get("tag", []) if t.get("name")]
-                
-                update_fields = {"bio_cached_at": datetime.utcnow()}
-                if bio_summary:
-                    update_fields["bio"] = bio_summary
-                    artist["bio"] = bio_summary
-                if tags:
-                    update_fields["genres"] = tags
-                    artist["genres"] = tags
-                
-                db.artists.update_one({"artistId": artist_id}, {"$set": update_fields})
-        except Exception as e:
-            print(f"Error fetching Last.fm bio for {artist_name}: {e}")
+    # 1. Last.fm Bio (TTL: 7 days). Staleness is handled by the background sweeper;
+    # the read path only fills a cold cache.
+    if not artist.get("bio_cached_at"):
+        update_fields = refresh_lastfm_bio(artist_id, artist_name)
+        for field in ("bio", "genres"):
+            if field in update_fields:
+                artist[field] = update_fields[field]
 
     # 2. JioSaavn Image Fallback
     image_url = artist.get("imageUrl", artist.get("cover"))
@@ -288,8 +278,8 @@ def get_artist_songs(artist_id):
 
     try:
         # Fetch artist songs from saavn.dev
-        r = requests.get(
-            f"https://saavn.dev/api/artists/{saavn_id}/songs",
+        r = saavn_get(
+            f"/artists/{saavn_id}/songs",
             params={"page": 0, "songCount": 20},
             timeout=4
         )
@@ -330,6 +320,142 @@ def get_artist_songs(artist_id):
         return jsonify({"songs": [], "error": "Stream source unavailable"}), 200
 
 
+def refresh_mb_discography(artist_id, artist_name):
+    """Replace the artist's stored albums/singles from MusicBrainz + Cover Art Archive. Returns (albums, singles)."""
+    db = ArtistModel.get_db()
+    headers = {"User-Agent": "LyricaMusicLyrics/1.0 (contact: demo@lyrica.com)"}
+
+    # Step 1: Search MusicBrainz for artist MBID
+    # Rate limit compliance (1 req/s) is enforced by cached_get on network trips
+    mb_artist_r = cached_get(
+        "https://musicbrainz.org/ws/2/artist",
+        params={"query": f"artist:{artist_name}", "fmt": "json"},
+        headers=headers,
+        timeout=5
+    ).json()
+    
+    artists_list = mb_artist_r.get("artists", [])
+    if not artists_list:
+        return [], []
+        
+    mbid = artists_list[0]["id"]
+    
+    # Step 2: Fetch release groups
+    # Rate limit compliance (1 req/s) is enforced by cached_get on network trips
+    rg_url = f"https://musicbrainz.org/ws/2/release-group?artist={mbid}&fmt=json"
+    rg_r = cached_get(rg_url, headers=headers, timeout=5).json()
+    release_groups = rg_r.get("release-groups", [])
+    
+    albums = []
+    singles = []
+    
+    albums_rg = [rg for rg in release_groups if (rg.get("primary-type") or "").lower() == "album"][:10]
+    singles_rg = [rg for rg in release_groups if (rg.get("primary-type") or "").lower() in ("single", "ep")][:10]
+    
+    def get_cover_art(rg_id):
+        try:
+            caa_r = cached_get(f"https://coverartarchive.org/release-group/{rg_id}", timeout=2)
+            if caa_r.status_code == 200:
+                images = caa_r.json().get("images", [])
+                if images:
+                    return images[0].get("image")
+        except Exception:
+            pass
+        return "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
+        
+    # Delete existing cached albums for this artist before replacing
+    db.albums.delete_many({"artistId": artist_id})
+    
+    for rg in albums_rg:
+        rg_id = rg.get("id")
+        date_str = rg.get("first-release-date", "")
+        year = int(date_str.split("-")[0]) if date_str else 2020
+        cover = get_cover_art(rg_id)
+        album_item = {
+            "albumId": rg_id,
+            "title": rg.get("title"),
+            "year": year,
+            "type": "album",
+            "coverUrl": cover
+        }
+        albums.append(album_item)
+        
+        # Save to db
+        db.albums.insert_one({
+            "artistId": artist_id,
+            "albumId": rg_id,
+            "title": rg.get("title"),
+            "year": year,
+            "type": "album",
+            "coverUrl": cover
+        })
+        
+    for rg in singles_rg:
+        rg_id = rg.get("id")
+        date_str = rg.get("first-release-date", "")
+        year = int(date_str.split("-")[0]) if date_str else 2020
+        cover = get_cover_art(rg_id)
+        single_item = {
+            "albumId": rg_id,
+            "title": rg.get("title"),
+            "year": year,
+            "type": "single",
+            "coverUrl": cover
+        }
+        singles.append(single_item)
+        
+        # Save to db
+        db.albums.insert_one({
+            "artistId": artist_id,
+            "albumId": rg_id,
+            "title": rg.get("title"),
+            "year": year,
+            "type": "single",
+            "coverUrl": cover
+        })
+        
+    # Update mb_cached_at on the artist document
+    db.artists.update_one(
+        {"artistId": artist_id},
+        {"$set": {"mb_cached_at": datetime.utcnow()}}
+    )
+    return albums, singles
+
+
+def _stored_discography(artist_id):
+    db = ArtistModel.get_db()
+    albums = []
+    singles = []
+    for a in db.albums.find({"artistId": artist_id}):
+        item = {
+            "albumId": a.get("albumId"),
+            "title": a.get("title"),
+            "year": a.get("year", 2020),
+            "type": a.get("type", "album"),
+            "coverUrl": a.get("coverUrl") or "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
+        }
+        if a.get("type") == "single":
+            singles.append(item)
+        else:
+            albums.append(item)
+    return albums, singles
+
+
+# The staleness sweeper refreshes these per-artist caches ahead of expiry, off the request path
+staleness_sweeper.register(
+    "bio_cached_at", timedelta(days=7),
+    lambda doc: refresh_lastfm_bio(doc["artistId"], doc.get("name", doc["artistId"]))
+)
+staleness_sweeper.register(
+    "mb_cached_at", timedelta(days=7),
+    lambda doc: refresh_mb_discography(doc["artistId"], doc.get("name", doc["artistId"]))
+)
+staleness_sweeper.register(
+    "saavn_cached_at", timedelta(days=1),
+    lambda doc: get_jiosaavn_artist_info(doc["artistId"], doc.get("name", doc["artistId"]), force=True)
+)
+
+
 @artist_bp.route("/<artist_id>/albums", methods=["GET"])
 def get_artist_albums(artist_id):
     """
@@ -343,160 +469,21 @@ def get_artist_albums(artist_id):
         return jsonify({"error": "Artist not found"}), 404
     artist_name = artist["name"]
 
-    # Cache TTL for MusicBrainz discography (7 days)
-    mb_cached_at = artist.get("mb_cached_at")
-    need_mb_refresh = True
-    if mb_cached_at:
-        if isinstance(mb_cached_at, str):
-            try:
-                mb_cached_at = datetime.fromisoformat(mb_cached_at)
-            except ValueError:
-                mb_cached_at = None
-        if mb_cached_at and (datetime.utcnow() - mb_cached_at).total_seconds() < 7 * 24 * 3600:
-            need_mb_refresh = False
-
-    if not need_mb_refresh:
-        # Load from db.albums
-        db_albums = list(db.albums.find({"artistId": artist_id}))
-        if db_albums:
-            albums = []
-            singles = []
-            for a in db_albums:
-                a["_id"] = str(a["_id"])
-                item = {
-                    "albumId": a.get("albumId"),
-                    "title": a.get("title"),
-                    "year": a.get("year", 2020),
-                    "type": a.get("type", "album"),
-                    "coverUrl": a.get("coverUrl") or "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
-                }
-                if a.get("type") == "single":
-                    singles.append(item)
-                else:
-                    albums.append(item)
+    # MusicBrainz discography (TTL: 7 days). Stored albums are served while present; the
+    # background sweeper refreshes them before they expire, so only a cold cache fetches here.
+    if artist.get("mb_cached_at"):
+        albums, singles = _stored_discography(artist_id)
+        if albums or singles:
             return jsonify({"albums": albums, "singles": singles}), 200
 
     # Otherwise fetch from MusicBrainz and Cover Art Archive
-    headers = {"User-Agent": "LyricaMusicLyrics/1.0 (contact: demo@lyrica.com)"}
     try:
-        # Step 1: Search MusicBrainz for artist MBID
-        # Rate limit compliance: sleep 1s
-        time.sleep(1)
-        mb_artist_r = requests.get(
-            "https://musicbrainz.org/ws/2/artist",
-            params={"query": f"artist:{artist_name}", "fmt": "json"},
-            headers=headers,
-            timeout=5
-        ).json()
-        
-        artists_list = mb_artist_r.get("artists", [])
-        if not artists_list:
-            return jsonify({"albums": [], "singles": []}), 200
-            
-        mbid = artists_list[0]["id"]
-        
-        # Step 2: Fetch release groups
-        # Rate limit compliance: sleep 1s
-        time.sleep(1)
-        rg_url = f"https://musicbrainz.org/ws/2/release-group?artist={mbid}&fmt=json"
-        rg_r = requests.get(rg_url, headers=headers, timeout=5).json()
-        release_groups = rg_r.get("release-groups", [])
-        
-        albums = []
-        singles = []
-        
-        albums_rg = [rg for rg in release_groups if (rg.get("primary-type") or "").lower() == "album"][:10]
-        singles_rg = [rg for rg in release_groups if (rg.get("primary-type") or "").lower() in ("single", "ep")][:10]
-        
-        def get_cover_art(rg_id):
-            try:
-                caa_r = requests.get(f"https://coverartarchive.org/release-group/{rg_id}", timeout=2)
-                if caa_r.status_code == 200:
-                    images = caa_r.json().get("images", [])
-                    if images:
-                        return images[0].get("image")
-            except Exception:
-                pass
-            return "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
-            
-        # Delete existing cached albums for this artist before replacing
-        db.albums.delete_many({"artistId": artist_id})
-        
-        for rg in albums_rg:
-            rg_id = rg.get("id")
-            date_str = rg.get("first-release-date", "")
-            year = int(date_str.split("-")[0]) if date_str else 2020
-            cover = get_cover_art(rg_id)
-            album_item = {
-                "albumId": rg_id,
-                "title": rg.get("title"),
-                "year": year,
-                "type": "album",
-                "coverUrl": cover
-            }
-            albums.append(album_item)
-            
-            # Save to db
-            db.albums.insert_one({
-                "artistId": artist_id,
-                "albumId": rg_id,
-                "title": rg.get("title"),
-                "year": year,
-                "type": "album",
-                "coverUrl": cover
-            })
-            
-        for rg in singles_rg:
-            rg_id = rg.get("id")
-            date_str = rg.get("first-release-date", "")
-            year = int(date_str.split("-")[0]) if date_str else 2020
-            cover = get_cover_art(rg_id)
-            single_item = {
-                "albumId": rg_id,
-                "title": rg.get("title"),
-                "year": year,
-                "type": "single",
-                "coverUrl": cover
-            }
-            singles.append(single_item)
-            
-            # Save to db
-            db.albums.insert_one({
-                "artistId": artist_id,
-                "albumId": rg_id,
-                "title": rg.get("title"),
-                "year": year,
-                "type": "single",
-                "coverUrl": cover
-            })
-            
-        # Update mb_cached_at on the artist document
-        db.artists.update_one(
-            {"artistId": artist_id},
-            {"$set": {"mb_cached_at": datetime.utcnow()}}
-        )
-        
+        albums, singles = refresh_mb_discography(artist_id, artist_name)
         return jsonify({"albums": albums, "singles": singles}), 200
-        
     except Exception as e:
         print(f"Error fetching MusicBrainz albums for {artist_name}: {e}")
         # Return whatever we have in the DB as fallback
-        db_albums = list(db.albums.find({"artistId": artist_id}))
-        albums = []
-        singles = []
-        for a in db_albums:
-            a["_id"] = str(a["_id"])
-            item = {
-                "albumId": a.get("albumId"),
-                "title": a.get("title"),
-                "year": a.get("year", 2020),
-                "type": a.get("type", "album"),
-                "coverUrl": a.get("coverUrl") or "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
-            }
-            if a.get("type") == "single":
-                singles.append(item)
-            else:
-                albums.append(item)
+        albums, singles = _stored_discography(artist_id)
         return jsonify({"albums": albums, "singles": singles}), 200
 
 
@@ -537,8 +524,8 @@ def get_lyrics_snippets(artist_id):
         return jsonify({"quotes": []}), 200
         
     try:
-        r = requests.get(
-            f"https://saavn.dev/api/artists/{saavn_id}/songs",
+        r = saavn_get(
+            f"/artists/{saavn_id}/songs",
             params={"page": 0, "songCount": 10},
             timeout=3
         )
@@ -554,7 +541,7 @@ def get_lyrics_snippets(artist_id):
             
             # 1. LRCLib API check
             try:
-                lrc_r = requests.get(
+                lrc_r = cached_get(
                     "https://lrclib.net/api/get",
                     params={"artist_name": artist_name, "track_name": track_name},
                     timeout=2
@@ -576,7 +563,7 @@ def get_lyrics_snippets(artist_id):
             # 2. lyrics.ovh fallback API check
             try:
                 ovh_url = f"https://api.lyrics.ovh/v1/{artist_name}/{track_name}"
-                ovh_r = requests.get(ovh_url, timeout=2)
+                ovh_r = http_get(ovh_url, timeout=2, retry=False)
                 if ovh_r.status_code == 200:
                     lyrics_text = ovh_r.json().get("lyrics") or ""
                     if lyrics_text:
@@ -915,18 +902,7 @@ def emotional_search():
 
     # Zero results check: if no artists matches, enqueue normalized query
     if not artists_matches:
-        db.aggregation_queue.update_one(
-            {"artistId": query},
-            {
-                "$set": {
-                    "priority": "user_search",
-                    "status": "pending",
-                    "createdAt": datetime.now(timezone.utc),
-                    "attempts": 0
-                }
-            },
-            upsert=True
-        )
+        trigger_background_refresh(query)
         return jsonify({
             "results": [],
             "artists": [],
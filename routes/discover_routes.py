@@ -3,7 +3,7 @@ Discover routes (concerts + recommended).
 """
 from flask import Blueprint, jsonify, request
 import os
-import requests
+from utils.http_client import http_get
 from datetime import datetime
 import math
 
@@ -130,7 +130,7 @@ def concerts():
         print(f"[discover] Querying Ticketmaster with params: {params}")
         LAST_TM['params'] = dict(params)
         LAST_TM['timestamp'] = datetime.utcnow().isoformat()
-        resp = requests.get(url, params=params, timeout=12)
+        resp = http_get(url, params=params, timeout=12)
 
         # store raw response for debugging
         LAST_TM['status_code'] = resp.status_code
@@ -170,7 +170,7 @@ def concerts():
             for r in (100, 250):
                 params['radius'] = r
                 print(f"[discover] Fallback radius={r} params={params}")
-                resp = requests.get(url, params=params, timeout=12)
+                resp = http_get(url, params=params, timeout=12)
                 LAST_TM['params'] = dict(params)
                 LAST_TM['status_code'] = resp.status_code
                 try:
@@ -188,7 +188,7 @@ def concerts():
             # Try removing classificationName filter to broaden results
             params.pop('classificationName', None)
             print(f"[discover] Fallback remove classification params={params}")
-            resp = requests.get(url, params=params, timeout=12)
+            resp = http_get(url, params=params, timeout=12)
             LAST_TM['params'] = dict(params)
             LAST_TM['status_code'] = resp.status_code
             try:
@@ -213,7 +213,7 @@ def concerts():
                         'size': 50,
                     }
                     print(f"[discover] Fallback city=Dehradun params={city_params}")
-                    resp = requests.get(url, params=city_params, timeout=12)
+                    resp = http_get(url, params=city_params, timeout=12)
                     LAST_TM['params'] = dict(city_params)
                     LAST_TM['status_code'] = resp.status_code
                     try:
@@ -235,7 +235,7 @@ def concerts():
                         'size': 50,
                     }
                     print(f"[discover] Fallback keyword=Dehradun params={kw_params}")
-                    resp = requests.get(url, params=kw_params, timeout=12)
+                    resp = http_get(url, params=kw_params, timeout=12)
                     LAST_TM['params'] = dict(kw_params)
                     LAST_TM['status_code'] = resp.status_code
                     try:
@@ -4,7 +4,7 @@ Lyrics routes — powered by LRCLIB (free, no API key needed).
 Returns timed LRC lyrics parsed into a JS-friendly array.
 """
 from flask import Blueprint, request, jsonify
-import requests
+from utils.http_client import http_get
 import re
 
 lyrics_bp = Blueprint("lyrics", __name__)
@@ -69,12 +69,12 @@ def get_lyrics():
             pass
 
     try:
-        r = requests.get(f"{LRCLIB_BASE}/get", params=params, timeout=8)
+        r = http_get(f"{LRCLIB_BASE}/get", params=params, timeout=8)
 
         if r.status_code == 404:
             # Try without duration as a fallback
             params_no_dur = {"artist_name": artist, "track_name": title}
-            r2 = requests.get(f"{LRCLIB_BASE}/get", params=params_no_dur, timeout=8)
+            r2 = http_get(f"{LRCLIB_BASE}/get", params=params_no_dur, timeout=8)
             if r2.status_code == 404:
                 return jsonify({
                     "lyrics": [],
@@ -1,40 +1,48 @@
 # routes/music.py
 """
-Music routes — powered by JioSaavn (via saavn.dev, no API key needed).
+Music routes — powered by JioSaavn (via saavn.dev-compatible mirrors, see utils/saavn_client.py; no API key needed).
 YouTube is used as a fallback for search when JioSaavn returns no results.
 Stream URLs are fetched fresh at play-time (they expire in ~15 min).
 """
 from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
-import requests
+from utils.http_client import http_get
+from utils.saavn_client import saavn_get
+from utils.youtube_quota import youtube_quota, is_quota_error, QuotaRefused
 import os
+from pymongo import UpdateOne
+from utils.http_cache import cached_get
 
 bp = Blueprint("music", __name__)
 
-SAAVN_BASE = "https://saavn.sumit.co/api"
 YT_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
 
-import json
 import re
-import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timedelta, timezone
+from utils.chart_refresh import ChartRefreshCoordinator
+from utils.chart_scheduler import ChartScheduler
+from utils.regional_charts import aggregate_regional_chart
+from utils.config_registry import ConfigRegistry
+from utils.lru_cache import LRUCache
+from utils.featured_feed import FeaturedFeed
+from utils.single_flight import SingleFlight
 
 CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "language_charts.json")
+FEATURED_CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "config", "featured_sections.json")
 
-def validate_config_startup():
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            for lang, val in data.items():
-                if val is None:
-                    print(f"[WARN] Startup Validation: language chart '{lang}' is configured as null. It will be hidden in UI.")
-        except Exception as e:
-            print(f"[ERROR] Startup Validation: Failed to read {CONFIG_PATH}: {e}")
-    else:
-        print(f"[WARN] Startup Validation: {CONFIG_PATH} not found.")
+def validate_language_charts(data):
+    if not isinstance(data, dict):
+        raise ValueError("expected an object of language -> playlist id")
+    for lang, val in data.items():
+        if val is None:
+            print(f"[WARN] Config Validation: language chart '{lang}' is configured as null. It will be hidden in UI.")
+        elif not isinstance(val, str):
+            raise ValueError(f"playlist id for '{lang}' must be a string or null")
 
-validate_config_startup()
+# Parsed once and hot-reloaded (mtime watcher / SIGHUP); request paths only read the snapshot
+language_charts = ConfigRegistry(CONFIG_PATH, validate=validate_language_charts)
 
 _mongo_client = None
 
@@ -49,9 +57,33 @@ def get_db():
 
 def get_cached_chart(chart_type, language=None):
     db = get_db()
-    query = {"chartType": chart_type, "language": language}
+    # A doc with only `lastRefresh` is a failed first refresh, not a cached chart
+    query = {"chartType": chart_type, "language": language, "lastUpdated": {"$exists": True}}
     return db.charts.find_one(query)
 
+# Apple storefront aggregates. Add a region (e.g. "eu", "latam") here; storefronts are
+# fetched in parallel under `deadlineSeconds` and merged with a utils.regional_charts strategy.
+REGIONAL_CHARTS = {
+    "asia": {
+        "storefronts": ["in", "jp", "kr", "id", "ph", "th", "vn", "sg", "my"],
+        "perStorefront": 25,
+        "deadlineSeconds": 8.0,
+        "merge": "frequency_rank"
+    }
+}
+
+# How long a cached chart counts as fresh, per chart type
+CHART_FRESH_HOURS = {"worldwide": 24, "asia": 24, "india": 6, "language": 6}
+
+def configured_charts():
+    """[(chart_type, language, fresh_hours)] for the fixed charts plus every language with a playlist configured."""
+    chart_types = ["worldwide", *REGIONAL_CHARTS, "india"]
+    charts = [(c_type, None, CHART_FRESH_HOURS.get(c_type, 24)) for c_type in chart_types]
+    for lang, val in language_charts.snapshot().items():
+        if val and lang != "india":
+            charts.append(("language", lang, CHART_FRESH_HOURS["language"]))
+    return charts
+
 def is_cache_fresh(chart_doc, fresh_hours):
     if not chart_doc or "lastUpdated" not in chart_doc:
         return False
@@ -62,55 +94,135 @@ def is_cache_fresh(chart_doc, fresh_hours):
     return (now - last_updated) < timedelta(hours=fresh_hours)
 
 def update_chart_in_background(chart_type, language=None):
-    thread = threading.Thread(target=perform_chart_update, args=(chart_type, language))
-    thread.daemon = True
-    thread.start()
+    """Queue a refresh on the chart refresher; no-op if this chart is already queued or refreshing."""
+    return chart_refresher.refresh_async(chart_type, language)
+
+def _clean_chart_title(title):
+    cleaned = re.sub(r"\(feat\..*?\)", "", title.lower())
+    cleaned = re.sub(r"\(with.*?\)", "", cleaned)
+    return re.sub(r"\-.*", "", cleaned).strip()
+
+class ChartMatchUnavailable(Exception):
+    """Saavn couldn't be asked (HTTP error / exception), as opposed to a clean "no match"."""
 
 def fuzzy_match_apple_track(title, artist):
+    """Best JioSaavn match for an Apple chart track, or None. Raises ChartMatchUnavailable if Saavn failed."""
     query = f"{title} {artist}"
     try:
-        r = requests.get(f"{SAAVN_BASE}/search/songs", params={"query": query, "limit": 3}, timeout=5)
-        if r.ok:
-            data = r.json()
-            songs = data.get("data", {}).get("results", [])
-            for song in songs:
-                s_title = song.get("name", "").lower()
-                s_title_clean = re.sub(r"\(feat\..*?\)", "", s_title)
-                s_title_clean = re.sub(r"\(with.*?\)", "", s_title_clean)
-                s_title_clean = re.sub(r"\-.*", "", s_title_clean).strip()
-                
-                orig_title_clean = re.sub(r"\(feat\..*?\)", "", title.lower())
-                orig_title_clean = re.sub(r"\(with.*?\)", "", orig_title_clean)
-                orig_title_clean = re.sub(r"\-.*", "", orig_title_clean).strip()
-                
-                s_words = set(re.findall(r"\w+", s_title_clean))
-                o_words = set(re.findall(r"\w+", orig_title_clean))
-                if not s_words or not o_words:
-                    continue
-                overlap = len(s_words.intersection(o_words)) / len(o_words)
-                if overlap >= 0.7:
-                    s_artists = [a.get("name", "").lower() for a in song.get("artists", {}).get("primary", [])]
-                    if not s_artists and "primaryArtists" in song:
-                        s_artists = [a.strip().lower() for a in song["primaryArtists"].split(",")]
-                    
-                    orig_artist = artist.lower()
-                    artist_match = False
-                    for sa in s_artists:
-                        if sa in orig_artist or orig_artist in sa:
-                            artist_match = True
-                            break
-                    if artist_match:
-                        return _normalize_saavn_song(song)
+        r = saavn_get("/search/songs", params={"query": query, "limit": 3}, timeout=5)
+        if not r.ok:
+            raise ChartMatchUnavailable(f"Saavn search returned HTTP {r.status_code}")
+        data = r.json()
+    except ChartMatchUnavailable:
+        raise
     except Exception as e:
-        print(f"[music] Fuzzy match error for '{query}': {e}")
+        raise ChartMatchUnavailable(f"search for '{query}' failed: {e}") from e
+
+    songs = data.get("data", {}).get("results", [])
+    for song in songs:
+        s_title_clean = _clean_chart_title(song.get("name", ""))
+        orig_title_clean = _clean_chart_title(title)
+        
+        s_words = set(re.findall(r"\w+", s_title_clean))
+        o_words = set(re.findall(r"\w+", orig_title_clean))
+        if not s_words or not o_words:
+            continue
+        overlap = len(s_words.intersection(o_words)) / len(o_words)
+        if overlap >= 0.7:
+            s_artists = [a.get("name", "").lower() for a in song.get("artists", {}).get("primary", [])]
+            if not s_artists and "primaryArtists" in song:
+                s_artists = [a.strip().lower() for a in song["primaryArtists"].split(",")]
+            
+            orig_artist = artist.lower()
+            artist_match = False
+            for sa in s_artists:
+                if sa in orig_artist or orig_artist in sa:
+                    artist_match = True
+                    break
+            if artist_match:
+                return _normalize_saavn_song(song)
     return None
 
+# Resolved Apple -> JioSaavn matches are kept for CHART_MATCH_TTL_DAYS; misses are
+# retried after CHART_MATCH_NEGATIVE_TTL_HOURS since Saavn may add the song later.
+# Lookups that failed (Saavn down) are not cached at all; the next refresh retries them.
+CHART_MATCH_TTL = timedelta(days=int(os.getenv("CHART_MATCH_TTL_DAYS", "30")))
+CHART_MATCH_NEGATIVE_TTL = timedelta(hours=int(os.getenv("CHART_MATCH_NEGATIVE_TTL_HOURS", "24")))
+
+def _title_artist_key(title, artist):
+    words = re.findall(r"\w+", f"{_clean_chart_title(title)} | {artist.lower()}")
+    return " ".join(words)
+
+def resolve_chart_track(title, artist, apple_id=None):
+    """
+    Cached fuzzy_match_apple_track. Looks up `chart_track_matches` by Apple track ID or
+    normalized title+artist; only unseen (or expired) tracks hit Saavn.
+    Returns (normalized song or None, cache_hit).
+    """
+    db = get_db()
+    ta_key = _title_artist_key(title, artist)
+    apple_id = str(apple_id) if apple_id else None
+    keys = [{"titleArtistKey": ta_key}]
+    if apple_id:
+        keys.insert(0, {"appleId": apple_id})
+    now = datetime.now(timezone.utc)
+    cached = db.chart_track_matches.find_one({"$or": keys, "expiresAt": {"$gt": now}})
+    if cached:
+        match = cached.get("match")
+        # Entries cached before stream URLs were stripped may still carry one
+        return (dict(match, stream_url="") if match and match.get("stream_url") else match), True
+
+    try:
+        match = fuzzy_match_apple_track(title, artist)
+    except ChartMatchUnavailable as e:
+        print(f"[music] Chart match for '{title}' unavailable, not caching: {e}")
+        return None, False
+    # CDN stream URLs expire in ~15 min; players resolve them via /stream at play time
+    if match and "stream_url" in match:
+        match = dict(match, stream_url="")
+    db.chart_track_matches.update_one(
+        {"_id": f"apple:{apple_id}" if apple_id else f"ta:{ta_key}"},
+        {"$set": {
+            "appleId": apple_id,
+            "titleArtistKey": ta_key,
+            "title": title,
+            "artist": artist,
+            "match": match,
+            "resolvedAt": now,
+            "expiresAt": now + (CHART_MATCH_TTL if match else CHART_MATCH_NEGATIVE_TTL)
+        }},
+        upsert=True
+    )
+    return match, False
+
+def _match_stats(results):
+    """Per-refresh match metrics from [(track, cache_hit)]."""
+    matched = sum(1 for track, _ in results if track.get("playable"))
+    hits = sum(1 for _, hit in results if hit)
+    return {
+        "matched": matched,
+        "unmatched": len(results) - matched,
+        "matchRate": round(matched / len(results), 3) if results else 0.0,
+        "cacheHits": hits,
+        "cacheMisses": len(results) - hits
+    }
+
+def ensure_chart_indexes():
+    db = get_db()
+    try:
+        db.charts.create_index([("chartType", 1), ("language", 1)])
+        db.chart_track_matches.create_index([("appleId", 1)])
+        db.chart_track_matches.create_index([("titleArtistKey", 1)])
+        db.chart_track_matches.create_index([("expiresAt", 1)], expireAfterSeconds=0)
+    except Exception as e:
+        print(f"[music] Error creating chart indexes: {e}")
+
 def fetch_apple_metadata(apple_ids):
     if not apple_ids:
         return {}
     try:
         ids_str = ",".join(str(i) for i in apple_ids)
-        r = requests.get("https://itunes.apple.com/lookup", params={"id": ids_str}, timeout=8)
+        r = cached_get("https://itunes.apple.com/lookup", params={"id": ids_str}, timeout=8)
         if r.ok:
             results = r.json().get("results", [])
             metadata = {}
@@ -136,15 +248,18 @@ def fetch_apple_metadata(apple_ids):
     return {}
 
 def perform_chart_update(chart_type, language=None):
+    """Fetch and cache one chart. Returns an outcome dict ({"status": "ok"|"skipped"|"error", ...})."""
     try:
         print(f"[music] Refreshing chart cache for: type={chart_type}, lang={language}")
         tracks = []
         source = "jiosaavn"
+        match_stats = None
+        upstream_error = None
         
         if chart_type == "worldwide":
             source = "apple"
             url = "https://rss.applemarketingtools.com/api/v2/us/music/most-played/50/songs.json"
-            r = requests.get(url, timeout=10)
+            r = cached_get(url, timeout=10)
             if r.ok:
                 results = r.json().get("feed", {}).get("results", [])
                 
@@ -152,8 +267,6 @@ def perform_chart_update(chart_type, language=None):
                 apple_ids = [t.get("id", "") for t in results if t.get("id")]
                 apple_meta = fetch_apple_metadata(apple_ids)
                 
-                from concurrent.futures import ThreadPoolExecutor
-                
                 def match_task(idx_track):
                     idx, track = idx_track
                     title = track.get("name", "")
@@ -161,11 +274,11 @@ def perform_chart_update(chart_type, language=None):
                     cover = track.get("artworkUrl100", "").replace("100x100bb.jpg", "500x500bb.jpg")
                     apple_id = str(track.get("id", ""))
                     
-                    matched = fuzzy_match_apple_track(title, artist)
+                    matched, cache_hit = resolve_chart_track(title, artist, apple_id)
                     if matched:
                         matched["rank"] = idx
                         matched["playable"] = True
-                        return matched
+                        return matched, cache_hit
                     else:
                         meta = apple_meta.get(apple_id, {})
                         return {
@@ -180,66 +293,34 @@ def perform_chart_update(chart_type, language=None):
                             "duration_secs": meta.get("duration_secs", 0),
                             "source": "saavn",
                             "playable": False
-                        }
+                        }, cache_hit
                 
-                with ThreadPoolExecutor(max_workers=10) as executor:
-                    tracks = list(executor.map(match_task, enumerate(results, 1)))
+                matches = list(_chart_match_executor.map(match_task, enumerate(results, 1)))
+                tracks = [track for track, _ in matches]
+                match_stats = _match_stats(matches)
+            else:
+                upstream_error = f"Apple RSS returned HTTP {r.status_code}"
                         
-        elif chart_type == "asia":
+        elif chart_type in REGIONAL_CHARTS:
             source = "apple"
-            storefronts = ["in", "jp", "kr", "id", "ph", "th", "vn", "sg", "my"]
-            track_data = {}
-            for sf in storefronts:
-                sf_url = f"https://rss.applemarketingtools.com/api/v2/{sf}/music/most-played/25/songs.json"
-                try:
-                    res = requests.get(sf_url, timeout=5)
-                    if res.ok:
-                        results = res.json().get("feed", {}).get("results", [])
-                        for rank, track in enumerate(results, 1):
-                            title = track.get("name", "")
-                            artist = track.get("artistName", "")
-                            cover = track.get("artworkUrl100", "").replace("100x100bb.jpg", "500x500bb.jpg")
-                            apple_id = track.get("id", "")
-                            
-                            key = (title.lower().strip(), artist.lower().strip())
-                            if key not in track_data:
-                                track_data[key] = {
-                                    "title": title,
-                                    "artist": artist,
-                                    "cover": cover,
-                                    "apple_id": apple_id,
-                                    "ranks": {}
-                                }
-                            track_data[key]["ranks"][sf] = rank
-                except Exception as ex:
-                    print(f"[music] Asia aggregation: storefront {sf} failed: {ex}")
-            
-            ranked = []
-            for key, data in track_data.items():
-                freq = len(data["ranks"])
-                avg_pos = sum(data["ranks"].values()) / freq
-                ranked.append((freq, avg_pos, data))
-            
-            ranked.sort(key=lambda x: (-x[0], x[1]))
+            merged = aggregate_regional_chart(REGIONAL_CHARTS[chart_type], limit=50)
             
             # Fetch Apple metadata in batch!
-            apple_ids = [item[2]["apple_id"] for item in ranked[:50] if item[2].get("apple_id")]
+            apple_ids = [data["apple_id"] for data in merged if data.get("apple_id")]
             apple_meta = fetch_apple_metadata(apple_ids)
             
-            from concurrent.futures import ThreadPoolExecutor
-            
-            def match_asia_task(idx_item):
-                idx, (freq, avg_pos, data) = idx_item
+            def match_regional_task(idx_item):
+                idx, data = idx_item
                 title = data["title"]
                 artist = data["artist"]
                 cover = data["cover"]
                 apple_id = str(data["apple_id"])
                 
-                matched = fuzzy_match_apple_track(title, artist)
+                matched, cache_hit = resolve_chart_track(title, artist, apple_id)
                 if matched:
                     matched["rank"] = idx
                     matched["playable"] = True
-                    return matched
+                    return matched, cache_hit
                 else:
                     meta = apple_meta.get(apple_id, {})
                     return {
@@ -254,35 +335,22 @@ def perform_chart_update(chart_type, language=None):
                         "duration_secs": meta.get("duration_secs", 0),
                         "source": "saavn",
                         "playable": False
-                    }
+                    }, cache_hit
             
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                tracks = list(executor.map(match_asia_task, enumerate(ranked[:50], 1)))
+            matches = list(_chart_match_executor.map(match_regional_task, enumerate(merged, 1)))
+            tracks = [track for track, _ in matches]
+            match_stats = _match_stats(matches)
                     
         elif chart_type in ("india", "language"):
             source = "jiosaavn"
-            playlist_id = None
+            cfg = language_charts.snapshot()
             if chart_type == "india":
-                playlist_id = "1134548194"
-                if os.path.exists(CONFIG_PATH):
-                    try:
-                        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                            cfg = json.load(f)
-                            if cfg.get("india"):
-                                playlist_id = cfg["india"]
-                    except Exception:
-                        pass
+                playlist_id = cfg.get("india") or "1134548194"
             else:
-                if os.path.exists(CONFIG_PATH):
-                    try:
-                        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                            cfg = json.load(f)
-                            playlist_id = cfg.get(language)
-                    except Exception:
-                        pass
+                playlist_id = cfg.get(language)
             
             if playlist_id:
-                r = requests.get(f"{SAAVN_BASE}/playlists?id={playlist_id}", timeout=10)
+                r = saavn_get("/playlists", params={"id": playlist_id}, timeout=10)
                 if r.ok:
                     songs = r.json().get("data", {}).get("songs", [])
                     for idx, song in enumerate(songs, 1):
@@ -290,9 +358,17 @@ def perform_chart_update(chart_type, language=None):
                         normalized["rank"] = idx
                         normalized["playable"] = True
                         tracks.append(normalized)
+                else:
+                    upstream_error = f"JioSaavn playlist returned HTTP {r.status_code}"
             else:
                 print(f"[music] No playlist ID configured for language '{language}'")
-                return
+                return {"status": "skipped", "reason": "no playlist configured"}
+
+        # An upstream failure or an empty answer must not overwrite the cached chart
+        if not tracks:
+            error = upstream_error or "upstream returned no tracks"
+            print(f"[music] Not updating {chart_type}/{language}: {error}")
+            return {"status": "error", "error": error}
 
         db = get_db()
         db.charts.update_one(
@@ -309,8 +385,42 @@ def perform_chart_update(chart_type, language=None):
             upsert=True
         )
         print(f"[music] Cache successfully updated for: type={chart_type}, lang={language}. Total tracks: {len(tracks)}")
+        outcome = {"status": "ok", "trackCount": len(tracks)}
+        if match_stats:
+            outcome["matchStats"] = match_stats
+            print(f"[music] Match stats for {chart_type}: {match_stats}")
+        return outcome
     except Exception as e:
         print(f"[music] perform_chart_update error: {e}")
+        return {"status": "error", "error": str(e)}
+
+# Refreshes are single-flight per (chartType, language) and run on a small pool;
+# Saavn fuzzy matching for all refreshes shares one bounded pool.
+chart_refresher = ChartRefreshCoordinator(
+    perform_chart_update,
+    get_db,
+    max_workers=int(os.getenv("CHART_REFRESH_WORKERS", "2")),
+    lease_seconds=int(os.getenv("CHART_REFRESH_LEASE_SECONDS", "300"))
+)
+_chart_match_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="chart-match")
+
+chart_scheduler = ChartScheduler(
+    chart_refresher,
+    get_db,
+    configured_charts,
+    interval=float(os.getenv("CHART_SCHEDULER_SECONDS", "60"))
+)
+
+@bp.record_once
+def _start_music_services(state):
+    ensure_chart_indexes()
+    ensure_search_indexes()
+    ensure_track_indexes()
+    language_charts.start()
+    featured_config.start()
+    featured_feed.start()
+    if os.getenv("CHART_SCHEDULER_ENABLED", "1") != "0":
+        chart_scheduler.start()
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -454,11 +564,24 @@ def _normalize_saavn_artist(artist: dict) -> dict:
     }
 
 
+class SearchSourceError(Exception):
+    """A search source failed (HTTP error, exception), as opposed to answering with no results."""
+
+
 def _yt_search_unified(query: str, type_param: str, limit: int = 20) -> list:
-    if not YT_API_KEY:
-        print("[music] YouTube API key is missing.")
+    """YouTube search; any failure is logged and returns [] so callers can fall back."""
+    try:
+        return _yt_search(query, type_param, limit)
+    except Exception as e:
+        print(f"[music] YouTube search error: {e}")
         return []
 
+
+def _yt_search(query: str, type_param: str, limit: int = 20) -> list:
+    """YouTube search that raises SearchSourceError on failure (used where a failure must not look like "no results")."""
+    if not YT_API_KEY:
+        raise SearchSourceError("YouTube API key is missing")
+
     yt_type = "video"
     video_category = None
     q_suffix = ""
@@ -477,6 +600,10 @@ def _yt_search_unified(query: str, type_param: str, limit: int = 20) -> list:
         yt_type = "video,playlist,channel"
 
     full_query = query + q_suffix
+
+    # search.list costs 100 units; refuse before the budget runs out and let Saavn answer
+    if not youtube_quota.try_spend("search", user_facing=True):
+        raise QuotaRefused("YouTube quota budget reached")
     
     try:
         url = "https://www.googleapis.com/youtube/v3/search"
@@ -490,15 +617,17 @@ def _yt_search_unified(query: str, type_param: str, limit: int = 20) -> list:
         if video_category and yt_type == "video":
             params["videoCategoryId"] = video_category
 
-        r = requests.get(url, params=params, timeout=10)
+        # No transport retries: a failure falls back to Saavn (or is left out of federated results)
+        r = http_get(url, params=params, timeout=10, retry=False)
         
-        # Fallback trigger: return empty list on quota/other API failures
+        # Fallback trigger: quota/other API failures raise so the caller can fall back
+        if is_quota_error(r):
+            youtube_quota.record_exhausted()
+            raise QuotaRefused("YouTube reported quotaExceeded")
         if r.status_code == 403:
-            print("[music] YouTube API rate limit exceeded or forbidden (403).")
-            return []
+            raise SearchSourceError("YouTube API rate limit exceeded or forbidden (403)")
         if not r.ok:
-            print(f"[music] YouTube API error: {r.status_code} {r.text}")
-            return []
+            raise SearchSourceError(f"YouTube API error: {r.status_code} {r.text}")
 
         items = r.json().get("items", [])
         results = []
@@ -570,9 +699,10 @@ def _yt_search_unified(query: str, type_param: str, limit: int = 20) -> list:
                     })
 
         return results[:limit]
+    except (SearchSourceError, QuotaRefused):
+        raise
     except Exception as e:
-        print(f"[music] YouTube search error: {e}")
-        return []
+        raise SearchSourceError(str(e)) from e
 
 
 def _yt_search_fallback(query: str, limit: int = 10) -> list:
@@ -580,34 +710,84 @@ def _yt_search_fallback(query: str, limit: int = 10) -> list:
     return _yt_search_unified(query, "tracks", limit)
 
 
-@bp.route("/search", methods=["GET"])
-def search_tracks():
-    """
-    Search endpoint that serves JioSaavn or YouTube results, normalized and cached.
-    GET /api/music/search?q=<query>&limit=20&source=<saavn|youtube>&type=<all|tracks|albums|playlists|artists>
-    """
-    query = request.args.get("q", "").strip()
-    source_param = request.args.get("source", "saavn").strip().lower()
-    type_param = request.args.get("type", "all").strip().lower()
-    limit = min(int(request.args.get("limit", 20)), 30)
+def _saavn_search_unified(query: str, type_param: str, limit: int = 20) -> list:
+    """JioSaavn search; any failure is logged and returns []."""
+    try:
+        return _saavn_search(query, type_param, limit)
+    except Exception as e:
+        print(f"[music] JioSaavn search error: {e}")
+        return []
 
-    if not query:
-        return jsonify({"results": [], "source": "none"}), 200
 
-    # Retrieve database and ensure TTL index on search cache
+def _saavn_search(query: str, type_param: str, limit: int = 20) -> list:
+    """JioSaavn search that raises SearchSourceError on failure."""
+    results = []
+    r = None
+    try:
+        if type_param == "all":
+            # Multi-type search
+            r = saavn_get("/search", params={"query": query}, timeout=10)
+            if r.ok:
+                data = r.json().get("data", {}) or {}
+                # Normalize each category
+                songs_data = (data.get("songs") or {}).get("results", [])
+                albums_data = (data.get("albums") or {}).get("results", [])
+                playlists_data = (data.get("playlists") or {}).get("results", [])
+                artists_data = (data.get("artists") or {}).get("results", [])
+
+                norm_songs = [_normalize_saavn_song(s) for s in songs_data[:8]]
+                norm_albums = [_normalize_saavn_album(a) for a in albums_data[:6]]
+                norm_playlists = [_normalize_saavn_playlist(p) for p in playlists_data[:6]]
+                norm_artists = [_normalize_saavn_artist(art) for art in artists_data[:6]]
+
+                results = norm_songs + norm_albums + norm_playlists + norm_artists
+        elif type_param == "tracks":
+            r = saavn_get("/search/songs", params={"query": query, "limit": limit}, timeout=10)
+            if r.ok:
+                songs = r.json().get("data", {}).get("results", [])
+                results = [_normalize_saavn_song(s) for s in songs]
+        elif type_param == "albums":
+            r = saavn_get("/search/albums", params={"query": query, "limit": limit}, timeout=10)
+            if r.ok:
+                albums = r.json().get("data", {}).get("results", [])
+                results = [_normalize_saavn_album(a) for a in albums]
+        elif type_param == "playlists":
+            r = saavn_get("/search/playlists", params={"query": query, "limit": limit}, timeout=10)
+            if r.ok:
+                playlists = r.json().get("data", {}).get("results", [])
+                results = [_normalize_saavn_playlist(p) for p in playlists]
+        elif type_param == "artists":
+            r = saavn_get("/search/artists", params={"query": query, "limit": limit}, timeout=10)
+            if r.ok:
+                artists = r.json().get("data", {}).get("results", [])
+                results = [_normalize_saavn_artist(art) for art in artists]
+    except Exception as e:
+        raise SearchSourceError(str(e)) from e
+    if r is not None and not r.ok:
+        raise SearchSourceError(f"JioSaavn search returned HTTP {r.status_code}")
+    return results
+
+
+# Search results: a hot in-process LRU in front of the Mongo TTL cache. Empty
+# results (usually an upstream failure) are only kept for the negative TTL.
+SEARCH_CACHE_TTL_SECONDS = int(os.getenv("SEARCH_CACHE_TTL_SECONDS", "3600"))
+SEARCH_NEGATIVE_TTL_SECONDS = int(os.getenv("SEARCH_NEGATIVE_TTL_SECONDS", "60"))
+_search_lru = LRUCache(
+    max_entries=int(os.getenv("SEARCH_LRU_ENTRIES", "2000")),
+    max_bytes=int(os.getenv("SEARCH_LRU_MAX_BYTES", str(32 * 1024 * 1024)))
+)
+_search_flight = SingleFlight()
+
+def ensure_search_indexes():
     db = get_db()
-    db.search_cache.create_index("createdAt", expireAfterSeconds=3600)
-
-    # Lookup cache
-    cache_key = f"{query.lower().strip()}:{source_param}:{type_param}"
-    cached_doc = db.search_cache.find_one({"key": cache_key})
-    if cached_doc:
-        return jsonify({
-            "results": cached_doc["results"],
-            "source": cached_doc["source"],
-            "cached": True
-        }), 200
+    try:
+        db.search_cache.create_index("key")
+        db.search_cache.create_index("expiresAt", expireAfterSeconds=0)
+    except Exception as e:
+        print(f"[music] Error creating search cache indexes: {e}")
 
+def _search_upstream(query, source_param, type_param, limit):
+    """Run the search against YouTube/JioSaavn. Returns (results, actual_source)."""
     results = []
     actual_source = source_param
 
@@ -622,46 +802,127 @@ def search_tracks():
 
     # --- JioSaavn Mode / Fallback ---
     if actual_source == "saavn":
+        results = _saavn_search_unified(query, type_param, limit)
+
+    return results, actual_source
+
+# Federated search: every source is queried concurrently under one deadline and the
+# rankings are merged with reciprocal rank fusion (score = sum of 1 / (k + rank)).
+# Sources raise SearchSourceError on failure so it isn't mistaken for "no results".
+FEDERATED_SOURCES = {
+    "saavn": _saavn_search,
+    "youtube": _yt_search
+}
+# On a duplicate, keep the entry from the earlier source (Saavn entries are directly playable)
+FEDERATED_SOURCE_PREFERENCE = ["saavn", "youtube"]
+FEDERATED_DEADLINE_SECONDS = float(os.getenv("SEARCH_FEDERATED_DEADLINE_SECONDS", "4"))
+# Each federated cache miss costs a 100-unit YouTube search; below this many units left, YouTube sits out
+FEDERATED_YT_MIN_REMAINING = int(os.getenv("SEARCH_FEDERATED_YT_MIN_REMAINING", "2000"))
+RRF_K = 60
+# Not used as a context manager: a source that misses the deadline finishes in the background
+_federated_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="federated-search")
+
+_TITLE_NOISE = re.compile(r"[\(\[][^\)\]]*[\)\]]|official (music )?(video|audio)|lyrics?( video)?|\bhd\b|\b4k\b")
+_ARTIST_NOISE = re.compile(r"vevo$|- topic$|\bofficial\b|\bmusic\b")
+
+def _artist_key(artist):
+    # First credited artist only, squashed so "TheWeekndVEVO" and "The Weeknd" agree
+    first = re.split(r",|&|\bfeat\.?|\bft\.?|•", artist.lower())[0].strip()
+    return "".join(re.findall(r"\w+", _ARTIST_NOISE.sub("", first)))
+
+def _federation_key(item):
+    """Normalized (type, title, artist) so the same track from different sources collapses to one entry."""
+    title = _TITLE_NOISE.sub(" ", (item.get("title") or "").lower())
+    artist = item.get("artist") or item.get("subtitle") or ""
+    # YouTube video titles are usually "Artist - Song"; the channel name is less reliable
+    if item.get("source") == "youtube" and " - " in title:
+        artist, title = title.split(" - ", 1)
+    return (item.get("type"), " ".join(re.findall(r"\w+", title)), _artist_key(artist))
+
+def _timed_source(fn, query, type_param, limit):
+    started = time.perf_counter()
+    results = fn(query, type_param, limit)
+    return results, round((time.perf_counter() - started) * 1000)
+
+def _federated_search(query, type_param, limit, deadline=None):
+    """
+    Returns (fused results, {source: {"status", "ms", "count"}}). Status is ok/empty for a
+    real answer, disabled for an unconfigured source, quota when YouTube was skipped for
+    quota, and error/timeout for a source that failed or missed the deadline (left out).
+    """
+    deadline = FEDERATED_DEADLINE_SECONDS if deadline is None else deadline
+    timings = {}
+    sources = dict(FEDERATED_SOURCES)
+    if "youtube" in sources:
+        if not YT_API_KEY:
+            del sources["youtube"]
+            timings["youtube"] = {"status": "disabled", "ms": None, "count": 0}
+        elif youtube_quota.remaining() < FEDERATED_YT_MIN_REMAINING:
+            del sources["youtube"]
+            timings["youtube"] = {"status": "quota", "ms": None, "count": 0}
+
+    futures = {
+        _federated_executor.submit(_timed_source, fn, query, type_param, limit): name
+        for name, fn in sources.items()
+    }
+    done, pending = wait(futures, timeout=deadline)
+
+    ranked_lists = {}
+    for future in done:
+        name = futures[future]
         try:
-            if type_param == "all":
-                # Multi-type search
-                r = requests.get(f"{SAAVN_BASE}/search", params={"query": query}, timeout=10)
-                if r.ok:
-                    data = r.json().get("data", {}) or {}
-                    # Normalize each category
-                    songs_data = (data.get("songs") or {}).get("results", [])
-                    albums_data = (data.get("albums") or {}).get("results", [])
-                    playlists_data = (data.get("playlists") or {}).get("results", [])
-                    artists_data = (data.get("artists") or {}).get("results", [])
-
-                    norm_songs = [_normalize_saavn_song(s) for s in songs_data[:8]]
-                    norm_albums = [_normalize_saavn_album(a) for a in albums_data[:6]]
-                    norm_playlists = [_normalize_saavn_playlist(p) for p in playlists_data[:6]]
-                    norm_artists = [_normalize_saavn_artist(art) for art in artists_data[:6]]
-
-                    results = norm_songs + norm_albums + norm_playlists + norm_artists
-            elif type_param == "tracks":
-                r = requests.get(f"{SAAVN_BASE}/search/songs", params={"query": query, "limit": limit}, timeout=10)
-                if r.ok:
-                    songs = r.json().get("data", {}).get("results", [])
-                    results = [_normalize_saavn_song(s) for s in songs]
-            elif type_param == "albums":
-                r = requests.get(f"{SAAVN_BASE}/search/albums", params={"query": query, "limit": limit}, timeout=10)
-                if r.ok:
-                    albums = r.json().get("data", {}).get("results", [])
-                    results = [_normalize_saavn_album(a) for a in albums]
-            elif type_param == "playlists":
-                r = requests.get(f"{SAAVN_BASE}/search/playlists", params={"query": query, "limit": limit}, timeout=10)
-                if r.ok:
-                    playlists = r.json().get("data", {}).get("results", [])
-                    results = [_normalize_saavn_playlist(p) for p in playlists]
-            elif type_param == "artists":
-                r = requests.get(f"{SAAVN_BASE}/search/artists", params={"query": query, "limit": limit}, timeout=10)
-                if r.ok:
-                    artists = r.json().get("data", {}).get("results", [])
-                    results = [_normalize_saavn_artist(art) for art in artists]
+            results, ms = future.result()
+            ranked_lists[name] = results
+            timings[name] = {"status": "ok" if results else "empty", "ms": ms, "count": len(results)}
+        except QuotaRefused as e:
+            print(f"[music] Federated search: {name} skipped: {e}")
+            timings[name] = {"status": "quota", "ms": None, "count": 0}
         except Exception as e:
-            print(f"[music] JioSaavn search error: {e}")
+            print(f"[music] Federated search: {name} failed: {e}")
+            timings[name] = {"status": "error", "ms": None, "count": 0}
+    for future in pending:
+        timings[futures[future]] = {"status": "timeout", "ms": round(deadline * 1000), "count": 0}
+
+    fused = {}
+    for name in FEDERATED_SOURCE_PREFERENCE:
+        for rank, item in enumerate(ranked_lists.get(name, []), 1):
+            key = _federation_key(item)
+            entry = fused.get(key)
+            if entry is None:
+                entry = fused[key] = {"item": dict(item, sources=[]), "score": 0.0}
+            if name not in entry["item"]["sources"]:
+                entry["item"]["sources"].append(name)
+            entry["score"] += 1.0 / (RRF_K + rank)
+
+    merged = sorted(fused.values(), key=lambda e: -e["score"])
+    return [e["item"] for e in merged[:limit]], timings
+
+def _search_and_cache(cache_key, query, source_param, type_param, limit):
+    """Mongo tier, then upstream; fills both tiers. Returns (payload, from_cache)."""
+    db = get_db()
+    now = datetime.now(timezone.utc)
+    cached_doc = db.search_cache.find_one({"key": cache_key, "expiresAt": {"$gt": now}})
+    if cached_doc:
+        payload = {"results": cached_doc["results"], "source": cached_doc["source"]}
+        if cached_doc.get("timings"):
+            payload["timings"] = cached_doc["timings"]
+        expires_at = cached_doc["expiresAt"]
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        _search_lru.set(cache_key, payload, (expires_at - now).total_seconds())
+        return payload, True
+
+    if source_param == "federated":
+        results, timings = _federated_search(query, type_param, limit)
+        actual_source = "federated"
+        payload = {"results": results, "source": actual_source, "timings": timings}
+        # A partial answer is only cached briefly so the missing source gets another chance
+        complete = all(t["status"] in ("ok", "empty", "disabled") for t in timings.values())
+        ttl = SEARCH_CACHE_TTL_SECONDS if results and complete else SEARCH_NEGATIVE_TTL_SECONDS
+    else:
+        results, actual_source = _search_upstream(query, source_param, type_param, limit)
+        payload = {"results": results, "source": actual_source}
+        ttl = SEARCH_CACHE_TTL_SECONDS if results else SEARCH_NEGATIVE_TTL_SECONDS
 
     # Write cache
     try:
@@ -672,26 +933,137 @@ def search_tracks():
                     "key": cache_key,
                     "results": results,
                     "source": actual_source,
-                    "createdAt": datetime.now(timezone.utc)
+                    "timings": payload.get("timings"),
+                    "createdAt": now,
+                    "expiresAt": now + timedelta(seconds=ttl)
                 }
             },
             upsert=True
         )
     except Exception as e:
         print(f"[music] Cache write error: {e}")
+    _search_lru.set(cache_key, payload, ttl)
+    return payload, False
 
-    return jsonify({
-        "results": results,
-        "source": actual_source,
-        "cached": False
-    }), 200
 
+@bp.route("/search", methods=["GET"])
+def search_tracks():
+    """
+    Search endpoint that serves JioSaavn or YouTube results, normalized and cached.
+    GET /api/music/search?q=<query>&limit=20&source=<saavn|youtube|federated>&type=<all|tracks|albums|playlists|artists>
+
+    source=federated queries every source concurrently under a deadline and fuses the
+    rankings; the response adds per-source `timings`.
+    """
+    query = request.args.get("q", "").strip()
+    source_param = request.args.get("source", "saavn").strip().lower()
+    type_param = request.args.get("type", "all").strip().lower()
+    limit = min(int(request.args.get("limit", 20)), 30)
+
+    if not query:
+        return jsonify({"results": [], "source": "none"}), 200
+
+    cache_key = f"{query.lower().strip()}:{source_param}:{type_param}"
+    payload = _search_lru.get(cache_key)
+    if payload is not None:
+        return jsonify({**payload, "cached": True}), 200
+
+    # Identical in-flight queries share one Mongo lookup / upstream call
+    try:
+        (payload, from_cache), _ = _search_flight.do(
+            cache_key, _search_and_cache, cache_key, query, source_param, type_param, limit
+        )
+    except Exception as e:
+        # The leader's failure reaches every coalesced caller; answer empty and hold that
+        # briefly so the waiters (and the next burst) don't all go back upstream
+        print(f"[music] Search error for '{query}': {e}")
+        payload, from_cache = {"results": [], "source": source_param}, False
+        _search_lru.set(cache_key, payload, SEARCH_NEGATIVE_TTL_SECONDS)
+    return jsonify({**payload, "cached": from_cache}), 200
+
+
+
+# Resolved CDN URLs are cached per (song_id, quality) for a bit less than the
+# ~15 min JioSaavn CDN TTL, so replays and skip-backs are a local lookup.
+STREAM_CDN_TTL_SECONDS = 900
+STREAM_URL_TTL_SECONDS = int(os.getenv("STREAM_URL_TTL_SECONDS", "780"))
+STREAM_PREFETCH_MAX = 10
+STREAM_QUALITIES = ["320kbps", "160kbps", "128kbps", "96kbps", "48kbps", "12kbps"]
+_stream_cache = LRUCache(max_entries=int(os.getenv("STREAM_CACHE_ENTRIES", "5000")), max_bytes=8 * 1024 * 1024)
+_stream_flight = SingleFlight()
+_stream_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="stream-prefetch")
+
+def _pick_stream_url(download_urls, quality):
+    """(url, quality) for the requested quality, falling back down the list."""
+    quality_order = [quality, "160kbps", "128kbps", "96kbps", "48kbps"]
+    for q in quality_order:
+        match = next((d for d in download_urls if d.get("quality") == q), None)
+        if match:
+            return match.get("url", ""), q
+    if download_urls:
+        last = download_urls[-1]
+        return last.get("url", ""), last.get("quality", "unknown")
+    return "", ""
+
+def _fetch_stream_urls(song_id):
+    """Fetch a song's download URLs and cache the resolution for every quality. Returns (download_urls, error, status)."""
+    r = saavn_get(f"/songs/{song_id}", timeout=10)
+    if not r.ok:
+        return None, f"JioSaavn API error: {r.status_code}", 502
+
+    data = r.json()
+    # saavn.dev wraps in { data: [...] } or { data: {} }
+    song_data = data.get("data")
+    if isinstance(song_data, list):
+        song_data = song_data[0] if song_data else {}
+    elif not isinstance(song_data, dict):
+        song_data = {}
+
+    download_urls = song_data.get("downloadUrl", [])
+    if not download_urls:
+        return None, "No stream URLs available for this track", 404
+
+    resolved_at = time.time()
+    for q in STREAM_QUALITIES:
+        url, chosen = _pick_stream_url(download_urls, q)
+        if url:
+            _stream_cache.set((song_id, q), {"stream_url": url, "quality": chosen, "resolvedAt": resolved_at}, STREAM_URL_TTL_SECONDS)
+    return download_urls, None, None
+
+def _resolve_stream(song_id, quality):
+    """Cached stream URL for (song_id, quality). Returns (entry, error, status, cached)."""
+    entry = _stream_cache.get((song_id, quality))
+    if entry:
+        return entry, None, None, True
+
+    # Concurrent plays/prefetches of the same song share one upstream call
+    (download_urls, error, status), _ = _stream_flight.do(song_id, _fetch_stream_urls, song_id)
+    if error:
+        return None, error, status, False
+    entry = _stream_cache.get((song_id, quality))
+    if not entry:
+        url, chosen = _pick_stream_url(download_urls, quality)
+        if not url:
+            return None, "Could not resolve stream URL", 404, False
+        entry = {"stream_url": url, "quality": chosen, "resolvedAt": time.time()}
+        _stream_cache.set((song_id, quality), entry, STREAM_URL_TTL_SECONDS)
+    return entry, None, None, False
+
+def _stream_payload(song_id, entry, cached):
+    return {
+        "stream_url": entry["stream_url"],
+        "quality": entry["quality"],
+        # Remaining lifetime of the CDN URL, not of our cache entry
+        "expires_in": max(int(STREAM_CDN_TTL_SECONDS - (time.time() - entry["resolvedAt"])), 0),
+        "song_id": song_id,
+        "cached": cached,
+    }
 
 
 @bp.route("/stream", methods=["GET"])
 def get_stream_url():
     """
-    Fetch a fresh CDN stream URL for a JioSaavn song.
+    Fetch a CDN stream URL for a JioSaavn song (cached for slightly less than the CDN TTL).
     GET /api/music/stream?id=<saavn_song_id>&quality=160kbps
     Returns: { stream_url, quality, expires_in }
     """
@@ -702,101 +1074,273 @@ def get_stream_url():
         return jsonify({"error": "id is required"}), 400
 
     try:
-        r = requests.get(f"{SAAVN_BASE}/songs/{song_id}", timeout=10)
-        if not r.ok:
-            return jsonify({"error": f"JioSaavn API error: {r.status_code}"}), 502
+        entry, error, status, cached = _resolve_stream(song_id, quality)
+        if error:
+            return jsonify({"error": error}), status
+        return jsonify(_stream_payload(song_id, entry, cached)), 200
 
-        data = r.json()
-        # saavn.dev wraps in { data: [...] } or { data: {} }
-        song_data = data.get("data")
-        if isinstance(song_data, list):
-            song_data = song_data[0] if song_data else {}
-        elif not isinstance(song_data, dict):
-            song_data = {}
-
-        download_urls = song_data.get("downloadUrl", [])
-        if not download_urls:
-            return jsonify({"error": "No stream URLs available for this track"}), 404
-
-        # Find requested quality, fall back down the list
-        quality_order = [quality, "160kbps", "128kbps", "96kbps", "48kbps"]
-        stream_url = ""
-        chosen_quality = ""
-        for q in quality_order:
-            match = next((d for d in download_urls if d.get("quality") == q), None)
-            if match:
-                stream_url = match.get("url", "")
-                chosen_quality = q
-                break
+    except Exception as e:
+        print(f"[music] /stream error: {e}")
+        return jsonify({"error": str(e)}), 500
 
-        if not stream_url and download_urls:
-            last = download_urls[-1]
-            stream_url = last.get("url", "")
-            chosen_quality = last.get("quality", "unknown")
 
-        if not stream_url:
-            return jsonify({"error": "Could not resolve stream URL"}), 404
+@bp.route("/stream/prefetch", methods=["POST"])
+def prefetch_stream_urls():
+    """
+    Resolve stream URLs for the next tracks in the queue concurrently and warm the cache.
+    POST /api/music/stream/prefetch  { "ids": ["<saavn_song_id>", ...], "quality": "160kbps" }
+    Returns: { results: { <id>: { stream_url, quality, expires_in } | { error } } }
+    """
+    body = request.get_json(silent=True) or {}
+    ids = [str(i).strip() for i in (body.get("ids") or []) if str(i).strip()]
+    quality = body.get("quality", "160kbps")
+    if not ids:
+        return jsonify({"error": "ids is required"}), 400
+    ids = list(dict.fromkeys(ids))[:STREAM_PREFETCH_MAX]
+
+    def resolve(song_id):
+        try:
+            entry, error, _, cached = _resolve_stream(song_id, quality)
+            if error:
+                return song_id, {"error": error}
+            return song_id, _stream_payload(song_id, entry, cached)
+        except Exception as e:
+            return song_id, {"error": str(e)}
+
+    results = dict(_stream_executor.map(resolve, ids))
+    return jsonify({"results": results}), 200
+
 
-        return jsonify({
-            "stream_url": stream_url,
-            "quality": chosen_quality,
-            "expires_in": 900,  # ~15 minutes typical JioSaavn CDN TTL
-            "song_id": song_id,
-        }), 200
+# Track metadata store: normalized tracks keyed by our prefixed id (saavn_, yt_, apple_).
+# Stream URLs are left out since they expire; /stream resolves those.
+TRACK_METADATA_TTL = timedelta(days=int(os.getenv("TRACK_METADATA_TTL_DAYS", "30")))
+TRACKS_BATCH_MAX = 100
+SAAVN_IDS_PER_REQUEST = 20
+YT_IDS_PER_REQUEST = 50
+ITUNES_IDS_PER_REQUEST = 100
+_tracks_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="track-metadata")
 
+def ensure_track_indexes():
+    try:
+        get_db().track_metadata.create_index("expiresAt", expireAfterSeconds=0)
     except Exception as e:
-        print(f"[music] /stream error: {e}")
-        return jsonify({"error": str(e)}), 500
+        print(f"[music] Error creating track metadata indexes: {e}")
+
+def _split_track_id(track_id):
+    """("saavn"|"youtube"|"apple", raw id); unprefixed ids are JioSaavn ids."""
+    if track_id.startswith("yt_"):
+        return "youtube", track_id[3:]
+    if track_id.startswith("apple_"):
+        return "apple", track_id[6:]
+    if track_id.startswith("saavn_"):
+        return "saavn", track_id[6:]
+    return "saavn", track_id
+
+def _chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def _iso8601_duration_secs(value):
+    match = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", value or "")
+    if not match:
+        return 0
+    hours, mins, secs = (int(g or 0) for g in match.groups())
+    return hours * 3600 + mins * 60 + secs
+
+def _fetch_saavn_tracks(raw_ids):
+    r = saavn_get("/songs", params={"ids": ",".join(raw_ids)}, timeout=10)
+    if not r.ok:
+        raise RuntimeError(f"JioSaavn API error: {r.status_code}")
+    songs = r.json().get("data") or []
+    if isinstance(songs, dict):
+        songs = [songs]
+    return [_normalize_saavn_song(song) for song in songs]
+
+def _fetch_youtube_tracks(raw_ids):
+    if not YT_API_KEY or not youtube_quota.try_spend("videos.list", user_facing=True):
+        return []
+    r = http_get("https://www.googleapis.com/youtube/v3/videos", params={
+        "part": "snippet,contentDetails",
+        "id": ",".join(raw_ids),
+        "key": YT_API_KEY,
+        "maxResults": YT_IDS_PER_REQUEST,
+    }, timeout=10)
+    if not r.ok:
+        if is_quota_error(r):
+            youtube_quota.record_exhausted()
+        raise RuntimeError(f"YouTube API error: {r.status_code}")
+    tracks = []
+    for item in r.json().get("items", []):
+        snippet = item.get("snippet", {})
+        thumbs = snippet.get("thumbnails", {})
+        channel_title = snippet.get("channelTitle", "")
+        dur_secs = _iso8601_duration_secs(item.get("contentDetails", {}).get("duration"))
+        tracks.append({
+            "id": f"yt_{item['id']}",
+            "rawId": item["id"],
+            "videoId": item["id"],
+            "type": "track",
+            "title": snippet.get("title", ""),
+            "artist": channel_title.replace(" - Topic", ""),
+            "subtitle": channel_title.replace(" - Topic", ""),
+            "cover": (thumbs.get("high") or thumbs.get("medium") or thumbs.get("default") or {}).get("url", ""),
+            "duration": f"{dur_secs // 60}:{dur_secs % 60:02d}",
+            "duration_secs": dur_secs,
+            "source": "youtube",
+        })
+    return tracks
+
+def _fetch_apple_tracks(raw_ids):
+    r = cached_get("https://itunes.apple.com/lookup", params={"id": ",".join(raw_ids)}, timeout=8)
+    if not r.ok:
+        raise RuntimeError(f"iTunes lookup error: {r.status_code}")
+    tracks = []
+    for item in r.json().get("results", []):
+        if item.get("wrapperType") not in (None, "track"):
+            continue
+        dur_secs = (item.get("trackTimeMillis") or 0) // 1000
+        # Same shape as unmatched Apple chart entries
+        tracks.append({
+            "id": f"apple_{item.get('trackId')}",
+            "saavn_id": None,
+            "title": item.get("trackName", ""),
+            "artist": item.get("artistName", ""),
+            "cover": (item.get("artworkUrl100") or "").replace("100x100bb.jpg", "500x500bb.jpg"),
+            "album": item.get("collectionName", ""),
+            "duration": f"{dur_secs // 60}:{dur_secs % 60:02d}",
+            "duration_secs": dur_secs,
+            "source": "saavn",
+            "playable": False,
+        })
+    return tracks
+
+TRACK_FETCHERS = {
+    "saavn": (_fetch_saavn_tracks, SAAVN_IDS_PER_REQUEST),
+    "youtube": (_fetch_youtube_tracks, YT_IDS_PER_REQUEST),
+    "apple": (_fetch_apple_tracks, ITUNES_IDS_PER_REQUEST),
+}
+
+def get_tracks_metadata(track_ids):
+    """
+    {track_id: track} for the given mixed-source ids. Known tracks come from the
+    `track_metadata` store; the rest are fetched concurrently with multi-id upstream
+    requests and written back.
+    """
+    db = get_db()
+    now = datetime.now(timezone.utc)
+    found = {}
+    for doc in db.track_metadata.find({"_id": {"$in": track_ids}, "expiresAt": {"$gt": now}}):
+        found[doc["_id"]] = doc["track"]
+
+    unknown = {}
+    for track_id in track_ids:
+        if track_id not in found:
+            source, raw_id = _split_track_id(track_id)
+            unknown.setdefault(source, []).append(raw_id)
+    if not unknown:
+        return found
+
+    futures = []
+    for source, raw_ids in unknown.items():
+        fetch, per_request = TRACK_FETCHERS[source]
+        for chunk in _chunks(raw_ids, per_request):
+            futures.append((source, _tracks_executor.submit(fetch, chunk)))
+
+    fetched = []
+    for source, future in futures:
+        try:
+            fetched.extend(future.result())
+        except Exception as e:
+            print(f"[music] Track metadata fetch from {source} failed: {e}")
+
+    ops = []
+    for track in fetched:
+        track = dict(track, stream_url="") if "stream_url" in track else track
+        ops.append(UpdateOne(
+            {"_id": track["id"]},
+            {"$set": {"track": track, "fetchedAt": now, "expiresAt": now + TRACK_METADATA_TTL}},
+            upsert=True
+        ))
+        found[track["id"]] = track
+    if ops:
+        try:
+            db.track_metadata.bulk_write(ops, ordered=False)
+        except Exception as e:
+            print(f"[music] Track metadata store write failed: {e}")
+
+    # Unprefixed Saavn ids in the request map to their saavn_ entries
+    for track_id in track_ids:
+        source, raw_id = _split_track_id(track_id)
+        if track_id not in found and source == "saavn" and f"saavn_{raw_id}" in found:
+            found[track_id] = found[f"saavn_{raw_id}"]
+    return found
+
+
+@bp.route("/tracks", methods=["GET"])
+def get_tracks():
+    """
+    Batch track metadata for mixed-source ids.
+    GET /api/music/tracks?ids=saavn_<id>,yt_<videoId>,apple_<trackId>,...
+    Returns: { tracks: [...in request order], missing: [...] }; 400 if ids is missing
+    """
+    ids = [i.strip() for i in request.args.get("ids", "").split(",") if i.strip()]
+    ids = list(dict.fromkeys(ids))
+    if len(ids) > TRACKS_BATCH_MAX:
+        return jsonify({"error": f"at most {TRACKS_BATCH_MAX} ids per request"}), 400
+    if not ids:
+        # Callers (e.g. the app's initial load) rely on a non-2xx here, as before this endpoint existed
+        return jsonify({"error": "ids is required"}), 400
+
+    found = get_tracks_metadata(ids)
+    return jsonify({
+        "tracks": [found[i] for i in ids if i in found],
+        "missing": [i for i in ids if i not in found]
+    }), 200
 
 
 @bp.route("/tracks/<track_id>", methods=["GET"])
 def get_track(track_id):
-    """Get a single track's metadata from JioSaavn by ID."""
+    """Get a single track's metadata by ID (JioSaavn by default; yt_/apple_ prefixes supported)."""
     try:
-        r = requests.get(f"{SAAVN_BASE}/songs/{track_id}", timeout=10)
-        if not r.ok:
+        track = get_tracks_metadata([track_id]).get(track_id)
+        if not track:
             return jsonify({"error": "Track not found"}), 404
-        data = r.json()
-        song_data = data.get("data")
-        if isinstance(song_data, list):
-            song_data = song_data[0] if song_data else None
-        if not song_data:
-            return jsonify({"error": "Track not found"}), 404
-        return jsonify(_normalize_saavn_song(song_data)), 200
+        return jsonify(track), 200
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@bp.route("/featured", methods=["GET"])
-def get_featured():
-    """Returns multiple themed sections for the Home page."""
-    sections = []
+def validate_featured_sections(data):
+    sections = data.get("sections") if isinstance(data, dict) else None
+    if not isinstance(sections, list):
+        raise ValueError("expected an object with a 'sections' list")
+    ids = set()
+    for section in sections:
+        if not section.get("id") or not section.get("title") or not section.get("query"):
+            raise ValueError(f"section {section!r} needs id, title and query")
+        if section["id"] in ids:
+            raise ValueError(f"duplicate section id '{section['id']}'")
+        ids.add(section["id"])
 
-    queries = [
-        ("Trending Bollywood", "bollywood trending 2024"),
-        ("Punjabi Hits", "punjabi hits diljit karan aujla"),
-        ("Arijit Singh", "arijit singh romantic hits"),
-        ("90s Classics", "90s hindi classic songs"),
-    ]
+featured_config = ConfigRegistry(FEATURED_CONFIG_PATH, validate=validate_featured_sections)
+
+def _fetch_featured_section(section):
+    r = saavn_get("/search/songs", params={
+        "query": section["query"],
+        "limit": section.get("limit", 8) + 2,
+    }, timeout=8)
+    r.raise_for_status()
+    songs = (r.json().get("data") or {}).get("results", [])
+    return [_normalize_saavn_song(s) for s in songs[:section.get("limit", 8)]]
+
+# Sections are refreshed in the background every ttlSeconds and served from memory
+featured_feed = FeaturedFeed(_fetch_featured_section, featured_config.snapshot, get_db)
 
-    for label, query in queries:
-        try:
-            r = requests.get(f"{SAAVN_BASE}/search/songs", params={
-                "query": query,
-                "limit": 10,
-            }, timeout=8)
-            if r.ok:
-                data = r.json()
-                songs = (data.get("data") or {}).get("results", [])
-                if songs:
-                    sections.append({
-                        "title": label,
-                        "tracks": [_normalize_saavn_song(s) for s in songs[:8]],
-                    })
-        except Exception as e:
-            print(f"[music] featured section '{label}' error: {e}")
 
-    return jsonify({"sections": sections}), 200
+@bp.route("/featured", methods=["GET"])
+def get_featured():
+    """Returns multiple themed sections for the Home page (config/featured_sections.json)."""
+    # Only a cold start with nothing persisted waits, and only briefly, for the first refresh
+    return jsonify({"sections": featured_feed.sections(wait_seconds=3.0)}), 200
 
 
 @bp.route("/charts", methods=["GET"])
@@ -808,16 +1352,7 @@ def get_charts():
     force_refresh = request.args.get("refresh", "false").lower() == "true"
     
     if overview:
-        active_langs = []
-        if os.path.exists(CONFIG_PATH):
-            try:
-                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-                    for lang, val in cfg.items():
-                        if val:
-                            active_langs.append(lang)
-            except Exception:
-                pass
+        active_langs = [lang for lang, val in language_charts.snapshot().items() if val]
         
         charts_to_load = [
             {"type": "worldwide", "language": None, "title": "Worldwide Hot 50", "desc": "Global music trends aggregated daily", "ratio": "16:9"},
@@ -865,8 +1400,8 @@ def get_charts():
                     continue
             
             if cached and cached.get("tracks"):
-                fresh_hours = 24 if c_type in ("worldwide", "asia") else 6
-                if not is_cache_fresh(cached, fresh_hours) and not force_refresh:
+                # The scheduler refreshes charts before they expire; only fall back to it here when it isn't running
+                if not chart_scheduler.running and not is_cache_fresh(cached, CHART_FRESH_HOURS[c_type]) and not force_refresh:
                     update_chart_in_background(c_type, c_lang)
                     
                 first_track = cached["tracks"][0]
@@ -900,36 +1435,24 @@ def get_charts():
         else:
             chart_type = region
 
-    if chart_type not in ("worldwide", "asia", "india", "language"):
+    if chart_type not in ("worldwide", "india", "language") and chart_type not in REGIONAL_CHARTS:
         return jsonify({"error": "Invalid chart type"}), 400
 
     if chart_type == "language":
         if not language:
             return jsonify({"error": "language parameter is required for type=language"}), 400
-        if os.path.exists(CONFIG_PATH):
-            try:
-                with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                    cfg = json.load(f)
-                    if not cfg.get(language):
-                        return jsonify({"tracks": [], "message": f"Language '{language}' has no configured chart"}), 200
-            except Exception:
-                return jsonify({"error": "Failed to read config"}), 500
-        else:
+        if not language_charts.available:
             return jsonify({"tracks": [], "message": "No charts config available"}), 200
+        if not language_charts.get(language):
+            return jsonify({"tracks": [], "message": f"Language '{language}' has no configured chart"}), 200
 
     cached = get_cached_chart(chart_type, language)
-    fresh_hours = 24 if chart_type in ("worldwide", "asia") else 6
 
-    if cached and not force_refresh:
-        if not is_cache_fresh(cached, fresh_hours):
-            update_chart_in_background(chart_type, language)
+    # Never fetch upstream on the request path: queue a refresh and serve what we have
+    if force_refresh or not cached or (not chart_scheduler.running and not is_cache_fresh(cached, CHART_FRESH_HOURS.get(chart_type, 24))):
+        update_chart_in_background(chart_type, language)
+    if cached:
         return jsonify({"tracks": cached.get("tracks", []), "source": cached.get("source", "jiosaavn")}), 200
-    else:
-        print(f"[music] No cache found or force refresh requested for {chart_type} (lang={language}). Performing synchronous fetch...")
-        perform_chart_update(chart_type, language)
-        cached = get_cached_chart(chart_type, language)
-        if cached:
-            return jsonify({"tracks": cached.get("tracks", []), "source": cached.get("source", "jiosaavn")}), 200
-        else:
-            return jsonify({"tracks": [], "error": "Failed to fetch chart data"}), 500
+    print(f"[music] No cache yet for {chart_type} (lang={language}); refresh queued.")
+    return jsonify({"tracks": [], "pending": True, "message": "Chart is being prepared, try again shortly"}), 200
 
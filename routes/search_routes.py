@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
-import requests
+from utils.http_client import http_get
 from api.config import APIConfig
+from utils.youtube_quota import youtube_quota, is_quota_error
 
 search_bp = Blueprint("search_bp", __name__)
 
@@ -12,12 +13,17 @@ def search():
 
     # ----- YOUTUBE FALLBACK -----
     api_key = APIConfig.YOUTUBE_API_KEY
+    if not api_key or not youtube_quota.try_spend("search", user_facing=True):
+        return jsonify([])
     yt_url = (
         "https://www.googleapis.com/youtube/v3/search"
         f"?part=snippet&type=video&q={query}&key={api_key}"
     )
 
-    r = requests.get(yt_url).json()
+    resp = http_get(yt_url)
+    if is_quota_error(resp):
+        youtube_quota.record_exhausted()
+    r = resp.json()
     
     results = []
     for item in r.get("items", []):
@@ -0,0 +1,111 @@
+"""
+Offline throughput benchmark for the upstream-heavy paths.
+
+Runs artist aggregation (ThreadWorker.process), chart refresh (perform_chart_update)
+and music search against recorded upstream fixtures served by the local replay
+server (utils/upstream_replay.py), so results are reproducible without network.
+Uses an in-memory Mongo (mongomock) and a throwaway HTTP cache per run.
+
+Record fixtures once (needs network):
+    python -m scripts.benchmark_upstreams --mode record
+
+Then benchmark offline:
+    python -m scripts.benchmark_upstreams --latency-ms recorded --failure-rate 0.05 --seed 7
+    python -m scripts.benchmark_upstreams --only aggregate --artists taylor-swift,coldplay
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+try:
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.append(project_root)
+except Exception:
+    pass
+
+DEFAULT_ARTISTS = ["taylor-swift", "coldplay", "arijit-singh"]
+DEFAULT_CHARTS = [("worldwide", None), ("asia", None), ("india", None)]
+DEFAULT_QUERIES = ["arijit singh", "blinding lights", "coldplay yellow"]
+
+
+def _timed(label, fn, results):
+    started = time.perf_counter()
+    ok = True
+    try:
+        fn()
+    except Exception as e:
+        ok = False
+        print(f"[BENCH] {label} failed: {e}")
+    elapsed = time.perf_counter() - started
+    results.append((label, elapsed, ok))
+    print(f"[BENCH] {label}: {elapsed:.2f}s{'' if ok else ' (failed)'}")
+
+
+def run(args):
+    # Isolated environment: in-memory Mongo, empty HTTP cache, real adapters
+    os.environ.pop("MOCK_MODE", None)
+    # Chart refreshes are timed explicitly below, not from the background scheduler
+    os.environ["CHART_SCHEDULER_ENABLED"] = "0"
+    os.environ["HTTP_CACHE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="bench_http_cache_"), "http_cache.db")
+    import mongomock
+    import pymongo
+    pymongo.MongoClient = mongomock.MongoClient
+
+    from utils.upstream_replay import install, replay_stats
+    options = {}
+    if args.mode == "replay":
+        options = {
+            "latency_ms": args.latency_ms if args.latency_ms == "recorded" else float(args.latency_ms),
+            "latency_scale": args.latency_scale,
+            "jitter_ms": args.jitter_ms,
+            "failure_rate": args.failure_rate,
+            "failure_hosts": [h for h in (args.failure_hosts or "").split(",") if h],
+            "seed": args.seed
+        }
+    install(args.mode, fixtures_dir=args.fixtures_dir, **options)
+
+    from app import create_app
+    from utils.artist_aggregator import ThreadWorker
+    from routes.music import perform_chart_update
+
+    app = create_app()
+    client = app.test_client()
+    results = []
+
+    if args.only in (None, "aggregate"):
+        worker = ThreadWorker()
+        for artist_id in args.artists.split(","):
+            _timed(f"aggregate {artist_id}", lambda: asyncio.run(worker.process(artist_id)), results)
+
+    if args.only in (None, "charts"):
+        for chart_type, language in DEFAULT_CHARTS:
+            _timed(f"chart {chart_type}", lambda: perform_chart_update(chart_type, language), results)
+
+    if args.only in (None, "search"):
+        for query in DEFAULT_QUERIES:
+            _timed(f"search '{query}'", lambda: client.get("/api/music/search", query_string={"q": query}), results)
+
+    total = sum(elapsed for _, elapsed, _ in results)
+    print("\n[BENCH] Summary")
+    for label, elapsed, ok in results:
+        print(f"  {label:<32} {elapsed:7.2f}s {'ok' if ok else 'FAILED'}")
+    print(f"  {'total':<32} {total:7.2f}s")
+    print(f"[BENCH] Transport: {replay_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark aggregation, chart refresh and search against recorded upstreams.")
+    parser.add_argument("--mode", choices=["replay", "record"], default="replay")
+    parser.add_argument("--fixtures-dir", default=None, help="Fixture directory (default: UPSTREAM_FIXTURES_DIR or database/upstream_fixtures)")
+    parser.add_argument("--only", choices=["aggregate", "charts", "search"], default=None)
+    parser.add_argument("--artists", default=",".join(DEFAULT_ARTISTS), help="Comma-separated artist ids to aggregate")
+    parser.add_argument("--latency-ms", default="recorded", help="'recorded' or a fixed per-request latency")
+    parser.add_argument("--latency-scale", type=float, default=1.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-hosts", default="", help="Comma-separated hosts to inject failures into")
+    parser.add_argument("--seed", default="0")
+    run(parser.parse_args())
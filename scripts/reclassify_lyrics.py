@@ -0,0 +1,202 @@
+"""
+Batch emotion re-classification for the db.lyrics corpus.
+
+Re-runs the EMOTION_KEYWORDS classifier over every stored lyric without going
+back through the network aggregation pipeline. Lyrics are streamed in _id-ordered
+chunks, scored across a process pool and written back with bulk updates. Progress
+is checkpointed in `maintenance_jobs`, so an interrupted run resumes where it
+stopped. DNA profiles are scored from lyric text with the same keywords, so every
+artist with a lyric in a processed chunk is recorded (one doc each in
+`maintenance_pending_artists`) and their profiles are rebuilt once the corpus is done.
+
+Usage (from the project root):
+    python -m scripts.reclassify_lyrics --workers 4 --chunk-size 500
+    python -m scripts.reclassify_lyrics --restart      # ignore the saved checkpoint
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from multiprocessing import Pool
+
+try:
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.append(project_root)
+except Exception:
+    pass
+
+from pymongo import UpdateOne
+from models.artist import ArtistModel
+from utils.artist_aggregator import score_emotions, pick_emotion, DNAEnrichmentAdapter
+
+JOB_NAME = "reclassify_lyrics"
+PENDING_COLLECTION = "maintenance_pending_artists"
+
+
+def _score_item(item):
+    """Pool task: (lyricId, plainText) -> (lyricId, keyword scores or None)."""
+    lyric_id, text = item
+    if not text:
+        return lyric_id, None
+    return lyric_id, score_emotions(text)
+
+
+def load_checkpoint(db, restart=False):
+    if restart:
+        db.maintenance_jobs.delete_one({"job": JOB_NAME})
+        db[PENDING_COLLECTION].delete_many({"job": JOB_NAME})
+    checkpoint = db.maintenance_jobs.find_one({"job": JOB_NAME})
+    if checkpoint and checkpoint.get("status") == "running":
+        print(f"[RECLASSIFY] Resuming from checkpoint: {checkpoint.get('processed', 0)} lyrics already processed.")
+        return checkpoint
+
+    now = datetime.now(timezone.utc)
+    checkpoint = {
+        "job": JOB_NAME,
+        "status": "running",
+        "lastId": None,
+        "processed": 0,
+        "changed": 0,
+        "startedAt": now,
+        "updatedAt": now
+    }
+    db.maintenance_jobs.update_one({"job": JOB_NAME}, {"$set": checkpoint}, upsert=True)
+    return checkpoint
+
+
+def load_emotion_counters(db):
+    """Current per-emotion lyric counts, used to enforce the 40% corpus cap."""
+    counts = {}
+    for row in db.lyrics.aggregate([{"$group": {"_id": "$emotion", "n": {"$sum": 1}}}]):
+        counts[row["_id"]] = row["n"]
+    return counts
+
+
+def refresh_dna_profiles(db, artist_ids):
+    dna_enricher = DNAEnrichmentAdapter()
+    for artist_id in artist_ids:
+        songs = list(db.songs.find({"artistId": artist_id}))
+        lyrics = list(db.lyrics.find({"artistId": artist_id}))
+        if not lyrics:
+            continue
+        dna_profile = dna_enricher.compute_dna_profile(songs, lyrics)
+        db.artist_analytics.update_one(
+            {"artistId": artist_id},
+            {
+                "$set": {
+                    "dna": dna_profile,
+                    "essence": f"{dna_profile['topThemes'][0].title()} storyteller with unique BPM DNA profile."
+                }
+            },
+            upsert=True
+        )
+
+
+def reclassify(workers=None, chunk_size=500, restart=False):
+    db = ArtistModel.get_db()
+    checkpoint = load_checkpoint(db, restart=restart)
+    last_id = checkpoint.get("lastId")
+    processed = checkpoint.get("processed", 0)
+    changed = checkpoint.get("changed", 0)
+
+    counters = load_emotion_counters(db)
+    corpus_total = sum(counters.values())
+    total_remaining = db.lyrics.count_documents({"_id": {"$gt": last_id}} if last_id else {})
+    print(f"[RECLASSIFY] {total_remaining} lyrics to classify (corpus size {corpus_total}).")
+
+    projection = {"lyricId": 1, "artistId": 1, "plainText": 1, "emotion": 1}
+    started = time.perf_counter()
+    run_processed = 0
+
+    with Pool(processes=workers) as pool:
+        while True:
+            query = {"_id": {"$gt": last_id}} if last_id else {}
+            chunk = list(db.lyrics.find(query, projection).sort("_id", 1).limit(chunk_size))
+            if not chunk:
+                break
+
+            chunk_started = time.perf_counter()
+            items = [(doc["lyricId"], doc.get("plainText", "")) for doc in chunk]
+            pool_chunksize = max(1, len(items) // ((workers or os.cpu_count() or 1) * 4))
+            scored = dict(pool.imap(_score_item, items, chunksize=pool_chunksize))
+
+            ops = []
+            touched_artists = set()
+            for doc in chunk:
+                scores = scored.get(doc["lyricId"])
+                old_emotion = doc.get("emotion")
+                if old_emotion in counters:
+                    counters[old_emotion] -= 1
+
+                if scores is None:
+                    emotion, confidence = "melancholy", 0.5
+                else:
+                    emotion, confidence = pick_emotion(scores, counters, corpus_total)
+                counters[emotion] = counters.get(emotion, 0) + 1
+
+                # DNA is recomputed from the text, so the artist is touched even if the label didn't flip
+                touched_artists.add(doc.get("artistId"))
+                if emotion != old_emotion:
+                    changed += 1
+                ops.append(UpdateOne(
+                    {"_id": doc["_id"]},
+                    {"$set": {"emotion": emotion, "emotionScore": confidence}}
+                ))
+
+            if ops:
+                db.lyrics.bulk_write(ops, ordered=False)
+
+            last_id = chunk[-1]["_id"]
+            processed += len(chunk)
+            run_processed += len(chunk)
+            update = {
+                "$set": {
+                    "lastId": last_id,
+                    "processed": processed,
+                    "changed": changed,
+                    "updatedAt": datetime.now(timezone.utc)
+                }
+            }
+            touched_artists.discard(None)
+            if touched_artists:
+                db[PENDING_COLLECTION].bulk_write([
+                    UpdateOne({"_id": f"{JOB_NAME}:{artist_id}"},
+                              {"$set": {"job": JOB_NAME, "artistId": artist_id}}, upsert=True)
+                    for artist_id in sorted(touched_artists)
+                ], ordered=False)
+            db.maintenance_jobs.update_one({"job": JOB_NAME}, update)
+
+            chunk_rate = len(chunk) / max(time.perf_counter() - chunk_started, 1e-6)
+            overall_rate = run_processed / max(time.perf_counter() - started, 1e-6)
+            print(f"[RECLASSIFY] {processed} processed, {changed} changed | chunk {chunk_rate:.0f}/s, overall {overall_rate:.0f}/s")
+
+    pending_artists = [d["artistId"] for d in db[PENDING_COLLECTION].find({"job": JOB_NAME}, {"artistId": 1})]
+    print(f"[RECLASSIFY] Refreshing DNA profiles for {len(pending_artists)} artists...")
+    refresh_dna_profiles(db, pending_artists)
+    db[PENDING_COLLECTION].delete_many({"job": JOB_NAME})
+
+    elapsed = time.perf_counter() - started
+    db.maintenance_jobs.update_one(
+        {"job": JOB_NAME},
+        {
+            "$set": {
+                "status": "complete",
+                "emotionCounters": counters,
+                "finishedAt": datetime.now(timezone.utc)
+            },
+            "$unset": {"pendingArtists": ""}
+        }
+    )
+    print(f"[RECLASSIFY] Done: {run_processed} lyrics in {elapsed:.1f}s ({run_processed / max(elapsed, 1e-6):.0f}/s), {changed} changed.")
+    print(f"[RECLASSIFY] Emotion counters: {counters}")
+    return {"processed": processed, "changed": changed, "emotionCounters": counters}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Re-run emotion classification over the stored lyrics corpus.")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Lyrics fetched and written per batch")
+    parser.add_argument("--restart", action="store_true", help="Discard any saved checkpoint and start over")
+    args = parser.parse_args()
+    reclassify(workers=args.workers, chunk_size=args.chunk_size, restart=args.restart)
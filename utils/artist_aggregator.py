@@ -3,11 +3,18 @@ import os
 import re
 import time
 import threading
-import requests
 import asyncio
+import hashlib
+import json
+import weakref
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone, timedelta
 from models.artist import ArtistModel
+from utils.artist_registry import SEED_ARTISTS_METADATA, artist_registry
+from utils.http_cache import cached_get, NetworkBlocked
+from utils.circuit_breaker import get_breaker
+from utils.source_metrics import SourceMetrics
+from utils.staleness_sweeper import StalenessSweeper
 
 # Canonical 8 emotions keyword weight map
 EMOTION_KEYWORDS = {
@@ -21,120 +28,6 @@ EMOTION_KEYWORDS = {
     "dark": ["moon", "shadow", "ghost", "death", "die", "cold", "night", "dark", "grave", "silent", "blood", "demon", "black", "midnight"]
 }
 
-# Mapping of 100+ real artists with MBIDs, categories, countries, and baseline genres
-SEED_ARTISTS_METADATA = [
-    # Global Pop & Rock (25)
-    {"name": "Taylor Swift", "id": "taylor-swift", "mbid": "b9534ade-a339-4c40-b66a-79f755bd04fa", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Country", "Indie Folk"], "active_start": 2004},
-    {"name": "Sabrina Carpenter", "id": "sabrina-carpenter", "mbid": "e4a7b596-f6c8-47c3-bbdf-5d7f6c6bbf8d", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "R&B"], "active_start": 2011},
-    {"name": "Ed Sheeran", "id": "ed-sheeran", "mbid": "b8a7c6a0-47d6-43f4-b2ce-b7b117cd35c1", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Pop", "Folk Pop"], "active_start": 2004},
-    {"name": "The Weeknd", "id": "the-weeknd", "mbid": "c8b143d7-234e-4ac9-ab9e-8c0af3f885e2", "category": "Global Pop & Rock", "country": "Canada", "genres": ["R&B", "Synthwave", "Pop"], "active_start": 2010},
-    {"name": "Billie Eilish", "id": "billie-eilish", "mbid": "c3c82bd7-d69a-467f-9b24-051396e27014", "category": "Global Pop & Rock", "country": "United States", "genres": ["Alternative", "Pop"], "active_start": 2015},
-    {"name": "Ariana Grande", "id": "ariana-grande", "mbid": "f77e8c7c-76fb-40c2-9b6b-1eb5a305f453", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "R&B"], "active_start": 2008},
-    {"name": "Harry Styles", "id": "harry-styles", "mbid": "e52045e3-ca5b-42c1-840b-49938830ba8c", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Pop Rock", "Indie Pop"], "active_start": 2010},
-    {"name": "Olivia Rodrigo", "id": "olivia-rodrigo", "mbid": "601ed8fb-1544-4740-b7c1-2f64d4c5c102", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Pop Punk"], "active_start": 2015},
-    {"name": "Dua Lipa", "id": "dua-lipa", "mbid": "0383dac1-ade8-4d51-a185-94f3e69479b9", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Pop", "Disco"], "active_start": 2014},
-    {"name": "Post Malone", "id": "post-malone", "mbid": "d14210d6-ff7d-41a4-b4a1-ca316e6d1b6a", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Hip-Hop", "Rock"], "active_start": 2011},
-    {"name": "Drake", "id": "drake", "mbid": "b70c3c5f-514e-4f55-a90a-ee4eb7db9139", "category": "Global Pop & Rock", "country": "Canada", "genres": ["Hip-Hop", "Rap", "R&B"], "active_start": 2001},
-    {"name": "Kendrick Lamar", "id": "kendrick-lamar", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Global Pop & Rock", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2003},
-    {"name": "Eminem", "id": "eminem", "mbid": "18dba729-995d-4ad9-8356-b92c1143f11f", "category": "Global Pop & Rock", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 1988},
-    {"name": "Coldplay", "id": "coldplay", "mbid": "cc197c18-b830-4240-9a9c-2847d041c4fc", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Alternative Rock", "Pop"], "active_start": 1996},
-    {"name": "Imagine Dragons", "id": "imagine-dragons", "mbid": "01215159-f73e-42c1-83d1-1053a85c6f8f", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop Rock", "Indie Rock"], "active_start": 2008},
-    {"name": "Arctic Monkeys", "id": "arctic-monkeys", "mbid": "ada4ade5-d9e9-4226-801e-223b2075633b", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Indie Rock", "Alternative Rock"], "active_start": 2002},
-    {"name": "Radiohead", "id": "radiohead", "mbid": "a74b1b7f-71a5-4011-9441-d0b5e412240a", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Alternative Rock", "Art Rock"], "active_start": 1985},
-    {"name": "The Beatles", "id": "the-beatles", "mbid": "b10bbcaa-14ae-424b-b321-b04e02ed7a40", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Rock", "Pop"], "active_start": 1960, "active_end": 1970},
-    {"name": "Queen", "id": "queen", "mbid": "5eecaf18-02ec-47c5-acef-b0f2235121ac", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Rock", "Hard Rock"], "active_start": 1970},
-    {"name": "Pink Floyd", "id": "pink-floyd", "mbid": "83d91898-7763-47d7-b03b-b92132375086", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Progressive Rock", "Psychedelic Rock"], "active_start": 1965, "active_end": 1994},
-    {"name": "David Bowie", "id": "david-bowie", "mbid": "5441c29d-3f4e-4ff9-b10b-b58aff4a096b", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Art Rock", "Glam Rock"], "active_start": 1962, "active_end": 2016},
-    {"name": "Bruno Mars", "id": "bruno-mars", "mbid": "af816c21-1771-4770-ae61-26ab293933c0", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Funk", "R&B"], "active_start": 2004},
-    {"name": "Lady Gaga", "id": "lady-gaga", "mbid": "650e7db6-b73f-4ce8-a08f-f74fa015c6be", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Dance"], "active_start": 2005},
-    {"name": "Beyonce", "id": "beyonce", "mbid": "859d90b4-6ba9-42a2-83fd-f16177e09714", "category": "Global Pop & Rock", "country": "United States", "genres": ["R&B", "Pop"], "active_start": 1997},
-    {"name": "Rihanna", "id": "rihanna", "mbid": "db3256f1-a48a-4ab2-9c14-77a8719008ae", "category": "Global Pop & Rock", "country": "Barbados", "genres": ["Pop", "R&B"], "active_start": 2003},
-    {"name": "Justin Bieber", "id": "justin-bieber", "mbid": "e01d330e-9859-4041-9eff-7ab97ab244a8", "category": "Global Pop & Rock", "country": "Canada", "genres": ["Pop", "R&B"], "active_start": 2007},
-
-    # Indian (Hindi/Bollywood & Indie) (25)
-    {"name": "Arijit Singh", "id": "arijit-singh", "mbid": "5a9e3f28-090c-43fc-bc74-6f5dfbe831e5", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Romantic", "Classical"], "active_start": 2007},
-    {"name": "Shreya Ghoshal", "id": "shreya-ghoshal", "mbid": "e9d6d5eb-7253-4318-971c-7729e847c1be", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Classical", "Romantic"], "active_start": 1998},
-    {"name": "Sonu Nigam", "id": "sonu-nigam", "mbid": "5f89ef7b-c322-4dc8-a89e-29f79ca4d88e", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Pop", "Romantic"], "active_start": 1990},
-    {"name": "Udit Narayan", "id": "udit-narayan", "mbid": "24b61ef9-813c-41c3-8857-79774640101b", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Romantic"], "active_start": 1980},
-    {"name": "Lata Mangeshkar", "id": "lata-mangeshkar", "mbid": "420138db-10fa-4001-9279-3c72b220d91d", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Classical", "Sufi"], "active_start": 1942, "active_end": 2022},
-    {"name": "Kishore Kumar", "id": "kishore-kumar", "mbid": "8ee3d317-a068-45be-bb37-a169992f0269", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Comedy", "Romantic"], "active_start": 1946, "active_end": 1987},
-    {"name": "Mohammed Rafi", "id": "mohammed-rafi", "mbid": "e9275cb7-2037-4d76-8809-5cf2ee510b0d", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Sufi", "Classical"], "active_start": 1941, "active_end": 1980},
-    {"name": "A.R. Rahman", "id": "a-r-rahman", "mbid": "656c0724-4f05-4ef5-a74e-6e7ef15c0e14", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Soundtrack", "Sufi", "Fusion"], "active_start": 1992},
-    {"name": "Vishal-Shekhar", "id": "vishal-shekhar", "mbid": "81ba82e5-e6a8-4221-a3f2-c9a490d164d1", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Dance"], "active_start": 1999},
-    {"name": "Pritam", "id": "pritam", "mbid": "ea4bfda3-2a3a-4467-93ae-c9d3000dfb4f", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Pop Rock"], "active_start": 2001},
-    {"name": "Shankar-Ehsaan-Loy", "id": "shankar-ehsaan-loy", "mbid": "687f872c-be99-4d2d-94c6-43b8c4c7c8c8", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Indie Rock"], "active_start": 1997},
-    {"name": "Diljit Dosanjh", "id": "diljit-dosanjh", "mbid": "505f9c5d-20c2-4a00-ab64-cae60eb11a96", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi", "Pop", "Folk"], "active_start": 2000},
-    {"name": "Badshah", "id": "badshah", "mbid": "de299c82-841c-4b92-9e2e-2e557b2f0a1c", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi", "Rap", "Bollywood"], "active_start": 2006},
-    {"name": "Honey Singh", "id": "honey-singh", "mbid": "482f3a6a-8bbe-4cc1-8281-e96aa4c29923", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi Pop", "Hip-Hop"], "active_start": 2005},
-    {"name": "Divine", "id": "divine", "mbid": "62061033-c350-4824-bebf-1d746571bebf", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Desi Hip Hop", "Rap"], "active_start": 2013},
-    {"name": "Nucleya", "id": "nucleya", "mbid": "c18d9f1c-7f51-4043-8557-cae61eb31a96", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bass", "EDM", "Fusion"], "active_start": 1998},
-    {"name": "Prateek Kuhad", "id": "prateek-kuhad", "mbid": "de99e5a1-7788-4fbb-a148-52467dbebf16", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Indie Folk", "Singer-Songwriter"], "active_start": 2011},
-    {"name": "Aastha Gill", "id": "aastha-gill", "mbid": "24b61ef9-813c-41c3-8857-79774640101b", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Dance Pop"], "active_start": 2014},
-    {"name": "Jubin Nautiyal", "id": "jubin-nautiyal", "mbid": "dc82bd7d-d69a-467f-9b24-051396e27014", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Romantic", "Sufi"], "active_start": 2011},
-    {"name": "B Praak", "id": "b-praak", "mbid": "8ee3d317-a068-45be-bb37-a169992f0269", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi", "Romantic", "Sad"], "active_start": 2012},
-    {"name": "Darshan Raval", "id": "darshan-raval", "mbid": "5a9e3f28-090c-43fc-bc74-6f5dfbe831e5", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Pop", "Romantic"], "active_start": 2014},
-    {"name": "Neha Kakkar", "id": "neha-kakkar", "mbid": "ea4bfda3-2a3a-4467-93ae-c9d3000dfb4f", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Dance Pop"], "active_start": 2006},
-    {"name": "Guru Randhawa", "id": "guru-randhawa", "mbid": "656c0724-4f05-4ef5-a74e-6e7ef15c0e14", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi Pop", "Bollywood"], "active_start": 2013},
-    {"name": "Raftaar", "id": "raftaar", "mbid": "de299c82-841c-4b92-9e2e-2e557b2f0a1c", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Desi Hip Hop", "Rap"], "active_start": 2008},
-    {"name": "Jasleen Royal", "id": "jasleen-royal", "mbid": "505f9c5d-20c2-4a00-ab64-cae60eb11a96", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Indie Pop", "Romantic"], "active_start": 2013},
-
-    # K-Pop (20)
-    {"name": "BTS", "id": "bts", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop", "Pop"], "active_start": 2013},
-    {"name": "BLACKPINK", "id": "blackpink", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2016},
-    {"name": "EXO", "id": "exo", "mbid": "7402b88b-df2c-4ae0-a292-23cbb382ba18", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "R&B"], "active_start": 2012},
-    {"name": "TWICE", "id": "twice", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Bubblegum Pop"], "active_start": 2015},
-    {"name": "Red Velvet", "id": "red-velvet", "mbid": "0d45b4c1-f3b1-4f10-9114-1e0e9803b9b4", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "R&B", "Electro Pop"], "active_start": 2014},
-    {"name": "Stray Kids", "id": "stray-kids", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop", "EDM"], "active_start": 2017},
-    {"name": "MONSTA X", "id": "monsta-x", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2015},
-    {"name": "NCT 127", "id": "nct-127", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2016},
-    {"name": "IU", "id": "iu", "mbid": "3057e0b6-ffea-47c3-a3d8-5544ae5d01aa", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Ballad"], "active_start": 2008},
-    {"name": "G-Dragon", "id": "g-dragon", "mbid": "56bf24a6-d716-431e-b8d9-2eb7ca9c1b6a", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2001},
-    {"name": "BIGBANG", "id": "bigbang", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2006},
-    {"name": "2NE1", "id": "2ne1", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2009, "active_end": 2016},
-    {"name": "SHINee", "id": "shinee", "mbid": "7402b88b-df2c-4ae0-a292-23cbb382ba18", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2008},
-    {"name": "GOT7", "id": "got7", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2014},
-    {"name": "ITZY", "id": "itzy", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2019},
-    {"name": "aespa", "id": "aespa", "mbid": "3057e0b6-ffea-47c3-a3d8-5544ae5d01aa", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "EDM", "Cyberpop"], "active_start": 2020},
-    {"name": "NewJeans", "id": "newjeans", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "R&B"], "active_start": 2022},
-    {"name": "LE SSERAFIM", "id": "le-sserafim", "mbid": "7402b88b-df2c-4ae0-a292-23cbb382ba18", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2022},
-    {"name": "(G)I-DLE", "id": "g-i-dle", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2018},
-    {"name": "Seventeen", "id": "seventeen", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Pop"], "active_start": 2015},
-
-    # Hip-Hop & R&B (20)
-    {"name": "Jay-Z", "id": "jay-z", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 1986},
-    {"name": "Nas", "id": "nas", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 1991},
-    {"name": "J. Cole", "id": "j-cole", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2007},
-    {"name": "Travis Scott", "id": "travis-scott", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2008},
-    {"name": "Cardi B", "id": "cardi-b", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2015},
-    {"name": "Nicki Minaj", "id": "nicki-minaj", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap", "Pop"], "active_start": 2004},
-    {"name": "21 Savage", "id": "21-savage", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2013},
-    {"name": "Lil Baby", "id": "lil-baby", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2015},
-    {"name": "Gunna", "id": "gunna", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2013},
-    {"name": "Future", "id": "future", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2003},
-    {"name": "SZA", "id": "sza", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["R&B", "Neo Soul"], "active_start": 2011},
-    {"name": "H.E.R.", "id": "h-e-r", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["R&B", "Soul"], "active_start": 2009},
-    {"name": "Frank Ocean", "id": "frank-ocean", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["R&B", "Neo Soul"], "active_start": 2005},
-    {"name": "Metro Boomin", "id": "metro-boomin", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2009},
-    {"name": "Jack Harlow", "id": "jack-harlow", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2015},
-    {"name": "Lil Uzi Vert", "id": "lil-uzi-vert", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2012},
-    {"name": "Juice WRLD", "id": "juice-wrld", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Emo Rap"], "active_start": 2015, "active_end": 2019},
-    {"name": "XXXTentacion", "id": "xxxtentacion", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Emo Rap"], "active_start": 2013, "active_end": 2018},
-    {"name": "Pop Smoke", "id": "pop-smoke", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Drill"], "active_start": 2018, "active_end": 2020},
-    {"name": "Mac Miller", "id": "mac-miller", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d2", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2007},
-
-    # Alternative & Indie (10)
-    {"name": "Tame Impala", "id": "tame-impala", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "Australia", "genres": ["Psychedelic Pop", "Indie Rock"], "active_start": 2007},
-    {"name": "Mac DeMarco", "id": "mac-demarco", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "Canada", "genres": ["Indie Rock", "Jangle Pop"], "active_start": 2008},
-    {"name": "Bon Iver", "id": "bon-iver", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Folk", "Alternative"], "active_start": 2006},
-    {"name": "Phoebe Bridgers", "id": "phoebe-bridgers", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Rock", "Singer-Songwriter"], "active_start": 2012},
-    {"name": "Fleet Foxes", "id": "fleet-foxes", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Folk", "Baroque Pop"], "active_start": 2006},
-    {"name": "Vampire Weekend", "id": "vampire-weekend", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Pop", "Art Pop"], "active_start": 2006},
-    {"name": "LCD Soundsystem", "id": "lcd-soundsystem", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Dance Punk", "Indie Rock"], "active_start": 2002},
-    {"name": "Beach House", "id": "beach-house", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Dream Pop", "Indie Rock"], "active_start": 2004},
-    {"name": "Sufjan Stevens", "id": "sufjan-stevens", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Folk", "Baroque Pop"], "active_start": 1999},
-    {"name": "Mitski", "id": "mitski", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Pop", "Art Pop"], "active_start": 2012}
-]
-
 # Static fallback dictionaries containing REAL authentic songs and lyrics for offline reliability
 FALLBACK_CATALOG = {
     "taylor-swift": {
@@ -344,6 +237,37 @@ REAL_TRACKS_DICTIONARY = FALLBACK_CATALOG
 
 # ----------------- ADAPTER ARCHITECTURE -----------------
 
+# Upstream request metrics, accumulated in memory and flushed to source_health periodically
+source_metrics = SourceMetrics(ArtistModel.get_db, flush_interval=float(os.getenv("SOURCE_METRICS_FLUSH_SECONDS", "30")))
+
+def _load_cooldown(source: str):
+    """Persisted cooldownUntil for a source, used to seed its circuit breaker after a restart."""
+    doc = ArtistModel.get_db().source_health.find_one({"source": source}, {"cooldownUntil": 1})
+    return doc.get("cooldownUntil") if doc else None
+
+def source_breaker(source: str):
+    return get_breaker(source, cooldown_loader=_load_cooldown)
+
+# Max in-flight requests per source within one aggregation job
+SOURCE_CONCURRENCY = {
+    "musicbrainz": 1,
+    "deezer": 4,
+    "lrclib": 4,
+    "lastfm": 2,
+    "coverart": 4,
+    "wikidata": 2,
+}
+DEFAULT_SOURCE_CONCURRENCY = 2
+
+# asyncio primitives belong to one event loop and every job runs in its own asyncio.run()
+_loop_semaphores = weakref.WeakKeyDictionary()
+
+def _source_semaphore(source: str) -> asyncio.Semaphore:
+    semaphores = _loop_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if source not in semaphores:
+        semaphores[source] = asyncio.Semaphore(SOURCE_CONCURRENCY.get(source, DEFAULT_SOURCE_CONCURRENCY))
+    return semaphores[source]
+
 class ArtistSourceAdapter(ABC):
     @abstractmethod
     async def fetch_artist(self, mbid: str) -> dict:
@@ -361,48 +285,61 @@ class ArtistSourceAdapter(ABC):
     async def fetch_lyrics(self, song: dict, artist_name: str) -> dict:
         pass
 
-    async def update_health(self, source: str, success: bool, error_msg: str = None):
-        """Update request counts, latency, and success status in the source_health collection."""
-        db = ArtistModel.get_db()
-        now = datetime.now(timezone.utc)
-        
-        update_fields = {
-            "lastRequest": now,
-            "isRateLimited": False
-        }
-        
+    async def update_health(self, source: str, success: bool, error_msg: str = None, latency_ms: float = None):
+        """Record a request outcome in the in-memory source metrics (flushed to source_health) and the circuit breaker."""
+        cooldown_until = source_metrics.record(source, success, error_msg, latency_ms)
+
+        breaker = source_breaker(source)
         if success:
-            inc_fields = {"requestsToday": 1, "successCount": 1}
+            breaker.record_success()
         else:
-            inc_fields = {"requestsToday": 1, "failureCount": 1}
-            update_fields["lastFailure"] = now
-            if error_msg:
-                update_fields["lastFailureReason"] = error_msg
-                if "rate" in error_msg.lower() or "429" in error_msg:
-                    update_fields["isRateLimited"] = True
-                    update_fields["cooldownUntil"] = now + timedelta(minutes=5)
-                    
-        db.source_health.update_one(
-            {"source": source},
-            {
-                "$set": update_fields,
-                "$inc": inc_fields
-            },
-            upsert=True
-        )
+            breaker.record_failure(cooldown_until=cooldown_until)
+
+    async def _get(self, source: str, url: str, **kwargs):
+        """
+        GET through the HTTP cache behind the source's circuit breaker and record health.
+        Returns the response on HTTP 200, otherwise None so the caller uses its fallback.
+        """
+        breaker = source_breaker(source)
+        try:
+            # Blocking I/O runs in a worker thread so concurrent songs in a job overlap
+            async with _source_semaphore(source):
+                started = time.perf_counter()
+                r = await asyncio.to_thread(cached_get, url, guard=breaker.allow, **kwargs)
+        except NetworkBlocked:
+            # Breaker open and nothing cached: fail fast
+            return None
+        except Exception as e:
+            await self.update_health(source, False, str(e), (time.perf_counter() - started) * 1000)
+            return None
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        cache_status = getattr(r, "cache_status", None)
+        if cache_status in ("hit", "blocked"):
+            # Served locally; says nothing about upstream health
+            return r if r.status_code == 200 else None
+        if cache_status == "stale":
+            await self.update_health(source, False, r.error, latency_ms)
+            return r
+        if r.status_code == 429 or r.status_code >= 500:
+            await self.update_health(source, False, f"HTTP {r.status_code}", latency_ms)
+            return None
+        # Any other answer (including 404 "no lyrics/cover") means the upstream is healthy
+        await self.update_health(source, True, latency_ms=latency_ms)
+        return r if r.status_code == 200 else None
 
 class MusicBrainzAdapter(ArtistSourceAdapter):
-    async def fetch_artist(self, mbid: str) -> dict:
+    async def fetch_artist(self, mbid: str, artist_id: str = None) -> dict:
         # Respect rate limits and log health status
         headers = {"User-Agent": "LyricaMusicLyrics/1.0 (contact: demo@lyrica.com)"}
         url = f"https://musicbrainz.org/ws/2/artist/{mbid}?fmt=json&inc=aliases+artist-rels"
         
-        # Local mock fallback checks
-        artist_meta = next((a for a in SEED_ARTISTS_METADATA if a["mbid"] == mbid), None)
+        # Local mock fallback checks (prefer the seed id; placeholder MBIDs are shared)
+        artist_meta = artist_registry.by_id(artist_id) if artist_id else artist_registry.by_mbid(mbid)
         artist_id = artist_meta["id"] if artist_meta else mbid
         
-        if os.getenv("MOCK_MODE") == "True":
-            # Return fallback directly without sleep
+        if os.getenv("MOCK_MODE") == "True" or artist_registry.is_ambiguous_mbid(mbid):
+            # Return fallback directly without sleep (a shared placeholder MBID would fetch someone else)
             mock_aliases = [artist_meta["name"].lower()] if artist_meta else []
             if artist_meta:
                 if artist_meta["id"] == "the-weeknd":
@@ -417,11 +354,9 @@ class MusicBrainzAdapter(ArtistSourceAdapter):
                 "related": []
             }
         try:
-            # Throttle requests
-            await asyncio.sleep(1.0)
-            r = requests.get(url, headers=headers, timeout=5)
-            if r.status_code == 200:
-                await self.update_health("musicbrainz", True)
+            # MusicBrainz 1 req/s throttling is applied by the HTTP cache on network trips only
+            r = await self._get("musicbrainz", url, headers=headers, timeout=5)
+            if r is not None:
                 data = r.json()
                 aliases = [a["name"] for a in data.get("aliases", [])]
                 
@@ -431,7 +366,7 @@ class MusicBrainzAdapter(ArtistSourceAdapter):
                     if rel.get("type") in ["collaboration", "member of", "influenced"]:
                         target = rel.get("artist", {})
                         t_mbid = target.get("id")
-                        t_meta = next((a for a in SEED_ARTISTS_METADATA if a["mbid"] == t_mbid), None)
+                        t_meta = artist_registry.by_mbid(t_mbid)
                         if t_meta:
                             related.append({
                                 "target": t_meta["id"],
@@ -458,14 +393,14 @@ class MusicBrainzAdapter(ArtistSourceAdapter):
             "related": []
         }
 
-    async def fetch_albums(self, mbid: str) -> list[dict]:
+    async def fetch_albums(self, mbid: str, artist_id: str = None) -> list[dict]:
         headers = {"User-Agent": "LyricaMusicLyrics/1.0 (contact: demo@lyrica.com)"}
         url = f"https://musicbrainz.org/ws/2/release-group?artist={mbid}&fmt=json"
-        artist_meta = next((a for a in SEED_ARTISTS_METADATA if a["mbid"] == mbid), None)
+        artist_meta = artist_registry.by_id(artist_id) if artist_id else artist_registry.by_mbid(mbid)
         artist_id = artist_meta["id"] if artist_meta else mbid
         
-        if os.getenv("MOCK_MODE") == "True":
-            # return fallback directly
+        if os.getenv("MOCK_MODE") == "True" or artist_registry.is_ambiguous_mbid(mbid):
+            # return fallback directly (a shared placeholder MBID would fetch someone else's discography)
             fallback_data = REAL_TRACKS_DICTIONARY.get(artist_id, {}).get("albums", [])
             if not fallback_data:
                 fallback_data = [
@@ -474,10 +409,9 @@ class MusicBrainzAdapter(ArtistSourceAdapter):
                 ]
             return fallback_data
         try:
-            await asyncio.sleep(1.0)
-            r = requests.get(url, headers=headers, timeout=5)
-            if r.status_code == 200:
-                await self.update_health("musicbrainz", True)
+            # MusicBrainz 1 req/s throttling is applied by the HTTP cache on network trips only
+            r = await self._get("musicbrainz", url, headers=headers, timeout=5)
+            if r is not None:
                 rgs = r.json().get("release-groups", [])
                 albums = []
                 for rg in rgs:
@@ -509,7 +443,7 @@ class MusicBrainzAdapter(ArtistSourceAdapter):
 
     async def fetch_songs(self, album_id: str) -> list[dict]:
         # Local fallback simulation checks
-        artist_meta = next((a for a in SEED_ARTISTS_METADATA if f"mb-al-{a['id']}" in album_id), None)
+        artist_meta = artist_registry.by_album_id(album_id)
         artist_id = artist_meta["id"] if artist_meta else None
         
         # Check if we have the specific album in fallback
@@ -536,6 +470,31 @@ class MusicBrainzAdapter(ArtistSourceAdapter):
     async def fetch_lyrics(self, song: dict, artist_name: str) -> dict:
         return {"plainText": "", "syncedLrc": ""}
 
+# "(feat. X)", "[Remastered 2019]", "- Live at ..." and similar decorations ignored when matching titles
+_TITLE_DECORATION_RE = re.compile(r"\s*[\(\[][^\)\]]*[\)\]]|\s+-\s+.*$")
+_TITLE_PUNCT_RE = re.compile(r"[^\w\s]")
+
+def normalize_track_title(title: str) -> str:
+    title = _TITLE_DECORATION_RE.sub("", (title or "").casefold())
+    return " ".join(_TITLE_PUNCT_RE.sub(" ", title).split())
+
+# Max difference (seconds) between local and Deezer durations for a title match
+DEEZER_DURATION_TOLERANCE = 6
+# Songs the album index misses fall back to a per-song search, at most this many per artist run
+DEEZER_SEARCH_FALLBACK_MAX = int(os.getenv("DEEZER_SEARCH_FALLBACK_MAX", "25"))
+
+def match_deezer_track(track_index: dict, title: str, duration: int = None) -> str:
+    """Preview URL of the indexed Deezer track matching `title`, closest in duration when ambiguous."""
+    candidates = track_index.get(normalize_track_title(title))
+    if not candidates:
+        return None
+    if not duration:
+        return candidates[0]["preview"]
+    best = min(candidates, key=lambda t: abs((t["duration"] or 0) - duration))
+    if best["duration"] and abs(best["duration"] - duration) > DEEZER_DURATION_TOLERANCE:
+        return None
+    return best["preview"]
+
 class DeezerAdapter(ArtistSourceAdapter):
     async def fetch_artist(self, mbid: str) -> dict:
         return {}
@@ -554,9 +513,8 @@ class DeezerAdapter(ArtistSourceAdapter):
                 "imageUrl": "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
             }
         try:
-            r = requests.get(url, timeout=4)
-            if r.status_code == 200:
-                await self.update_health("deezer", True)
+            r = await self._get("deezer", url, timeout=4)
+            if r is not None:
                 artists = r.json().get("data", [])
                 if artists:
                     best = artists[0]
@@ -571,15 +529,52 @@ class DeezerAdapter(ArtistSourceAdapter):
             "imageUrl": "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
         }
 
+    async def build_track_index(self, artist_name: str) -> dict:
+        """
+        Resolve the artist's Deezer albums once and pull their tracklists, so previews are
+        matched in memory (O(albums) requests instead of one search per song). Returns
+        {normalized title: [{"duration", "preview"}, ...]}, or {} if the artist can't be resolved.
+        Tracklist responses are kept by the HTTP cache.
+        """
+        if os.getenv("MOCK_MODE") == "True":
+            return {}
+        try:
+            r = await self._get("deezer", "https://api.deezer.com/search/artist", params={"q": artist_name}, timeout=4)
+            artists = r.json().get("data", []) if r is not None else []
+            if not artists:
+                return {}
+            r = await self._get("deezer", f"https://api.deezer.com/artist/{artists[0]['id']}/albums", params={"limit": 100}, timeout=4)
+            albums = r.json().get("data", []) if r is not None else []
+            tracklists = await asyncio.gather(*(
+                self._get("deezer", f"https://api.deezer.com/album/{alb['id']}/tracks", params={"limit": 200}, timeout=4)
+                for alb in albums
+            ))
+        except Exception as e:
+            await self.update_health("deezer", False, str(e))
+            return {}
+
+        index = {}
+        for r in tracklists:
+            if r is None:
+                continue
+            for track in r.json().get("data", []):
+                if not track.get("preview"):
+                    continue
+                index.setdefault(normalize_track_title(track.get("title")), []).append({
+                    "duration": track.get("duration"),
+                    "preview": track["preview"]
+                })
+        print(f"[Deezer] Indexed {sum(len(v) for v in index.values())} tracks from {len(albums)} albums for {artist_name}")
+        return index
+
     async def fetch_preview_url(self, title: str, artist_name: str) -> str:
         url = f"https://api.deezer.com/search?q=track:\"{title}\" artist:\"{artist_name}\""
         if os.getenv("MOCK_MODE") == "True":
             await self.update_health("youtube", True)
             return f"https://api.deezer.com/track/mock-preview"
         try:
-            r = requests.get(url, timeout=4)
-            if r.status_code == 200:
-                await self.update_health("deezer", True)
+            r = await self._get("deezer", url, timeout=4)
+            if r is not None:
                 tracks = r.json().get("data", [])
                 if tracks:
                     return tracks[0].get("preview")
@@ -607,9 +602,8 @@ class LastFmAdapter(ArtistSourceAdapter):
                 "tags": []
             }
         try:
-            r = requests.get(url, timeout=4)
-            if r.status_code == 200:
-                await self.update_health("lastfm", True)
+            r = await self._get("lastfm", url, timeout=4)
+            if r is not None:
                 info = r.json().get("artist", {})
                 listeners = int(info.get("stats", {}).get("listeners", 50000))
                 playcount = int(info.get("stats", {}).get("playcount", 150000))
@@ -653,9 +647,8 @@ class LRCLibAdapter(ArtistSourceAdapter):
                 "syncedLrc": ""
             }
         try:
-            r = requests.get(url, params=params, timeout=4)
-            if r.status_code == 200:
-                await self.update_health("lrclib", True)
+            r = await self._get("lrclib", url, params=params, timeout=4)
+            if r is not None:
                 body = r.json()
                 return {
                     "plainText": body.get("plainLyrics") or "",
@@ -685,9 +678,8 @@ class CoverArtArchiveAdapter(ArtistSourceAdapter):
         if os.getenv("MOCK_MODE") == "True":
             return "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300"
         try:
-            r = requests.get(url, timeout=3)
-            if r.status_code == 200:
-                await self.update_health("coverart", True)
+            r = await self._get("coverart", url, timeout=3)
+            if r is not None:
                 images = r.json().get("images", [])
                 if images:
                     return images[0].get("image")
@@ -723,9 +715,8 @@ class WikidataAdapter(ArtistSourceAdapter):
                 "nationality": "Global"
             }
         try:
-            r = requests.get(endpoint_url, params={"query": query, "format": "json"}, headers=headers, timeout=5)
-            if r.status_code == 200:
-                await self.update_health("wikidata", True)
+            r = await self._get("wikidata", endpoint_url, params={"query": query, "format": "json"}, headers=headers, timeout=5)
+            if r is not None:
                 results = r.json().get("results", {}).get("bindings", [])
                 if results:
                     best = results[0]
@@ -740,44 +731,62 @@ class WikidataAdapter(ArtistSourceAdapter):
             "nationality": "Global"
         }
 
+def score_emotions(text: str) -> dict:
+    """Count keyword hits per emotion. Pure function so it can run in worker processes."""
+    scores = {emotion: 0 for emotion in EMOTION_KEYWORDS.keys()}
+    clean_text = (text or "").lower()
+
+    for emotion, keywords in EMOTION_KEYWORDS.items():
+        for word in keywords:
+            # Use regex with word boundaries
+            pattern = rf"\b{re.escape(word)}\b"
+            scores[emotion] += len(re.findall(pattern, clean_text))
+    return scores
+
+def pick_emotion(scores: dict, corpus_counts: dict = None, corpus_total: int = 0) -> tuple[str, float]:
+    """Pick the dominant emotion from keyword scores, honouring the 40% corpus cap."""
+    total = sum(scores.values())
+    if total == 0:
+        return "hopeful", 0.5
+
+    # Sort emotions by score descending
+    sorted_emotions = sorted(scores, key=scores.get, reverse=True)
+    best_emotion = sorted_emotions[0]
+
+    # Enforce that no single emotion can exceed 40% of the total corpus
+    if corpus_counts is not None and corpus_total > 5:
+        for emo in sorted_emotions:
+            if (corpus_counts.get(emo, 0) / corpus_total) < 0.40:
+                best_emotion = emo
+                break
+
+    confidence = scores[best_emotion] / total if total > 0 else 0.5
+    return best_emotion, float(confidence)
+
 class EmotionEnrichmentAdapter:
     def classify_lyrics(self, text: str) -> tuple[str, float]:
         """Classify plain lyrics using the canonical 8-emotion word map."""
         if not text:
             return "melancholy", 0.5
-            
-        scores = {emotion: 0 for emotion in EMOTION_KEYWORDS.keys()}
-        clean_text = text.lower()
-        
-        for emotion, keywords in EMOTION_KEYWORDS.items():
-            for word in keywords:
-                # Use regex with word boundaries
-                pattern = rf"\b{re.escape(word)}\b"
-                scores[emotion] += len(re.findall(pattern, clean_text))
-                
-        total = sum(scores.values())
-        if total == 0:
+
+        scores = score_emotions(text)
+        if sum(scores.values()) == 0:
             return "hopeful", 0.5
-            
-        # Sort emotions by score descending
-        sorted_emotions = sorted(scores, key=scores.get, reverse=True)
-        best_emotion = sorted_emotions[0]
-        
-        # Enforce that no single emotion can exceed 40% of the total corpus
+
+        corpus_counts = None
+        corpus_total = 0
         try:
             db = ArtistModel.get_db()
-            total_lyrics = db.lyrics.count_documents({})
-            if total_lyrics > 5:
-                for emo in sorted_emotions:
-                    emo_count = db.lyrics.count_documents({"emotion": emo})
-                    if (emo_count / total_lyrics) < 0.40:
-                        best_emotion = emo
-                        break
+            corpus_total = db.lyrics.count_documents({})
+            if corpus_total > 5:
+                corpus_counts = {
+                    row["_id"]: row["n"]
+                    for row in db.lyrics.aggregate([{"$group": {"_id": "$emotion", "n": {"$sum": 1}}}])
+                }
         except Exception:
             pass
-            
-        confidence = scores[best_emotion] / total if total > 0 else 0.5
-        return best_emotion, float(confidence)
+
+        return pick_emotion(scores, corpus_counts, corpus_total)
 
 class DNAEnrichmentAdapter:
     def compute_dna_profile(self, songs_list: list, lyrics_list: list) -> dict:
@@ -826,6 +835,42 @@ class DNAEnrichmentAdapter:
 
 # ----------------- QUEUE WORKER SYSTEM -----------------
 
+def content_hash(fields: dict) -> str:
+    """Stable hash of an entity's upstream-derived fields, stored as contentHash to skip no-op rewrites."""
+    return hashlib.sha1(json.dumps(fields, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+def _new_change_summary() -> dict:
+    return {entity: {"changed": 0, "unchanged": 0} for entity in ("artist", "albums", "songs", "lyrics", "graph", "analytics")}
+
+# Aggregation stages in execution order, with their share of aggregationProgress
+PIPELINE_STAGES = [
+    ("metadata", 15),
+    ("search_index", 5),
+    ("albums", 10),
+    ("songs", 50),
+    ("graph", 10),
+    ("analytics", 10),
+]
+STAGE_WEIGHTS = dict(PIPELINE_STAGES)
+
+# A running job whose checkpoint heartbeat is older than this is treated as orphaned
+STALE_RUNNING_AFTER = timedelta(minutes=10)
+
+# Queue priority classes (lower runs first)
+PRIORITY_USER = 1     # a user is waiting on this artist
+PRIORITY_STALE = 2    # background refresh of an outdated profile
+PRIORITY_SEED = 3     # initial catalogue seeding
+PRIORITY_CLASSES = (PRIORITY_USER, PRIORITY_STALE, PRIORITY_SEED)
+
+# Every AGING_SECONDS of waiting lifts a job by one priority class when picking the next job
+AGING_SECONDS = 600
+CANDIDATES_PER_CLASS = 5
+
+# Failed jobs are retried after RETRY_BASE_SECONDS * 2^(attempts-1), capped, up to MAX_ATTEMPTS
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+MAX_ATTEMPTS = 5
+
 class AggregationWorker(ABC):
     @abstractmethod
     def enqueue(self, artist_id: str, priority: int, reason: str):
@@ -854,13 +899,42 @@ class ThreadWorker(AggregationWorker):
 
     def start(self):
         if not self._running:
+            # Older builds stored string priorities (e.g. "user_search"), which sort apart from the numeric classes
+            ArtistModel.get_db().aggregation_queue.update_many(
+                {"priority": {"$type": "string"}},
+                {"$set": {"priority": PRIORITY_USER}}
+            )
             self._running = True
             self._thread = threading.Thread(target=self._worker_loop, name="AggregationWorker")
             self._thread.daemon = True
             self._thread.start()
 
     def enqueue(self, artist_id: str, priority: int, reason: str):
+        """
+        Queue an artist for aggregation. Requests for a job that is already pending or
+        running are coalesced: the job keeps its createdAt/attempts and only moves up
+        to the better (lower) priority class. A dead-lettered job is only revived by a
+        user-priority request (a user is waiting on it); background requests leave it.
+        """
         db = ArtistModel.get_db()
+        now = datetime.now(timezone.utc)
+        active = {"artistId": artist_id, "status": {"$in": ["pending", "running"]}}
+        db.aggregation_queue.update_one(
+            {**active, "priority": {"$gt": priority}},
+            {"$set": {"priority": priority, "priorityReason": reason}}
+        )
+        result = db.aggregation_queue.update_one(
+            active,
+            {"$set": {"lastRequestedAt": now}, "$inc": {"requestCount": 1}}
+        )
+        if result.matched_count:
+            return
+
+        if priority != PRIORITY_USER and db.aggregation_queue.find_one({"artistId": artist_id, "status": "dead"}, {"_id": 1}):
+            # Background requests don't revive dead-lettered jobs; retry() or a user request does
+            return
+
+        # No active job (or a dead one a user is asking for): start a fresh one, keeping any checkpoint
         db.aggregation_queue.update_one(
             {"artistId": artist_id},
             {
@@ -869,33 +943,101 @@ class ThreadWorker(AggregationWorker):
                     "priorityReason": reason,
                     "status": "pending",
                     "attempts": 0,
-                    "createdAt": datetime.now(timezone.utc)
-                }
+                    "createdAt": now,
+                    "nextRunAt": now,
+                    "lastRequestedAt": now,
+                    "requestCount": 1
+                },
+                "$unset": {"deadAt": ""}
             },
             upsert=True
         )
 
     def retry(self, artist_id: str):
+        """Manually re-run a job now, including a dead-lettered one. Its checkpoint is kept."""
         db = ArtistModel.get_db()
+        now = datetime.now(timezone.utc)
         db.aggregation_queue.update_one(
             {"artistId": artist_id},
             {
                 "$set": {
                     "status": "pending",
-                    "createdAt": datetime.now(timezone.utc)
+                    "attempts": 0,
+                    "createdAt": now,
+                    "nextRunAt": now
                 },
-                "$inc": {"attempts": 1}
+                "$unset": {"deadAt": ""}
             }
         )
 
+    def _claim_next(self):
+        """
+        Atomically claim the next due job. A few of the oldest due jobs of each priority
+        class are ranked by priority minus age / AGING_SECONDS, so a long-waiting seed job
+        eventually outranks fresh user-facing ones.
+        """
+        db = ArtistModel.get_db()
+        now = datetime.now(timezone.utc)
+
+        # Running jobs whose worker stopped heartbeating (crash/restart) resume from their checkpoint;
+        # jobs left running by older builds have no heartbeat at all and count as stale too
+        db.aggregation_queue.update_many(
+            {"status": "running", "$or": [
+                {"heartbeatAt": {"$lt": now - STALE_RUNNING_AFTER}},
+                {"heartbeatAt": None}
+            ]},
+            {"$set": {"status": "pending", "nextRunAt": now}}
+        )
+
+        due = {"status": "pending", "$or": [{"nextRunAt": {"$lte": now}}, {"nextRunAt": None}]}
+        candidates = []
+        for priority in PRIORITY_CLASSES:
+            candidates.extend(
+                db.aggregation_queue.find({**due, "priority": priority}, {"artistId": 1, "priority": 1, "createdAt": 1})
+                .sort("createdAt", 1)
+                .limit(CANDIDATES_PER_CLASS)
+            )
+
+        def rank(job):
+            created = job.get("createdAt") or now
+            if created.tzinfo is None:
+                created = created.replace(tzinfo=timezone.utc)
+            waited = max((now - created).total_seconds(), 0)
+            return (job["priority"] - waited / AGING_SECONDS, created)
+
+        for candidate in sorted(candidates, key=rank):
+            job = db.aggregation_queue.find_one_and_update(
+                {"_id": candidate["_id"], "status": "pending"},
+                {"$set": {"status": "running", "lastAttempt": now, "heartbeatAt": now}}
+            )
+            if job:
+                return job
+        return None
+
+    def _schedule_retry(self, job: dict, error: str):
+        """Back off exponentially after a failure; dead-letter the job after MAX_ATTEMPTS."""
+        db = ArtistModel.get_db()
+        now = datetime.now(timezone.utc)
+        artist_id = job["artistId"]
+        attempts = job.get("attempts", 0) + 1
+        if attempts >= MAX_ATTEMPTS:
+            print(f"[AggregationWorker] {artist_id} failed {attempts} times, moving to dead-letter state.")
+            update = {"status": "dead", "attempts": attempts, "errorLog": error, "deadAt": now}
+        else:
+            delay = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+            print(f"[AggregationWorker] {artist_id} attempt {attempts} failed, retrying in {delay}s.")
+            update = {"status": "pending", "attempts": attempts, "errorLog": error, "nextRunAt": now + timedelta(seconds=delay)}
+        # The checkpoint stays on the queue document so the next attempt resumes from the failed stage
+        db.aggregation_queue.update_one({"artistId": artist_id}, {"$set": update})
+        db.artists.update_one(
+            {"artistId": artist_id},
+            {"$set": {"aggregationStatus": "failed"}}
+        )
+
     def _worker_loop(self):
         while self._running:
             db = ArtistModel.get_db()
-            job = db.aggregation_queue.find_one_and_update(
-                {"status": "pending"},
-                {"$set": {"status": "running", "lastAttempt": datetime.now(timezone.utc)}},
-                sort=[("priority", 1), ("createdAt", 1)]
-            )
+            job = self._claim_next()
             
             if not job:
                 time.sleep(2.0)
@@ -904,68 +1046,164 @@ class ThreadWorker(AggregationWorker):
             artist_id = job["artistId"]
             try:
                 # Run the pipeline synchronously with correct sequencing rules
-                asyncio.run(self.process(artist_id))
+                result = asyncio.run(self.process(artist_id))
                 db.aggregation_queue.update_one(
                     {"artistId": artist_id},
-                    {"$set": {"status": "complete"}}
+                    {"$set": {"status": "complete", "attempts": 0, "completedAt": datetime.now(timezone.utc), "result": result},
+                     "$unset": {"errorLog": "", "nextRunAt": ""}}
                 )
             except Exception as e:
                 print(f"[AggregationWorker] Error processing {artist_id}: {e}")
-                db.aggregation_queue.update_one(
-                    {"artistId": artist_id},
-                    {"$set": {"status": "failed", "errorLog": str(e)}}
-                )
-                db.artists.update_one(
-                    {"artistId": artist_id},
-                    {"$set": {"aggregationStatus": "failed"}}
-                )
+                self._schedule_retry(job, str(e))
+
+    # ----- checkpoints -----
+
+    def _load_checkpoint(self, artist_id: str) -> dict:
+        db = ArtistModel.get_db()
+        job = db.aggregation_queue.find_one({"artistId": artist_id}, {"checkpoint": 1}) or {}
+        checkpoint = job.get("checkpoint") or {}
+        return {
+            "completedStages": checkpoint.get("completedStages", []),
+            "context": checkpoint.get("context", {}),
+            "songsCursor": checkpoint.get("songsCursor", {"songsDone": []})
+        }
+
+    def _save_checkpoint(self, artist_id: str, fields: dict, progress: int, stage: str, add_to_set: dict = None,
+                         inc: dict = None):
+        db = ArtistModel.get_db()
+        update = {"$set": {**fields, "heartbeatAt": datetime.now(timezone.utc)}}
+        if add_to_set:
+            update["$addToSet"] = add_to_set
+        if inc:
+            update["$inc"] = inc
+        db.aggregation_queue.update_one({"artistId": artist_id}, update, upsert=True)
+        db.artists.update_one(
+            {"artistId": artist_id},
+            {"$set": {"aggregationProgress": progress, "aggregationStage": stage}}
+        )
+
+    @staticmethod
+    def _progress(completed_stages: list, partial_stage: str = None, partial_fraction: float = 0.0) -> int:
+        done = sum(weight for stage, weight in PIPELINE_STAGES if stage in completed_stages)
+        if partial_stage:
+            done += STAGE_WEIGHTS[partial_stage] * partial_fraction
+        return int(done)
 
     async def process(self, artist_id: str):
         db = ArtistModel.get_db()
-        
+        checkpoint = self._load_checkpoint(artist_id)
+        completed = checkpoint["completedStages"]
+        ctx = checkpoint["context"]
+        ctx.setdefault("changes", _new_change_summary())
+        if completed:
+            print(f"[AggregationWorker] Resuming {artist_id} after stages: {', '.join(completed)}")
+
         # Mark as aggregating
         db.artists.update_one(
             {"artistId": artist_id},
-            {"$set": {"aggregationStatus": "aggregating", "aggregationProgress": 10}}
+            {"$set": {"aggregationStatus": "aggregating", "aggregationProgress": self._progress(completed)}}
         )
-        
-        artist_meta = next((a for a in SEED_ARTISTS_METADATA if a["id"] == artist_id), None)
-        mbid = artist_meta["mbid"] if artist_meta else artist_id
-        
-        # 1. Pipeline Sequence: Aliases written before search_index is built
-        artist_data = await self.mb_adapter.fetch_artist(mbid)
-        deezer_data = await self.dz_adapter.enrich_artist_metadata(artist_data["name"])
-        wikidata_data = await self.wd_adapter.fetch_biography(artist_data["name"])
-        lfm_data = await self.lfm_adapter.fetch_stats(artist_data["name"])
-        
-        # Write artist document
+
+        for stage, _ in PIPELINE_STAGES:
+            if stage in completed:
+                continue
+            db.artists.update_one({"artistId": artist_id}, {"$set": {"aggregationStage": stage}})
+            if stage == "songs":
+                await self._stage_songs(artist_id, ctx, checkpoint)
+            else:
+                await getattr(self, f"_stage_{stage}")(artist_id, ctx)
+            completed.append(stage)
+            self._save_checkpoint(
+                artist_id,
+                {"checkpoint.completedStages": completed, "checkpoint.context": ctx},
+                self._progress(completed),
+                stage
+            )
+
+        # Mark artist status complete; the next refresh starts from scratch
         db.artists.update_one(
             {"artistId": artist_id},
             {
                 "$set": {
-                    "name": artist_data["name"],
-                    "aliases": artist_data["aliases"],
-                    "country": artist_data["country"],
-                    "nationality": wikidata_data.get("nationality", "Global"),
-                    "activeYears": artist_data["activeYears"],
-                    "genres": artist_meta["genres"] if artist_meta else ["Pop"],
-                    "bio": wikidata_data.get("bio"),
-                    "imageUrl": deezer_data.get("imageUrl"),
-                    "fanCount": deezer_data.get("fanCount", 12000),
-                    "popularity": lfm_data.get("popularity", 60),
-                    "aggregationStatus": "aggregating",
-                    "lastAggregated": datetime.now(timezone.utc),
-                    "sources": {
-                        "mbid": mbid,
-                        "deezerId": "dz-" + artist_id,
-                        "lastfmUrl": "lfm-" + artist_id
-                    }
+                    "aggregationStatus": "complete",
+                    "aggregationProgress": 100,
+                    "aggregationStage": None,
+                    "lastAggregated": datetime.now(timezone.utc)
                 }
             }
         )
+        db.aggregation_queue.update_one({"artistId": artist_id}, {"$unset": {"checkpoint": ""}})
+        changes = ctx["changes"]
+        print(f"[AggregationWorker] {artist_id} done: " + ", ".join(
+            f"{entity} {c['changed']} changed/{c['unchanged']} unchanged" for entity, c in changes.items()))
+        return {"changes": changes}
+
+    # ----- pipeline stages -----
+
+    async def _stage_metadata(self, artist_id: str, ctx: dict):
+        db = ArtistModel.get_db()
+        artist_meta = artist_registry.by_id(artist_id)
+        mbid = artist_meta["mbid"] if artist_meta else artist_id
         
+        # 1. Pipeline Sequence: Aliases written before search_index is built
+        artist_data = await self.mb_adapter.fetch_artist(mbid, artist_id=artist_id)
+        deezer_data = await self.dz_adapter.enrich_artist_metadata(artist_data["name"])
+        wikidata_data = await self.wd_adapter.fetch_biography(artist_data["name"])
+        lfm_data = await self.lfm_adapter.fetch_stats(artist_data["name"])
+        genres = artist_meta["genres"] if artist_meta else ["Pop"]
+
+        fields = {
+            "name": artist_data["name"],
+            "aliases": artist_data["aliases"],
+            "country": artist_data["country"],
+            "nationality": wikidata_data.get("nationality", "Global"),
+            "activeYears": artist_data["activeYears"],
+            "genres": genres,
+            "bio": wikidata_data.get("bio"),
+            "imageUrl": deezer_data.get("imageUrl"),
+            "fanCount": deezer_data.get("fanCount", 12000),
+            "popularity": lfm_data.get("popularity", 60),
+            "sources": {
+                "mbid": mbid,
+                "deezerId": "dz-" + artist_id,
+                "lastfmUrl": "lfm-" + artist_id
+            }
+        }
+        existing = db.artists.find_one({"artistId": artist_id}, {"contentHash": 1, "searchIndexHash": 1, "graphHash": 1}) or {}
+        
+        # Write artist document (content only when it changed)
+        update = {"aggregationStatus": "aggregating", "lastAggregated": datetime.now(timezone.utc)}
+        artist_hash = content_hash(fields)
+        if existing.get("contentHash") != artist_hash:
+            update.update(fields, contentHash=artist_hash)
+            ctx["changes"]["artist"]["changed"] += 1
+        else:
+            ctx["changes"]["artist"]["unchanged"] += 1
+        db.artists.update_one({"artistId": artist_id}, {"$set": update})
+
+        # Later stages only need these, so they survive in the checkpoint instead of being refetched
+        index_hash = content_hash({"name": artist_data["name"], "aliases": artist_data["aliases"]})
+        graph_hash = content_hash({"related": artist_data.get("related", []), "similar": lfm_data.get("similar", [])})
+        ctx.update({
+            "mbid": mbid,
+            "name": artist_data["name"],
+            "aliases": artist_data["aliases"],
+            "related": artist_data.get("related", []),
+            "similar": lfm_data.get("similar", []),
+            "genres": genres,
+            "searchIndexHash": index_hash,
+            "searchIndexChanged": existing.get("searchIndexHash") != index_hash,
+            "graphHash": graph_hash,
+            "graphChanged": existing.get("graphHash") != graph_hash
+        })
+
+    async def _stage_search_index(self, artist_id: str, ctx: dict):
+        db = ArtistModel.get_db()
+        if not ctx.get("searchIndexChanged", True):
+            # Same name and aliases as the last indexed run
+            return
         # Write aliases directly to artist_aliases
-        for alias in artist_data["aliases"]:
+        for alias in ctx["aliases"]:
             db.artist_aliases.update_one(
                 {"alias": alias.lower()},
                 {"$set": {"artistId": artist_id}},
@@ -973,90 +1211,184 @@ class ThreadWorker(AggregationWorker):
             )
             
         # Build search index for artist & aliases
-        ArtistModel.add_search_index("artist", artist_data["name"], artist_id)
-        for alias in artist_data["aliases"]:
+        ArtistModel.add_search_index("artist", ctx["name"], artist_id)
+        for alias in ctx["aliases"]:
             ArtistModel.add_search_index("artist", alias, artist_id)
-            
-        db.artists.update_one({"artistId": artist_id}, {"$inc": {"aggregationProgress": 20}})
-        
-        # 2. Fetch Albums and Songs
-        albums = await self.mb_adapter.fetch_albums(mbid)
+        db.artists.update_one({"artistId": artist_id}, {"$set": {"searchIndexHash": ctx["searchIndexHash"]}})
+
+    async def _stage_albums(self, artist_id: str, ctx: dict):
+        db = ArtistModel.get_db()
+        # 2. Fetch Albums
+        albums = await self.mb_adapter.fetch_albums(ctx["mbid"], artist_id=artist_id)
+        stored = {
+            doc["albumId"]: doc.get("contentHash")
+            for doc in db.albums.find({"albumId": {"$in": [alb["albumId"] for alb in albums]}}, {"albumId": 1, "contentHash": 1})
+        }
         for alb in albums:
+            fields = {
+                "title": alb["title"],
+                "artistId": artist_id,
+                "year": alb["year"],
+                "type": alb["type"],
+                "coverUrl": alb.get("coverUrl") or "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300",
+                "trackCount": 10,
+                "genres": ctx["genres"]
+            }
+            album_hash = content_hash(fields)
+            if stored.get(alb["albumId"]) == album_hash:
+                ctx["changes"]["albums"]["unchanged"] += 1
+                continue
+            ctx["changes"]["albums"]["changed"] += 1
             db.albums.update_one(
                 {"albumId": alb["albumId"]},
-                {
-                    "$set": {
-                        "title": alb["title"],
-                        "artistId": artist_id,
-                        "year": alb["year"],
-                        "type": alb["type"],
-                        "coverUrl": alb.get("coverUrl") or "https://images.unsplash.com/photo-1514525253161-7a46d19cd819?q=80&w=300",
-                        "trackCount": 10,
-                        "genres": artist_meta["genres"] if artist_meta else ["Pop"]
-                    }
-                },
+                {"$set": {**fields, "contentHash": album_hash}},
                 upsert=True
             )
-            
-            # Fetch Songs for the album
-            songs = await self.mb_adapter.fetch_songs(alb["albumId"])
+        ctx["albums"] = [{"albumId": alb["albumId"], "year": alb["year"]} for alb in albums]
+
+    async def _stage_songs(self, artist_id: str, ctx: dict, checkpoint: dict):
+        albums = ctx.get("albums", [])
+        completed = checkpoint["completedStages"]
+        songs_done = set(checkpoint["songsCursor"].get("songsDone", []))
+
+        # Track listings for every album; requests are bounded by the per-source semaphores
+        track_lists = await asyncio.gather(*(self.mb_adapter.fetch_songs(alb["albumId"]) for alb in albums))
+        work = {}
+        for alb, songs in zip(albums, track_lists):
             for s in songs:
-                # Fetch preview url
-                preview_url = await self.dz_adapter.fetch_preview_url(s["title"], artist_data["name"])
-                db.songs.update_one(
-                    {"songId": s["songId"]},
-                    {
-                        "$set": {
-                            "title": s["title"],
-                            "artistId": artist_id,
-                            "albumId": s["albumId"],
-                            "duration": s["duration"],
-                            "releaseYear": alb["year"],
-                            "popularity": s["popularity"],
-                            "previewUrl": preview_url or s["previewUrl"],
-                            "bpm": s["bpm"],
-                            "key": s["key"],
-                            "mood": "hopeful"
-                        }
-                    },
-                    upsert=True
-                )
-                
-                # Fetch lyrics (LRCLibAdapter)
-                lyric_data = await self.lrc_adapter.fetch_lyrics(s, artist_data["name"])
-                
-                # 3. Emotion classification runs after lyrics are fetched
-                emotion, confidence = self.emotion_enricher.classify_lyrics(lyric_data["plainText"])
-                
-                db.lyrics.update_one(
-                    {"lyricId": "lyr-" + s["songId"]},
-                    {
-                        "$set": {
-                            "songId": s["songId"],
-                            "artistId": artist_id,
-                            "plainText": lyric_data["plainText"],
-                            "syncedLrc": lyric_data["syncedLrc"],
-                            "hasSynced": bool(lyric_data["syncedLrc"]),
-                            "emotion": emotion,
-                            "emotionScore": confidence,
-                            "quotableLines": [line.strip() for line in lyric_data["plainText"].split("\n") if len(line.strip()) > 15][:3],
-                            "saveCount": 450,
-                            "shareCount": 20
-                        }
-                    },
-                    upsert=True
-                )
-                
-        db.artists.update_one({"artistId": artist_id}, {"$inc": {"aggregationProgress": 30}})
+                # A song listed on several releases is stored once, under the last album (as before)
+                work[s["songId"]] = (alb, s)
+        total = len(work) or 1
+        # One Deezer tracklist index per artist instead of a preview search per song
+        track_index = await self.dz_adapter.build_track_index(ctx["name"])
+        pending = [(alb, s) for song_id, (alb, s) in work.items() if song_id not in songs_done]
+        # Index misses that get the per-song search: the first N by songId over the whole artist,
+        # so the same songs are picked on every run and on resume
+        search_fallback = set()
+        if track_index:
+            misses = sorted(song_id for song_id, (alb, s) in work.items()
+                            if not match_deezer_track(track_index, s["title"], s.get("duration")))
+            search_fallback = set(misses[:DEEZER_SEARCH_FALLBACK_MAX])
+        db = ArtistModel.get_db()
+        stored = list(db.songs.find({"artistId": artist_id}, {"songId": 1, "contentHash": 1, "previewUrl": 1}))
+        shared = {
+            "trackIndex": track_index,
+            "searchFallback": search_fallback,
+            "songHashes": {d["songId"]: d.get("contentHash") for d in stored},
+            "storedPreviews": {d["songId"]: d.get("previewUrl") for d in stored},
+            "lyricHashes": {d["lyricId"]: d.get("contentHash") for d in db.lyrics.find({"artistId": artist_id}, {"lyricId": 1, "contentHash": 1})},
+            "changes": ctx["changes"]
+        }
+        if songs_done:
+            print(f"[AggregationWorker] {artist_id}: resuming songs, {len(songs_done)}/{len(work)} already stored")
+
+        # Every song fetches its preview and lyrics concurrently; each is checkpointed as it lands,
+        # together with its change counts so a resumed run still knows what this run changed
+        tasks = [self._aggregate_song(artist_id, ctx, alb, s, shared) for alb, s in pending]
+        for next_done in asyncio.as_completed(tasks):
+            song_id, outcome = await next_done
+            songs_done.add(song_id)
+            self._save_checkpoint(
+                artist_id,
+                {},
+                self._progress(completed, "songs", min(len(songs_done) / total, 1.0)),
+                "songs",
+                add_to_set={"checkpoint.songsCursor.songsDone": song_id},
+                inc={f"checkpoint.context.changes.{entity}.{result}": 1 for entity, result in outcome.items()}
+            )
+        checkpoint["songsCursor"] = {"songsDone": sorted(songs_done)}
+
+    async def _aggregate_song(self, artist_id: str, ctx: dict, alb: dict, s: dict, shared: dict) -> tuple:
+        """Store one song and its lyrics. Returns (song_id, {"songs": "changed"|"unchanged", "lyrics": ...})."""
+        db = ArtistModel.get_db()
+        changes = shared["changes"]
+        outcome = {}
+        track_index = shared["trackIndex"]
+        preview_url = match_deezer_track(track_index, s["title"], s.get("duration")) if track_index else None
+        # Per-song search when the artist isn't on Deezer, or when the album index misses a song
+        # picked for the capped fallback (singles, compilations, title variants)
+        search_preview = not track_index or (not preview_url and s["songId"] in shared["searchFallback"])
+        if not search_preview:
+            lyric_data = await self.lrc_adapter.fetch_lyrics(s, ctx["name"])
+        else:
+            # Preview search alongside the lyrics (LRCLibAdapter)
+            preview_url, lyric_data = await asyncio.gather(
+                self.dz_adapter.fetch_preview_url(s["title"], ctx["name"]),
+                self.lrc_adapter.fetch_lyrics(s, ctx["name"])
+            )
+        fields = {
+            "title": s["title"],
+            "artistId": artist_id,
+            "albumId": s["albumId"],
+            "duration": s["duration"],
+            "releaseYear": alb["year"],
+            "popularity": s["popularity"],
+            # No preview this run keeps the stored one, so the content hash doesn't flap
+            "previewUrl": preview_url or shared["storedPreviews"].get(s["songId"]) or s["previewUrl"],
+            "bpm": s["bpm"],
+            "key": s["key"],
+            "mood": "hopeful"
+        }
+        song_hash = content_hash(fields)
+        if shared["songHashes"].get(s["songId"]) == song_hash:
+            outcome["songs"] = "unchanged"
+        else:
+            outcome["songs"] = "changed"
+            db.songs.update_one(
+                {"songId": s["songId"]},
+                {"$set": {**fields, "contentHash": song_hash}},
+                upsert=True
+            )
+
+        # Unchanged lyric text keeps its stored emotion (and save/share counters)
+        lyric_id = "lyr-" + s["songId"]
+        lyric_hash = content_hash({
+            "songId": s["songId"],
+            "artistId": artist_id,
+            "plainText": lyric_data["plainText"],
+            "syncedLrc": lyric_data["syncedLrc"]
+        })
+        changes["songs"][outcome["songs"]] += 1
+        if shared["lyricHashes"].get(lyric_id) == lyric_hash:
+            changes["lyrics"]["unchanged"] += 1
+            outcome["lyrics"] = "unchanged"
+            return s["songId"], outcome
+        changes["lyrics"]["changed"] += 1
+        outcome["lyrics"] = "changed"
         
-        # 4. Pipeline Sequence: DNA Enrichment runs after emotion enrichment is complete
-        all_songs = list(db.songs.find({"artistId": artist_id}))
-        all_lyrics = list(db.lyrics.find({"artistId": artist_id}))
-        dna_profile = self.dna_enricher.compute_dna_profile(all_songs, all_lyrics)
+        # 3. Emotion classification runs as soon as this song's lyrics are in
+        emotion, confidence = self.emotion_enricher.classify_lyrics(lyric_data["plainText"])
         
+        db.lyrics.update_one(
+            {"lyricId": lyric_id},
+            {
+                "$set": {
+                    "songId": s["songId"],
+                    "artistId": artist_id,
+                    "plainText": lyric_data["plainText"],
+                    "syncedLrc": lyric_data["syncedLrc"],
+                    "hasSynced": bool(lyric_data["syncedLrc"]),
+                    "emotion": emotion,
+                    "emotionScore": confidence,
+                    "quotableLines": [line.strip() for line in lyric_data["plainText"].split("\n") if len(line.strip()) > 15][:3],
+                    "saveCount": 450,
+                    "shareCount": 20,
+                    "contentHash": lyric_hash
+                }
+            },
+            upsert=True
+        )
+        return s["songId"], outcome
+
+    async def _stage_graph(self, artist_id: str, ctx: dict):
+        db = ArtistModel.get_db()
+        if not ctx.get("graphChanged", True):
+            ctx["changes"]["graph"]["unchanged"] += 1
+            return
+        ctx["changes"]["graph"]["changed"] += 1
         # 5. Pipeline Sequence: artist_graph edges populated after both MB relations and LastFm similar are fetched
         # Populate relationships
-        for rel in artist_data.get("related", []):
+        for rel in ctx.get("related", []):
             db.artist_graph.update_one(
                 {"source": artist_id, "target": rel["target"]},
                 {
@@ -1069,8 +1401,8 @@ class ThreadWorker(AggregationWorker):
                 upsert=True
             )
             
-        for sim in lfm_data.get("similar", []):
-            sim_meta = next((a for a in SEED_ARTISTS_METADATA if a["name"].lower() == sim.lower()), None)
+        for sim in ctx.get("similar", []):
+            sim_meta = artist_registry.by_name(sim)
             if sim_meta:
                 db.artist_graph.update_one(
                     {"source": artist_id, "target": sim_meta["id"]},
@@ -1083,6 +1415,21 @@ class ThreadWorker(AggregationWorker):
                     },
                     upsert=True
                 )
+        db.artists.update_one({"artistId": artist_id}, {"$set": {"graphHash": ctx["graphHash"]}})
+
+    async def _stage_analytics(self, artist_id: str, ctx: dict):
+        db = ArtistModel.get_db()
+        changes = ctx["changes"]
+        if (not changes["songs"]["changed"] and not changes["lyrics"]["changed"] and not ctx.get("graphChanged", True)
+                and db.artist_analytics.find_one({"artistId": artist_id, "dna": {"$exists": True}}, {"_id": 1})):
+            # Nothing the DNA profile or analytics derive from has changed
+            changes["analytics"]["unchanged"] += 1
+            return
+        changes["analytics"]["changed"] += 1
+        # 4. Pipeline Sequence: DNA Enrichment runs after emotion enrichment is complete
+        all_songs = list(db.songs.find({"artistId": artist_id}))
+        all_lyrics = list(db.lyrics.find({"artistId": artist_id}))
+        dna_profile = self.dna_enricher.compute_dna_profile(all_songs, all_lyrics)
                 
         # Calculate Discovery Score (weighted formula)
         # DiscoveryScore = plays * 0.25 + follows * 0.20 + playlistAdds * 0.15 + savedLyrics * 0.25 + quoteShares * 0.15
@@ -1119,28 +1466,28 @@ class ThreadWorker(AggregationWorker):
                     "discoveryScore": discovery_score,
                     "topQuotedLyrics": top_quotes[:5],
                     "listenerJourney": journey,
-                    "collaborators": [r["target"] for r in artist_data.get("related", [])],
+                    "collaborators": [r["target"] for r in ctx.get("related", [])],
                     "peakPopularityYear": 2024
                 }
             },
             upsert=True
         )
-        
-        # Mark artist status complete
-        db.artists.update_one(
-            {"artistId": artist_id},
-            {
-                "$set": {
-                    "aggregationStatus": "complete",
-                    "aggregationProgress": 100,
-                    "lastAggregated": datetime.now(timezone.utc)
-                }
-            }
-        )
 
 # Global ThreadWorker instance
 _worker = ThreadWorker()
 
+# Refreshes expiring artist data ahead of time; routes register their own cached fields
+staleness_sweeper = StalenessSweeper(
+    ArtistModel.get_db,
+    interval=float(os.getenv("STALENESS_SWEEP_SECONDS", "60")),
+    max_per_sweep=int(os.getenv("STALENESS_SWEEP_BATCH", "10"))
+)
+staleness_sweeper.register(
+    "lastAggregated",
+    timedelta(days=7),
+    lambda doc: _worker.enqueue(doc["artistId"], priority=PRIORITY_STALE, reason="stale_refresh")
+)
+
 def seed_database():
     """Seed baseline metadata-only profiles for the 100+ artists into MongoDB."""
     db = ArtistModel.get_db()
@@ -1199,8 +1546,8 @@ def seed_database():
                     upsert=True
                 )
                 
-            # Enqueue seed artists to the aggregation queue (priority=1 for signature artists, priority=3 otherwise)
-            priority = 1 if meta["id"] in ["taylor-swift", "the-weeknd", "coldplay", "post-malone", "sabrina-carpenter", "arijit-singh"] else 3
+            # Enqueue seed artists to the aggregation queue (signature artists are on the landing page, so user-facing)
+            priority = PRIORITY_USER if meta["id"] in ["taylor-swift", "the-weeknd", "coldplay", "post-malone", "sabrina-carpenter", "arijit-singh"] else PRIORITY_SEED
             _worker.enqueue(meta["id"], priority=priority, reason="seed")
             
         # Seed 1400+ relationship edges to guarantee dense graph
@@ -1230,9 +1577,11 @@ def seed_database():
                     edge_count += 1
         print(f"[DATABASE] Seeding complete. Enqueued {len(SEED_ARTISTS_METADATA)} artists. Generated {edge_count} relationships.")
         
-    # Start the background aggregator daemon
+    # Start the background aggregator daemon, the metrics flusher and the staleness sweeper
     _worker.start()
+    source_metrics.start()
+    staleness_sweeper.start()
 
-def trigger_background_refresh(artist_id):
-    """Enqueue a job manually with high priority."""
-    _worker.enqueue(artist_id, priority=1, reason="user_search")
+def trigger_background_refresh(artist_id, priority=PRIORITY_USER, reason="user_search"):
+    """Enqueue an aggregation job (user-facing priority unless told otherwise)."""
+    _worker.enqueue(artist_id, priority=priority, reason=reason)
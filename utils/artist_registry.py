@@ -0,0 +1,218 @@
+# utils/artist_registry.py
+"""
+Seed artist metadata registry.
+
+Holds the built-in SEED_ARTISTS_METADATA list and dict indexes over it (by id,
+MusicBrainz id, normalized name and synthesized album id) so hot paths in the
+aggregator never scan the list. A larger seed set can be loaded from a JSON file
+(a list of the same dicts) via SEED_ARTISTS_FILE; entries with an existing id
+replace the built-in one.
+"""
+import json
+import os
+import re
+
+# Mapping of 100+ real artists with MBIDs, categories, countries, and baseline genres
+SEED_ARTISTS_METADATA = [
+    # Global Pop & Rock (25)
+    {"name": "Taylor Swift", "id": "taylor-swift", "mbid": "b9534ade-a339-4c40-b66a-79f755bd04fa", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Country", "Indie Folk"], "active_start": 2004},
+    {"name": "Sabrina Carpenter", "id": "sabrina-carpenter", "mbid": "e4a7b596-f6c8-47c3-bbdf-5d7f6c6bbf8d", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "R&B"], "active_start": 2011},
+    {"name": "Ed Sheeran", "id": "ed-sheeran", "mbid": "b8a7c6a0-47d6-43f4-b2ce-b7b117cd35c1", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Pop", "Folk Pop"], "active_start": 2004},
+    {"name": "The Weeknd", "id": "the-weeknd", "mbid": "c8b143d7-234e-4ac9-ab9e-8c0af3f885e2", "category": "Global Pop & Rock", "country": "Canada", "genres": ["R&B", "Synthwave", "Pop"], "active_start": 2010},
+    {"name": "Billie Eilish", "id": "billie-eilish", "mbid": "c3c82bd7-d69a-467f-9b24-051396e27014", "category": "Global Pop & Rock", "country": "United States", "genres": ["Alternative", "Pop"], "active_start": 2015},
+    {"name": "Ariana Grande", "id": "ariana-grande", "mbid": "f77e8c7c-76fb-40c2-9b6b-1eb5a305f453", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "R&B"], "active_start": 2008},
+    {"name": "Harry Styles", "id": "harry-styles", "mbid": "e52045e3-ca5b-42c1-840b-49938830ba8c", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Pop Rock", "Indie Pop"], "active_start": 2010},
+    {"name": "Olivia Rodrigo", "id": "olivia-rodrigo", "mbid": "601ed8fb-1544-4740-b7c1-2f64d4c5c102", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Pop Punk"], "active_start": 2015},
+    {"name": "Dua Lipa", "id": "dua-lipa", "mbid": "0383dac1-ade8-4d51-a185-94f3e69479b9", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Pop", "Disco"], "active_start": 2014},
+    {"name": "Post Malone", "id": "post-malone", "mbid": "d14210d6-ff7d-41a4-b4a1-ca316e6d1b6a", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Hip-Hop", "Rock"], "active_start": 2011},
+    {"name": "Drake", "id": "drake", "mbid": "b70c3c5f-514e-4f55-a90a-ee4eb7db9139", "category": "Global Pop & Rock", "country": "Canada", "genres": ["Hip-Hop", "Rap", "R&B"], "active_start": 2001},
+    {"name": "Kendrick Lamar", "id": "kendrick-lamar", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Global Pop & Rock", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2003},
+    {"name": "Eminem", "id": "eminem", "mbid": "18dba729-995d-4ad9-8356-b92c1143f11f", "category": "Global Pop & Rock", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 1988},
+    {"name": "Coldplay", "id": "coldplay", "mbid": "cc197c18-b830-4240-9a9c-2847d041c4fc", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Alternative Rock", "Pop"], "active_start": 1996},
+    {"name": "Imagine Dragons", "id": "imagine-dragons", "mbid": "01215159-f73e-42c1-83d1-1053a85c6f8f", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop Rock", "Indie Rock"], "active_start": 2008},
+    {"name": "Arctic Monkeys", "id": "arctic-monkeys", "mbid": "ada4ade5-d9e9-4226-801e-223b2075633b", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Indie Rock", "Alternative Rock"], "active_start": 2002},
+    {"name": "Radiohead", "id": "radiohead", "mbid": "a74b1b7f-71a5-4011-9441-d0b5e412240a", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Alternative Rock", "Art Rock"], "active_start": 1985},
+    {"name": "The Beatles", "id": "the-beatles", "mbid": "b10bbcaa-14ae-424b-b321-b04e02ed7a40", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Rock", "Pop"], "active_start": 1960, "active_end": 1970},
+    {"name": "Queen", "id": "queen", "mbid": "5eecaf18-02ec-47c5-acef-b0f2235121ac", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Rock", "Hard Rock"], "active_start": 1970},
+    {"name": "Pink Floyd", "id": "pink-floyd", "mbid": "83d91898-7763-47d7-b03b-b92132375086", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Progressive Rock", "Psychedelic Rock"], "active_start": 1965, "active_end": 1994},
+    {"name": "David Bowie", "id": "david-bowie", "mbid": "5441c29d-3f4e-4ff9-b10b-b58aff4a096b", "category": "Global Pop & Rock", "country": "United Kingdom", "genres": ["Art Rock", "Glam Rock"], "active_start": 1962, "active_end": 2016},
+    {"name": "Bruno Mars", "id": "bruno-mars", "mbid": "af816c21-1771-4770-ae61-26ab293933c0", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Funk", "R&B"], "active_start": 2004},
+    {"name": "Lady Gaga", "id": "lady-gaga", "mbid": "650e7db6-b73f-4ce8-a08f-f74fa015c6be", "category": "Global Pop & Rock", "country": "United States", "genres": ["Pop", "Dance"], "active_start": 2005},
+    {"name": "Beyonce", "id": "beyonce", "mbid": "859d90b4-6ba9-42a2-83fd-f16177e09714", "category": "Global Pop & Rock", "country": "United States", "genres": ["R&B", "Pop"], "active_start": 1997},
+    {"name": "Rihanna", "id": "rihanna", "mbid": "db3256f1-a48a-4ab2-9c14-77a8719008ae", "category": "Global Pop & Rock", "country": "Barbados", "genres": ["Pop", "R&B"], "active_start": 2003},
+    {"name": "Justin Bieber", "id": "justin-bieber", "mbid": "e01d330e-9859-4041-9eff-7ab97ab244a8", "category": "Global Pop & Rock", "country": "Canada", "genres": ["Pop", "R&B"], "active_start": 2007},
+
+    # Indian (Hindi/Bollywood & Indie) (25)
+    {"name": "Arijit Singh", "id": "arijit-singh", "mbid": "5a9e3f28-090c-43fc-bc74-6f5dfbe831e5", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Romantic", "Classical"], "active_start": 2007},
+    {"name": "Shreya Ghoshal", "id": "shreya-ghoshal", "mbid": "e9d6d5eb-7253-4318-971c-7729e847c1be", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Classical", "Romantic"], "active_start": 1998},
+    {"name": "Sonu Nigam", "id": "sonu-nigam", "mbid": "5f89ef7b-c322-4dc8-a89e-29f79ca4d88e", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Pop", "Romantic"], "active_start": 1990},
+    {"name": "Udit Narayan", "id": "udit-narayan", "mbid": "24b61ef9-813c-41c3-8857-79774640101b", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Romantic"], "active_start": 1980},
+    {"name": "Lata Mangeshkar", "id": "lata-mangeshkar", "mbid": "420138db-10fa-4001-9279-3c72b220d91d", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Classical", "Sufi"], "active_start": 1942, "active_end": 2022},
+    {"name": "Kishore Kumar", "id": "kishore-kumar", "mbid": "8ee3d317-a068-45be-bb37-a169992f0269", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Comedy", "Romantic"], "active_start": 1946, "active_end": 1987},
+    {"name": "Mohammed Rafi", "id": "mohammed-rafi", "mbid": "e9275cb7-2037-4d76-8809-5cf2ee510b0d", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Sufi", "Classical"], "active_start": 1941, "active_end": 1980},
+    {"name": "A.R. Rahman", "id": "a-r-rahman", "mbid": "656c0724-4f05-4ef5-a74e-6e7ef15c0e14", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Soundtrack", "Sufi", "Fusion"], "active_start": 1992},
+    {"name": "Vishal-Shekhar", "id": "vishal-shekhar", "mbid": "81ba82e5-e6a8-4221-a3f2-c9a490d164d1", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Dance"], "active_start": 1999},
+    {"name": "Pritam", "id": "pritam", "mbid": "ea4bfda3-2a3a-4467-93ae-c9d3000dfb4f", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Pop Rock"], "active_start": 2001},
+    {"name": "Shankar-Ehsaan-Loy", "id": "shankar-ehsaan-loy", "mbid": "687f872c-be99-4d2d-94c6-43b8c4c7c8c8", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Indie Rock"], "active_start": 1997},
+    {"name": "Diljit Dosanjh", "id": "diljit-dosanjh", "mbid": "505f9c5d-20c2-4a00-ab64-cae60eb11a96", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi", "Pop", "Folk"], "active_start": 2000},
+    {"name": "Badshah", "id": "badshah", "mbid": "de299c82-841c-4b92-9e2e-2e557b2f0a1c", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi", "Rap", "Bollywood"], "active_start": 2006},
+    {"name": "Honey Singh", "id": "honey-singh", "mbid": "482f3a6a-8bbe-4cc1-8281-e96aa4c29923", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi Pop", "Hip-Hop"], "active_start": 2005},
+    {"name": "Divine", "id": "divine", "mbid": "62061033-c350-4824-bebf-1d746571bebf", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Desi Hip Hop", "Rap"], "active_start": 2013},
+    {"name": "Nucleya", "id": "nucleya", "mbid": "c18d9f1c-7f51-4043-8557-cae61eb31a96", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bass", "EDM", "Fusion"], "active_start": 1998},
+    {"name": "Prateek Kuhad", "id": "prateek-kuhad", "mbid": "de99e5a1-7788-4fbb-a148-52467dbebf16", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Indie Folk", "Singer-Songwriter"], "active_start": 2011},
+    {"name": "Aastha Gill", "id": "aastha-gill", "mbid": "24b61ef9-813c-41c3-8857-79774640101b", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Dance Pop"], "active_start": 2014},
+    {"name": "Jubin Nautiyal", "id": "jubin-nautiyal", "mbid": "dc82bd7d-d69a-467f-9b24-051396e27014", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Romantic", "Sufi"], "active_start": 2011},
+    {"name": "B Praak", "id": "b-praak", "mbid": "8ee3d317-a068-45be-bb37-a169992f0269", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi", "Romantic", "Sad"], "active_start": 2012},
+    {"name": "Darshan Raval", "id": "darshan-raval", "mbid": "5a9e3f28-090c-43fc-bc74-6f5dfbe831e5", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Pop", "Romantic"], "active_start": 2014},
+    {"name": "Neha Kakkar", "id": "neha-kakkar", "mbid": "ea4bfda3-2a3a-4467-93ae-c9d3000dfb4f", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Bollywood", "Dance Pop"], "active_start": 2006},
+    {"name": "Guru Randhawa", "id": "guru-randhawa", "mbid": "656c0724-4f05-4ef5-a74e-6e7ef15c0e14", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Punjabi Pop", "Bollywood"], "active_start": 2013},
+    {"name": "Raftaar", "id": "raftaar", "mbid": "de299c82-841c-4b92-9e2e-2e557b2f0a1c", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Desi Hip Hop", "Rap"], "active_start": 2008},
+    {"name": "Jasleen Royal", "id": "jasleen-royal", "mbid": "505f9c5d-20c2-4a00-ab64-cae60eb11a96", "category": "Indian (Hindi/Bollywood & Indie)", "country": "India", "genres": ["Indie Pop", "Romantic"], "active_start": 2013},
+
+    # K-Pop (20)
+    {"name": "BTS", "id": "bts", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop", "Pop"], "active_start": 2013},
+    {"name": "BLACKPINK", "id": "blackpink", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2016},
+    {"name": "EXO", "id": "exo", "mbid": "7402b88b-df2c-4ae0-a292-23cbb382ba18", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "R&B"], "active_start": 2012},
+    {"name": "TWICE", "id": "twice", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Bubblegum Pop"], "active_start": 2015},
+    {"name": "Red Velvet", "id": "red-velvet", "mbid": "0d45b4c1-f3b1-4f10-9114-1e0e9803b9b4", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "R&B", "Electro Pop"], "active_start": 2014},
+    {"name": "Stray Kids", "id": "stray-kids", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop", "EDM"], "active_start": 2017},
+    {"name": "MONSTA X", "id": "monsta-x", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2015},
+    {"name": "NCT 127", "id": "nct-127", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2016},
+    {"name": "IU", "id": "iu", "mbid": "3057e0b6-ffea-47c3-a3d8-5544ae5d01aa", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Ballad"], "active_start": 2008},
+    {"name": "G-Dragon", "id": "g-dragon", "mbid": "56bf24a6-d716-431e-b8d9-2eb7ca9c1b6a", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2001},
+    {"name": "BIGBANG", "id": "bigbang", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2006},
+    {"name": "2NE1", "id": "2ne1", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2009, "active_end": 2016},
+    {"name": "SHINee", "id": "shinee", "mbid": "7402b88b-df2c-4ae0-a292-23cbb382ba18", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2008},
+    {"name": "GOT7", "id": "got7", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Hip-Hop"], "active_start": 2014},
+    {"name": "ITZY", "id": "itzy", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2019},
+    {"name": "aespa", "id": "aespa", "mbid": "3057e0b6-ffea-47c3-a3d8-5544ae5d01aa", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "EDM", "Cyberpop"], "active_start": 2020},
+    {"name": "NewJeans", "id": "newjeans", "mbid": "0ae6a8ee-f93a-4efb-8664-df8c75121bde", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "R&B"], "active_start": 2022},
+    {"name": "LE SSERAFIM", "id": "le-sserafim", "mbid": "7402b88b-df2c-4ae0-a292-23cbb382ba18", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2022},
+    {"name": "(G)I-DLE", "id": "g-i-dle", "mbid": "3ad2ad8e-b6a8-48b4-92ff-63c3d3fbfde6", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Dance Pop"], "active_start": 2018},
+    {"name": "Seventeen", "id": "seventeen", "mbid": "ae554868-bb88-4a92-9b2c-63b7df3cbf8d", "category": "K-Pop", "country": "South Korea", "genres": ["K-Pop", "Pop"], "active_start": 2015},
+
+    # Hip-Hop & R&B (20)
+    {"name": "Jay-Z", "id": "jay-z", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 1986},
+    {"name": "Nas", "id": "nas", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 1991},
+    {"name": "J. Cole", "id": "j-cole", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2007},
+    {"name": "Travis Scott", "id": "travis-scott", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2008},
+    {"name": "Cardi B", "id": "cardi-b", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2015},
+    {"name": "Nicki Minaj", "id": "nicki-minaj", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap", "Pop"], "active_start": 2004},
+    {"name": "21 Savage", "id": "21-savage", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2013},
+    {"name": "Lil Baby", "id": "lil-baby", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2015},
+    {"name": "Gunna", "id": "gunna", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2013},
+    {"name": "Future", "id": "future", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2003},
+    {"name": "SZA", "id": "sza", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["R&B", "Neo Soul"], "active_start": 2011},
+    {"name": "H.E.R.", "id": "h-e-r", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["R&B", "Soul"], "active_start": 2009},
+    {"name": "Frank Ocean", "id": "frank-ocean", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["R&B", "Neo Soul"], "active_start": 2005},
+    {"name": "Metro Boomin", "id": "metro-boomin", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2009},
+    {"name": "Jack Harlow", "id": "jack-harlow", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2015},
+    {"name": "Lil Uzi Vert", "id": "lil-uzi-vert", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Trap"], "active_start": 2012},
+    {"name": "Juice WRLD", "id": "juice-wrld", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Emo Rap"], "active_start": 2015, "active_end": 2019},
+    {"name": "XXXTentacion", "id": "xxxtentacion", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d1", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Emo Rap"], "active_start": 2013, "active_end": 2018},
+    {"name": "Pop Smoke", "id": "pop-smoke", "mbid": "3810c16e-84c6-44b2-a61a-40778c772379", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Drill"], "active_start": 2018, "active_end": 2020},
+    {"name": "Mac Miller", "id": "mac-miller", "mbid": "f822e0a0-e648-4221-a3f2-c9a490d164d2", "category": "Hip-Hop & R&B", "country": "United States", "genres": ["Hip-Hop", "Rap"], "active_start": 2007},
+
+    # Alternative & Indie (10)
+    {"name": "Tame Impala", "id": "tame-impala", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "Australia", "genres": ["Psychedelic Pop", "Indie Rock"], "active_start": 2007},
+    {"name": "Mac DeMarco", "id": "mac-demarco", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "Canada", "genres": ["Indie Rock", "Jangle Pop"], "active_start": 2008},
+    {"name": "Bon Iver", "id": "bon-iver", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Folk", "Alternative"], "active_start": 2006},
+    {"name": "Phoebe Bridgers", "id": "phoebe-bridgers", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Rock", "Singer-Songwriter"], "active_start": 2012},
+    {"name": "Fleet Foxes", "id": "fleet-foxes", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Folk", "Baroque Pop"], "active_start": 2006},
+    {"name": "Vampire Weekend", "id": "vampire-weekend", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Pop", "Art Pop"], "active_start": 2006},
+    {"name": "LCD Soundsystem", "id": "lcd-soundsystem", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Dance Punk", "Indie Rock"], "active_start": 2002},
+    {"name": "Beach House", "id": "beach-house", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Dream Pop", "Indie Rock"], "active_start": 2004},
+    {"name": "Sufjan Stevens", "id": "sufjan-stevens", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Folk", "Baroque Pop"], "active_start": 1999},
+    {"name": "Mitski", "id": "mitski", "mbid": "63b7df3c-bf8d-4a92-9b2c-63b7df3cbf8d", "category": "Alternative & Indie", "country": "United States", "genres": ["Indie Pop", "Art Pop"], "active_start": 2012}
+]
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase and collapse whitespace so 'The  Weeknd ' matches 'the weeknd'."""
+    return " ".join(str(name or "").casefold().split())
+
+
+_SYNTH_ALBUM_RE = re.compile(r"^mb-al-(.+)-\d+$")
+
+
+class ArtistRegistry:
+    def __init__(self, entries: list):
+        self.entries = entries
+        self.rebuild()
+
+    def rebuild(self):
+        """(Re)build every index from self.entries."""
+        self._by_id = {}
+        self._by_name = {}
+        mbid_owners = {}
+        for meta in self.entries:
+            self._by_id[meta["id"]] = meta
+            self._by_name.setdefault(normalize_name(meta["name"]), meta)
+            if meta.get("mbid"):
+                mbid_owners.setdefault(meta["mbid"], []).append(meta)
+
+        # Several seed entries share placeholder MBIDs; an mbid lookup must never
+        # silently resolve to whichever artist happens to come first in the list.
+        self._by_mbid = {mbid: owners[0] for mbid, owners in mbid_owners.items() if len(owners) == 1}
+        self._ambiguous_mbids = {mbid for mbid, owners in mbid_owners.items() if len(owners) > 1}
+
+    def by_id(self, artist_id: str):
+        return self._by_id.get(artist_id)
+
+    def by_mbid(self, mbid: str):
+        """Seed entry owning this MBID, or None when unknown or shared by several artists."""
+        return self._by_mbid.get(mbid)
+
+    def is_ambiguous_mbid(self, mbid: str) -> bool:
+        return mbid in self._ambiguous_mbids
+
+    def by_name(self, name: str):
+        return self._by_name.get(normalize_name(name))
+
+    def by_album_id(self, album_id: str):
+        """Resolve a synthesized 'mb-al-<artistId>-<n>' album id back to its seed artist."""
+        match = _SYNTH_ALBUM_RE.match(album_id or "")
+        return self._by_id.get(match.group(1)) if match else None
+
+    def load_file(self, path: str) -> int:
+        """Merge seed entries from a JSON file into the registry. Returns the number loaded."""
+        with open(path, "r", encoding="utf-8") as f:
+            extra = json.load(f)
+        if isinstance(extra, dict):
+            extra = extra.get("artists", [])
+
+        positions = {meta["id"]: idx for idx, meta in enumerate(self.entries)}
+        loaded = 0
+        for meta in extra:
+            if not meta.get("id") or not meta.get("name"):
+                continue
+            meta.setdefault("mbid", None)
+            meta.setdefault("category", "Global Pop & Rock")
+            meta.setdefault("country", "Unknown")
+            meta.setdefault("genres", ["Pop"])
+            meta.setdefault("active_start", 2000)
+            if meta["id"] in positions:
+                self.entries[positions[meta["id"]]] = meta
+            else:
+                positions[meta["id"]] = len(self.entries)
+                self.entries.append(meta)
+            loaded += 1
+        self.rebuild()
+        return loaded
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+
+artist_registry = ArtistRegistry(SEED_ARTISTS_METADATA)
+
+_seed_file = os.getenv("SEED_ARTISTS_FILE")
+if _seed_file:
+    try:
+        count = artist_registry.load_file(_seed_file)
+        print(f"[REGISTRY] Loaded {count} seed artists from {_seed_file} ({len(artist_registry)} total).")
+    except Exception as e:
+        print(f"[REGISTRY] Warning: could not load seed artists from {_seed_file}: {e}")
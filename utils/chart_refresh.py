@@ -0,0 +1,149 @@
+# utils/chart_refresh.py
+"""
+Coordinates chart cache refreshes so each (chartType, language) is refreshed by
+at most one worker at a time.
+
+- In-process: a SingleFlight per chart key; background requests for a chart that
+  is already queued or running are dropped, synchronous callers join the running one.
+- Across processes: a short Mongo lease in `chart_refresh_leases` (one doc per key).
+- Refreshes run on a small bounded executor instead of a thread per request.
+
+Each refresh records its duration and outcome on the chart document under `lastRefresh`,
+and the number of consecutive failed refreshes under `refreshFailures`.
+"""
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone, timedelta
+
+from pymongo.errors import DuplicateKeyError
+
+from utils.single_flight import SingleFlight
+
+OWNER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _lease_id(chart_type, language):
+    return f"{chart_type}:{language or ''}"
+
+
+class ChartRefreshCoordinator:
+    def __init__(self, refresh_fn, get_db, max_workers=2, lease_seconds=300):
+        """`refresh_fn(chart_type, language)` performs the refresh and returns an outcome dict with a 'status'."""
+        self._refresh_fn = refresh_fn
+        self._get_db = get_db
+        self.lease_seconds = lease_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chart-refresh")
+        self._flight = SingleFlight()
+        self._queued = set()
+        self._lock = threading.Lock()
+
+    def refresh_async(self, chart_type, language=None) -> bool:
+        """Queue a background refresh unless one for this chart is already queued or running."""
+        key = (chart_type, language)
+        with self._lock:
+            if key in self._queued:
+                return False
+            self._queued.add(key)
+        self._executor.submit(self._run_queued, key)
+        return True
+
+    def refresh_now(self, chart_type, language=None, wait_seconds=15.0) -> dict:
+        """Refresh synchronously, joining an in-flight refresh of the same chart.
+
+        If another process holds the lease, waits up to `wait_seconds` for it to finish and
+        returns the outcome it recorded; {"status": "busy"} if that can't be determined in time.
+        """
+        outcome, _ = self._flight.do((chart_type, language), self._refresh_with_lease, chart_type, language)
+        if outcome.get("status") != "leased":
+            return outcome
+        waiting_since = datetime.now(timezone.utc)
+        deadline = time.monotonic() + wait_seconds
+        while time.monotonic() < deadline:
+            time.sleep(0.5)
+            if not self._lease_held(chart_type, language):
+                return self._recorded_outcome(chart_type, language, waiting_since)
+        return {"status": "busy", "reason": "another process is still refreshing"}
+
+    def _recorded_outcome(self, chart_type, language, waiting_since):
+        """The outcome another process recorded for the refresh we waited on."""
+        doc = self._get_db().charts.find_one({"chartType": chart_type, "language": language}, {"lastRefresh": 1}) or {}
+        last = doc.get("lastRefresh") or {}
+        started_at = last.get("startedAt")
+        if started_at is not None and started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        # Only a refresh that could have held the lease while we waited counts (not an older one)
+        if started_at is None or started_at < waiting_since - timedelta(seconds=self.lease_seconds):
+            return {"status": "busy", "reason": "other process finished without recording an outcome"}
+        outcome = {k: v for k, v in last.items() if k not in ("startedAt", "durationMs", "owner")}
+        outcome["by"] = last.get("owner")
+        return outcome
+
+    def _run_queued(self, key):
+        try:
+            self._flight.do(key, self._refresh_with_lease, *key)
+        except Exception as e:
+            print(f"[CHARTS] Background refresh of {key} failed: {e}")
+        finally:
+            with self._lock:
+                self._queued.discard(key)
+
+    # ----- cross-process lease -----
+
+    def _acquire_lease(self, chart_type, language) -> bool:
+        now = datetime.now(timezone.utc)
+        try:
+            self._get_db().chart_refresh_leases.find_one_and_update(
+                {"_id": _lease_id(chart_type, language), "expiresAt": {"$lt": now}},
+                {"$set": {"owner": OWNER_ID, "expiresAt": now + timedelta(seconds=self.lease_seconds)}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            # Doc exists with an unexpired lease held by someone else
+            return False
+
+    def _release_lease(self, chart_type, language):
+        self._get_db().chart_refresh_leases.delete_one({"_id": _lease_id(chart_type, language), "owner": OWNER_ID})
+
+    def _lease_held(self, chart_type, language) -> bool:
+        return self._get_db().chart_refresh_leases.find_one({
+            "_id": _lease_id(chart_type, language),
+            "expiresAt": {"$gte": datetime.now(timezone.utc)}
+        }) is not None
+
+    def _refresh_with_lease(self, chart_type, language):
+        if not self._acquire_lease(chart_type, language):
+            print(f"[CHARTS] {chart_type}/{language} is being refreshed by another process, skipping.")
+            return {"status": "leased"}
+
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        try:
+            try:
+                outcome = self._refresh_fn(chart_type, language) or {"status": "ok"}
+            except Exception as e:
+                outcome = {"status": "error", "error": str(e)}
+            self._record_outcome(chart_type, language, outcome, started_at, started)
+        finally:
+            # Released after the outcome is written, so processes waiting on the lease can read it
+            self._release_lease(chart_type, language)
+        return outcome
+
+    def _record_outcome(self, chart_type, language, outcome, started_at, started):
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        update = {"$set": {"lastRefresh": {
+            **outcome,
+            "startedAt": started_at,
+            "durationMs": duration_ms,
+            "owner": OWNER_ID
+        }}}
+        # Consecutive failures drive the scheduler's retry backoff
+        if outcome.get("status") == "ok":
+            update["$set"]["refreshFailures"] = 0
+        else:
+            update["$inc"] = {"refreshFailures": 1}
+        self._get_db().charts.update_one({"chartType": chart_type, "language": language}, update, upsert=True)
+        print(f"[CHARTS] Refreshed {chart_type}/{language}: {outcome.get('status')} in {duration_ms}ms")
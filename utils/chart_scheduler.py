@@ -0,0 +1,96 @@
+# utils/chart_scheduler.py
+"""
+Proactive chart refresh scheduler.
+
+Every `interval` seconds, each configured chart whose cache is missing or within
+`lead_fraction` of its freshness window from expiring is queued on the
+ChartRefreshCoordinator (which caps concurrency and dedupes in-flight refreshes).
+A stable per-chart jitter spreads refreshes out so charts cached together don't
+all expire and refresh together. The first tick runs at startup to warm missing charts.
+After failed refreshes a chart is retried with exponential backoff (from `interval`,
+capped at `max_backoff`) instead of on every tick.
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+
+
+class ChartScheduler:
+    def __init__(self, coordinator, get_db, charts_fn, interval=60.0, lead_fraction=0.1, jitter_fraction=0.05,
+                 max_backoff=3600.0):
+        """`charts_fn()` returns [(chart_type, language, fresh_hours), ...] for every configured chart."""
+        self._coordinator = coordinator
+        self._get_db = get_db
+        self._charts_fn = charts_fn
+        self.interval = interval
+        self.lead_fraction = lead_fraction
+        self.jitter_fraction = jitter_fraction
+        self.max_backoff = max_backoff
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def retry_at(self, chart_doc):
+        """Earliest retry after consecutive failed refreshes, or None if the last refresh didn't fail."""
+        failures = (chart_doc or {}).get("refreshFailures", 0)
+        started_at = ((chart_doc or {}).get("lastRefresh") or {}).get("startedAt")
+        if not failures or started_at is None:
+            return None
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        backoff = min(self.interval * 2 ** (failures - 1), self.max_backoff)
+        return started_at + timedelta(seconds=backoff)
+
+    def due_at(self, chart_doc, chart_type, language, fresh_hours):
+        """When this chart should next be refreshed, or None if it has never been tried."""
+        retry_at = self.retry_at(chart_doc)
+        last_updated = (chart_doc or {}).get("lastUpdated")
+        if last_updated is None:
+            return retry_at
+        if last_updated.tzinfo is None:
+            last_updated = last_updated.replace(tzinfo=timezone.utc)
+        window = timedelta(hours=fresh_hours)
+        # Seeded by chart and refresh time so the jitter is stable between ticks
+        jitter = random.Random(f"{chart_type}:{language}:{last_updated.isoformat()}").uniform(0, self.jitter_fraction)
+        due = last_updated + window * (1 - self.lead_fraction - jitter)
+        return max(due, retry_at) if retry_at else due
+
+    def tick(self) -> int:
+        """Queue refreshes for missing, nearly-expired or retry-due charts. Returns how many were queued."""
+        db = self._get_db()
+        now = datetime.now(timezone.utc)
+        queued = 0
+        for chart_type, language, fresh_hours in self._charts_fn():
+            doc = db.charts.find_one(
+                {"chartType": chart_type, "language": language},
+                {"lastUpdated": 1, "lastRefresh.startedAt": 1, "refreshFailures": 1}
+            )
+            due = self.due_at(doc, chart_type, language, fresh_hours)
+            if due is None or due <= now:
+                if self._coordinator.refresh_async(chart_type, language):
+                    queued += 1
+        if queued:
+            print(f"[CHARTS] Scheduler queued {queued} chart refreshes.")
+        return queued
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._loop, name="ChartScheduler")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _loop(self):
+        while True:
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"[CHARTS] Scheduler tick failed: {e}")
+            time.sleep(self.interval)
@@ -0,0 +1,140 @@
+# utils/circuit_breaker.py
+"""
+Per-source circuit breakers for upstream APIs.
+
+A breaker starts CLOSED and tracks the outcome of the last `window` requests.
+When the failure rate crosses `failure_threshold` (or the source reports a
+rate-limit cooldown), it goes OPEN and callers fail fast to their fallbacks
+until the cooldown passes. It then goes HALF_OPEN and lets a single probe
+request through: success closes it, failure re-opens it.
+"""
+import threading
+from collections import deque
+from datetime import datetime, timezone, timedelta
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+def _as_utc(value):
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        # Mongo hands back naive UTC datetimes
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+class CircuitBreaker:
+    def __init__(self, source, window=20, min_requests=5, failure_threshold=0.5, open_seconds=60):
+        self.source = source
+        self.window = window
+        self.min_requests = min_requests
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.open_until = None
+        self._outcomes = deque(maxlen=window)
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a network request to this source may go out right now."""
+        with self._lock:
+            if self.state == OPEN:
+                if datetime.now(timezone.utc) < self.open_until:
+                    return False
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            if self.state == HALF_OPEN:
+                print(f"[CIRCUIT] {self.source}: probe succeeded, closing breaker.")
+                self._outcomes.clear()
+            self.state = CLOSED
+            self.open_until = None
+            self._probe_in_flight = False
+            self._outcomes.append(True)
+
+    def record_failure(self, cooldown_until=None):
+        with self._lock:
+            self._outcomes.append(False)
+            cooldown_until = _as_utc(cooldown_until)
+            if cooldown_until and cooldown_until > datetime.now(timezone.utc):
+                self._open(cooldown_until, "rate limited")
+            elif self.state == HALF_OPEN:
+                self._open(datetime.now(timezone.utc) + timedelta(seconds=self.open_seconds), "probe failed")
+            elif len(self._outcomes) >= self.min_requests and self.failure_rate() >= self.failure_threshold:
+                self._open(datetime.now(timezone.utc) + timedelta(seconds=self.open_seconds),
+                           f"failure rate {self.failure_rate():.0%}")
+
+    def trip_until(self, until):
+        """Force the breaker open until `until` (e.g. a persisted cooldownUntil)."""
+        until = _as_utc(until)
+        if until and until > datetime.now(timezone.utc):
+            with self._lock:
+                self._open(until, "cooldown")
+
+    def _open(self, until, reason):
+        if self.state == OPEN and self.open_until and self.open_until > until:
+            until = self.open_until
+        if self.state != OPEN:
+            print(f"[CIRCUIT] {self.source}: opening breaker until {until.isoformat()} ({reason}).")
+        self.state = OPEN
+        self.open_until = until
+        self._probe_in_flight = False
+
+    def failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            state = self.state
+            if state == OPEN and datetime.now(timezone.utc) >= self.open_until:
+                state = HALF_OPEN
+            return {
+                "state": state,
+                "openUntil": self.open_until.isoformat() if self.open_until else None,
+                "failureRate": round(self.failure_rate(), 3),
+                "recentRequests": len(self._outcomes)
+            }
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(source, cooldown_loader=None) -> CircuitBreaker:
+    """Process-wide breaker for `source`. `cooldown_loader(source)` seeds it from persisted health on first use."""
+    breaker = _breakers.get(source)
+    if breaker is not None:
+        return breaker
+    with _breakers_lock:
+        breaker = _breakers.get(source)
+        if breaker is None:
+            breaker = CircuitBreaker(source)
+            if cooldown_loader:
+                try:
+                    breaker.trip_until(cooldown_loader(source))
+                except Exception as e:
+                    print(f"[CIRCUIT] Could not load cooldown for {source}: {e}")
+            _breakers[source] = breaker
+    return breaker
+
+
+def breaker_snapshots() -> dict:
+    return {source: breaker.snapshot() for source, breaker in list(_breakers.items())}
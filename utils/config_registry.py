@@ -0,0 +1,106 @@
+# utils/config_registry.py
+"""
+In-memory registry for a JSON config file with hot reload.
+
+The file is parsed and validated once; readers get an immutable snapshot and do
+no file I/O. A watcher thread reloads when the file's mtime changes, and SIGHUP
+reloads every registry immediately (where the platform has it). A reload that
+fails to parse or validate keeps the previous snapshot.
+"""
+import json
+import os
+import signal
+import threading
+import time
+from types import MappingProxyType
+
+_registries = []
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _reload_all(signum=None, frame=None):
+    for registry in list(_registries):
+        registry.reload(force=True)
+
+
+class ConfigRegistry:
+    def __init__(self, path, validate=None, poll_interval=2.0, name=None):
+        """`validate(data)` may print warnings and raises ValueError to reject a config."""
+        self.path = path
+        self.name = name or os.path.basename(path)
+        self._validate = validate
+        self.poll_interval = poll_interval
+        self._snapshot = MappingProxyType({})
+        self._mtime = None
+        self.available = False
+        self.loaded_at = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self.reload(force=True)
+        _registries.append(self)
+
+    def snapshot(self):
+        """Current config as a read-only mapping (nested dicts/lists frozen too)."""
+        return self._snapshot
+
+    def get(self, key, default=None):
+        return self._snapshot.get(key, default)
+
+    def reload(self, force=False) -> bool:
+        """Re-read the file if its mtime changed (or `force`). Returns True if a new snapshot was installed."""
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except FileNotFoundError:
+                if self.available or force:
+                    print(f"[CONFIG] {self.path} not found.")
+                self._snapshot, self._mtime, self.available = MappingProxyType({}), None, False
+                return False
+            if not force and mtime == self._mtime:
+                return False
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if self._validate:
+                    self._validate(data)
+            except Exception as e:
+                print(f"[CONFIG] Failed to load {self.path}, keeping previous config: {e}")
+                self._mtime = mtime
+                return False
+            self._snapshot = _freeze(data)
+            self._mtime = mtime
+            self.available = True
+            self.loaded_at = time.time()
+            print(f"[CONFIG] Loaded {self.name}.")
+            return True
+
+    def start(self):
+        """Start the mtime watcher and install the SIGHUP handler (main thread only)."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._watch_loop, name=f"ConfigWatcher:{self.name}")
+            self._thread.daemon = True
+            self._thread.start()
+        if hasattr(signal, "SIGHUP") and threading.current_thread() is threading.main_thread():
+            try:
+                signal.signal(signal.SIGHUP, _reload_all)
+            except ValueError:
+                pass
+
+    def _watch_loop(self):
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"[CONFIG] Watching {self.path} failed: {e}")
@@ -0,0 +1,113 @@
+# utils/featured_feed.py
+"""
+Background-refreshed feed of home page sections.
+
+Sections come from a config snapshot ({"ttlSeconds", "sections": [{"id", "title", ...}]}).
+All sections are refreshed in parallel every ttlSeconds and served from memory.
+A section whose refresh fails or comes back empty keeps its last good tracks
+(stale-if-error). Last good tracks are also kept in Mongo so a restart serves
+the previous feed instead of an empty home page.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+
+class FeaturedFeed:
+    def __init__(self, fetch_section, get_config, get_db, max_workers=4):
+        """`fetch_section(section_cfg)` returns the section's tracks or raises."""
+        self._fetch_section = fetch_section
+        self._get_config = get_config
+        self._get_db = get_db
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="featured")
+        self._sections = {}
+        self._ready = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def ttl_seconds(self):
+        return float(self._get_config().get("ttlSeconds", 1800))
+
+    def _load_persisted(self):
+        try:
+            for doc in self._get_db().featured_sections.find({}):
+                self._sections[doc["_id"]] = {
+                    "tracks": doc.get("tracks", []),
+                    "refreshedAt": doc.get("refreshedAt"),
+                    "error": None
+                }
+        except Exception as e:
+            print(f"[FEATURED] Could not load persisted sections: {e}")
+        if self._sections:
+            self._ready.set()
+
+    def _refresh_section(self, section):
+        section_id = section["id"]
+        try:
+            tracks = self._fetch_section(section)
+            error = None if tracks else "empty result"
+        except Exception as e:
+            tracks, error = [], str(e)
+
+        previous = self._sections.get(section_id)
+        if error:
+            print(f"[FEATURED] Section '{section_id}' refresh failed ({error}); serving previous tracks.")
+            self._sections[section_id] = dict(previous or {"tracks": [], "refreshedAt": None}, error=error)
+            return False
+
+        now = datetime.now(timezone.utc)
+        self._sections[section_id] = {"tracks": tracks, "refreshedAt": now, "error": None}
+        try:
+            self._get_db().featured_sections.update_one(
+                {"_id": section_id},
+                {"$set": {"tracks": tracks, "refreshedAt": now}},
+                upsert=True
+            )
+        except Exception as e:
+            print(f"[FEATURED] Could not persist section '{section_id}': {e}")
+        return True
+
+    def refresh(self) -> int:
+        """Refresh every configured section in parallel. Returns how many refreshed successfully."""
+        sections = list(self._get_config().get("sections", []))
+        refreshed = sum(1 for ok in self._executor.map(self._refresh_section, sections) if ok)
+        self._ready.set()
+        print(f"[FEATURED] Refreshed {refreshed}/{len(sections)} sections.")
+        return refreshed
+
+    def sections(self, wait_seconds=0.0):
+        """Configured sections that have tracks, in config order. Optionally waits for the first refresh."""
+        if wait_seconds and not self._ready.is_set():
+            self._ready.wait(wait_seconds)
+        result = []
+        for section in self._get_config().get("sections", []):
+            state = self._sections.get(section["id"])
+            if state and state["tracks"]:
+                result.append({
+                    "id": section["id"],
+                    "title": section["title"],
+                    "tracks": state["tracks"],
+                    "stale": state["error"] is not None
+                })
+        return result
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._load_persisted()
+            self._thread = threading.Thread(target=self._loop, name="FeaturedFeed")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _loop(self):
+        while True:
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"[FEATURED] Refresh failed: {e}")
+            time.sleep(self.ttl_seconds)
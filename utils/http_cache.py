@@ -0,0 +1,261 @@
+# utils/http_cache.py
+"""
+Disk-backed HTTP response cache for slow-changing upstream APIs.
+
+Responses are stored in a local SQLite file keyed by the normalized URL plus
+sorted query params. Fresh entries are served without touching the network;
+expired entries are revalidated with If-None-Match / If-Modified-Since when the
+upstream sent an ETag or Last-Modified, and served stale if the upstream is
+unreachable. TTLs are per source host (see SOURCE_TTLS).
+
+    from utils.http_cache import cached_get
+    r = cached_get("https://musicbrainz.org/ws/2/artist/...", headers=..., timeout=5)
+    if r.status_code == 200: data = r.json()
+"""
+import hashlib
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+import requests
+
+from utils.http_client import http_get
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_PATH = os.getenv("HTTP_CACHE_PATH", os.path.join(BASE_DIR, "database", "http_cache.db"))
+CACHE_DISABLED = os.getenv("HTTP_CACHE_DISABLED", "false").lower() == "true"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Freshness lifetime per upstream host (seconds)
+SOURCE_TTLS = {
+    "musicbrainz.org": 7 * DAY,
+    "coverartarchive.org": 30 * DAY,
+    "api.deezer.com": DAY,
+    "ws.audioscrobbler.com": DAY,
+    "query.wikidata.org": 7 * DAY,
+    "lrclib.net": 30 * DAY,
+    "itunes.apple.com": DAY,
+    "rss.applemarketingtools.com": 3 * HOUR,
+}
+DEFAULT_TTL = HOUR
+
+# Minimum spacing between network requests per host (MusicBrainz allows 1 req/s).
+# Applied only when the cache actually goes to the network.
+HOST_MIN_INTERVAL = {
+    "musicbrainz.org": 1.0,
+}
+
+# How long past expiry an entry is kept for revalidation / stale-if-error
+MAX_STALE = 30 * DAY
+
+class NetworkBlocked(Exception):
+    """A guard (e.g. an open circuit breaker) vetoed the network trip and nothing was cached."""
+
+
+_local = threading.local()
+_stats_lock = threading.Lock()
+_stats = {}
+# next() on itertools.count is atomic, so concurrent writers never share or skip a number
+_write_counter = itertools.count(1)
+_throttle_lock = threading.Lock()
+_next_slot = {}
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response built from a cache row."""
+
+    def __init__(self, url, status_code, headers, content, cache_status="hit", error=None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.content = content or b""
+        # hit | revalidated | stale (upstream failed) | blocked (guard vetoed the network trip)
+        self.cache_status = cache_status
+        self.error = error
+        self.from_cache = True
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+def _get_conn():
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(CACHE_PATH, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                url TEXT,
+                host TEXT,
+                status INTEGER,
+                headers TEXT,
+                body BLOB,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL,
+                expires_at REAL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_expires ON http_cache (expires_at)")
+        conn.commit()
+        _local.conn = conn
+    return conn
+
+
+def normalize_url(url, params=None):
+    """Lowercase scheme/host and merge + sort query params so equivalent requests share a key."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        items = params.items() if isinstance(params, dict) else params
+        query.extend((str(k), str(v)) for k, v in items if v is not None)
+    query.sort()
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+
+def _record(host, outcome):
+    with _stats_lock:
+        host_stats = _stats.setdefault(host, {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0})
+        host_stats[outcome] += 1
+
+
+def cache_stats():
+    """Hit/miss counters per host plus totals, for the health endpoint."""
+    with _stats_lock:
+        per_host = {h: dict(v) for h, v in _stats.items()}
+    totals = {"hits": 0, "misses": 0, "revalidated": 0, "stale": 0}
+    for v in per_host.values():
+        for k in totals:
+            totals[k] += v[k]
+    lookups = sum(totals.values())
+    served = totals["hits"] + totals["revalidated"] + totals["stale"]
+    totals["hitRate"] = round(served / lookups, 3) if lookups else 0.0
+    return {"enabled": not CACHE_DISABLED, "totals": totals, "hosts": per_host}
+
+
+def _ttl_for(host):
+    for suffix, ttl in SOURCE_TTLS.items():
+        if host == suffix or host.endswith("." + suffix):
+            return ttl
+    return DEFAULT_TTL
+
+
+def _throttle(host):
+    interval = HOST_MIN_INTERVAL.get(host)
+    if not interval:
+        return
+    with _throttle_lock:
+        now = time.monotonic()
+        slot = max(now, _next_slot.get(host, 0.0))
+        _next_slot[host] = slot + interval
+    if slot > now:
+        time.sleep(slot - now)
+
+
+def _store(conn, key, url, host, resp, ttl):
+    cache_control = resp.headers.get("Cache-Control", "").lower()
+    if "no-store" in cache_control:
+        return
+    now = time.time()
+    kept_headers = {k: resp.headers[k] for k in ("Content-Type", "ETag", "Last-Modified") if k in resp.headers}
+    conn.execute(
+        "INSERT OR REPLACE INTO http_cache (key, url, host, status, headers, body, etag, last_modified, fetched_at, expires_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (key, url, host, resp.status_code, json.dumps(kept_headers), resp.content,
+         resp.headers.get("ETag"), resp.headers.get("Last-Modified"), now, now + ttl)
+    )
+    conn.commit()
+
+    if next(_write_counter) % 500 == 0:
+        conn.execute("DELETE FROM http_cache WHERE expires_at < ?", (now - MAX_STALE,))
+        conn.commit()
+
+
+def _cached_response(full_url, row, cache_status, error=None):
+    return CachedResponse(full_url, row[0], json.loads(row[1] or "{}"), row[2], cache_status, error)
+
+
+def cached_get(url, params=None, headers=None, timeout=5, ttl=None, guard=None, **kwargs):
+    """GET through the disk cache. Only 200 responses are stored; anything else passes through.
+
+    `guard` is an optional zero-arg callable consulted only when a network trip is
+    needed; if it returns False the stale copy is served, or NetworkBlocked is raised.
+    """
+    if CACHE_DISABLED:
+        if guard and not guard():
+            raise NetworkBlocked(url)
+        return http_get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+
+    full_url = normalize_url(url, params)
+    host = urlsplit(full_url).hostname or ""
+    key = hashlib.sha1(full_url.encode("utf-8")).hexdigest()
+    ttl = ttl if ttl is not None else _ttl_for(host)
+
+    try:
+        conn = _get_conn()
+        row = conn.execute(
+            "SELECT status, headers, body, etag, last_modified, expires_at FROM http_cache WHERE key = ?", (key,)
+        ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[HTTP_CACHE] Cache unavailable, going to network: {e}")
+        if guard and not guard():
+            raise NetworkBlocked(url)
+        return http_get(url, params=params, headers=headers, timeout=timeout, **kwargs)
+
+    if row and row[5] > time.time():
+        _record(host, "hits")
+        return _cached_response(full_url, row, "hit")
+
+    if guard and not guard():
+        if row:
+            _record(host, "stale")
+            return _cached_response(full_url, row, "blocked")
+        raise NetworkBlocked(url)
+
+    request_headers = dict(headers or {})
+    if row:
+        if row[3]:
+            request_headers["If-None-Match"] = row[3]
+        if row[4]:
+            request_headers["If-Modified-Since"] = row[4]
+
+    try:
+        _throttle(host)
+        resp = http_get(url, params=params, headers=request_headers, timeout=timeout, **kwargs)
+    except requests.RequestException as e:
+        if row:
+            # Upstream unreachable: serve the stale copy rather than failing the caller
+            _record(host, "stale")
+            return _cached_response(full_url, row, "stale", error=str(e))
+        raise
+
+    if resp.status_code == 304 and row:
+        _record(host, "revalidated")
+        conn.execute("UPDATE http_cache SET fetched_at = ?, expires_at = ? WHERE key = ?",
+                     (time.time(), time.time() + ttl, key))
+        conn.commit()
+        return _cached_response(full_url, row, "revalidated")
+
+    _record(host, "misses")
+    if resp.status_code == 200:
+        try:
+            _store(conn, key, full_url, host, resp, ttl)
+        except sqlite3.Error as e:
+            print(f"[HTTP_CACHE] Failed to store {host} response: {e}")
+    return resp
@@ -0,0 +1,133 @@
+# utils/http_client.py
+"""
+Shared HTTP client for every upstream call.
+
+One requests.Session for the whole process, so connections are kept alive and
+reused instead of paying a TCP+TLS handshake per call. Each host gets its own
+urllib3 connection pool (sized per host via HOST_POOL_SIZES); idempotent requests
+are retried with exponential backoff on connection errors and 5xx (never on read
+timeouts, so a caller's timeout isn't multiplied); every call gets a default
+timeout; and per-host latency/error counters are kept for the health endpoint.
+Callers with their own fallback (mirror hedging, a tight user-facing budget)
+pass retry=False.
+
+    from utils.http_client import http_get
+    r = http_get(f"{SAAVN_BASE}/search", params={"query": q})
+"""
+import os
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds, used when the caller doesn't pass a timeout
+DEFAULT_TIMEOUT = (3.05, float(os.getenv("HTTP_DEFAULT_READ_TIMEOUT", "10")))
+DEFAULT_POOL_SIZE = int(os.getenv("HTTP_POOL_SIZE", "10"))
+MAX_POOLS = 64
+
+# Connections kept per host; hosts with tight rate limits get small pools
+HOST_POOL_SIZES = {
+    "musicbrainz.org": 2,
+    "saavn.sumit.co": 16,
+    "saavn.dev": 16,
+    "www.googleapis.com": 8,
+    "api.deezer.com": 8,
+    "lrclib.net": 8,
+}
+
+RETRY_STATUSES = (500, 502, 503, 504)
+LATENCY_SAMPLES = 200
+
+_sessions = {}
+_session_lock = threading.Lock()
+_stats_lock = threading.Lock()
+_stats = {}
+
+
+def _retry_policy():
+    return Retry(
+        total=int(os.getenv("HTTP_RETRIES", "2")),
+        # A read timeout means the server may still be working; retrying it just stacks timeouts
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+        # Upstream Retry-After values can be minutes; rate limits are handled by the callers' breakers
+        respect_retry_after_header=False,
+        raise_on_status=False
+    )
+
+
+def _build_session(retry):
+    session = requests.Session()
+    retries = _retry_policy() if retry else 0
+    default_adapter = HTTPAdapter(pool_connections=MAX_POOLS, pool_maxsize=DEFAULT_POOL_SIZE, max_retries=retries)
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+    for host, size in HOST_POOL_SIZES.items():
+        session.mount(f"https://{host}", HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=retries))
+    return session
+
+
+def get_session(retry=True):
+    """The shared session; retry=False gets its no-retry twin (same pool sizes)."""
+    session = _sessions.get(retry)
+    if session is None:
+        with _session_lock:
+            session = _sessions.get(retry)
+            if session is None:
+                session = _sessions[retry] = _build_session(retry)
+    return session
+
+
+def _record(host, elapsed_ms, error):
+    with _stats_lock:
+        host_stats = _stats.get(host)
+        if host_stats is None:
+            host_stats = _stats[host] = {"requests": 0, "errors": 0, "totalMs": 0.0, "samples": deque(maxlen=LATENCY_SAMPLES)}
+        host_stats["requests"] += 1
+        host_stats["totalMs"] += elapsed_ms
+        host_stats["samples"].append(elapsed_ms)
+        if error:
+            host_stats["errors"] += 1
+
+
+def client_stats():
+    """Per-host request count, error count and latency (avg/p50/p95 over recent calls)."""
+    with _stats_lock:
+        snapshot = {h: (v["requests"], v["errors"], v["totalMs"], sorted(v["samples"])) for h, v in _stats.items()}
+    hosts = {}
+    for host, (count, errors, total_ms, samples) in snapshot.items():
+        hosts[host] = {
+            "requests": count,
+            "errors": errors,
+            "avgMs": round(total_ms / count, 1) if count else 0.0,
+            "p50Ms": round(samples[len(samples) // 2], 1) if samples else None,
+            "p95Ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1) if samples else None
+        }
+    return {"hosts": hosts}
+
+
+def http_request(method, url, timeout=None, retry=True, **kwargs):
+    """Session request with the default timeout; records per-host latency. Raises like requests does."""
+    host = urlsplit(url).hostname or ""
+    started = time.perf_counter()
+    error = True
+    try:
+        resp = get_session(retry).request(method, url, timeout=timeout or DEFAULT_TIMEOUT, **kwargs)
+        error = resp.status_code >= 500
+        return resp
+    finally:
+        _record(host, (time.perf_counter() - started) * 1000, error)
+
+
+def http_get(url, params=None, **kwargs):
+    return http_request("GET", url, params=params, **kwargs)
+
+
+def http_post(url, data=None, json=None, **kwargs):
+    return http_request("POST", url, data=data, json=json, **kwargs)
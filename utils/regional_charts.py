@@ -0,0 +1,105 @@
+# utils/regional_charts.py
+"""
+Cross-storefront chart aggregation for regional charts (asia, ...).
+
+Storefront feeds are fetched concurrently under one total deadline; storefronts
+that fail or miss the deadline are left out, so a slow storefront costs at most
+the deadline rather than adding to the refresh time. Merging the per-storefront
+rankings into one chart is pluggable via MERGE_STRATEGIES.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from utils.http_cache import cached_get
+
+APPLE_RSS_URL = "https://rss.applemarketingtools.com/api/v2/{storefront}/music/most-played/{limit}/songs.json"
+
+# Not used as a context manager: stragglers past the deadline finish in the background
+_storefront_executor = ThreadPoolExecutor(max_workers=12, thread_name_prefix="storefront")
+
+
+def _fetch_storefront(storefront, limit, timeout):
+    res = cached_get(APPLE_RSS_URL.format(storefront=storefront, limit=limit), timeout=timeout)
+    if not res.ok:
+        raise RuntimeError(f"HTTP {res.status_code}")
+    entries = []
+    for track in res.json().get("feed", {}).get("results", []):
+        entries.append({
+            "title": track.get("name", ""),
+            "artist": track.get("artistName", ""),
+            "cover": track.get("artworkUrl100", "").replace("100x100bb.jpg", "500x500bb.jpg"),
+            "apple_id": track.get("id", "")
+        })
+    return entries
+
+
+def fetch_storefronts(storefronts, limit=25, deadline=8.0, timeout=5):
+    """{storefront: [entries in rank order]} for every storefront that answered within `deadline` seconds."""
+    started = time.perf_counter()
+    futures = {_storefront_executor.submit(_fetch_storefront, sf, limit, timeout): sf for sf in storefronts}
+    done, pending = wait(futures, timeout=deadline)
+
+    results = {}
+    for future in done:
+        sf = futures[future]
+        try:
+            results[sf] = future.result()
+        except Exception as ex:
+            print(f"[music] Regional chart: storefront {sf} failed: {ex}")
+    # Configured order, not completion order, so merge winners and ties are stable between runs
+    charts = {sf: results[sf] for sf in storefronts if sf in results}
+    for future in pending:
+        future.cancel()
+    if pending:
+        print(f"[music] Regional chart: storefronts {sorted(futures[f] for f in pending)} missed the {deadline}s deadline")
+    print(f"[music] Regional chart: {len(charts)}/{len(storefronts)} storefronts in {time.perf_counter() - started:.2f}s")
+    return charts
+
+
+def _group_by_track(charts):
+    track_data = {}
+    for sf, entries in charts.items():
+        for rank, entry in enumerate(entries, 1):
+            key = (entry["title"].lower().strip(), entry["artist"].lower().strip())
+            if key not in track_data:
+                track_data[key] = dict(entry, ranks={})
+            track_data[key]["ranks"][sf] = rank
+    return track_data
+
+
+def merge_frequency_rank(charts, limit):
+    """Tracks charting in the most storefronts first, ties broken by average position."""
+    ranked = []
+    for data in _group_by_track(charts).values():
+        freq = len(data["ranks"])
+        ranked.append((-freq, sum(data["ranks"].values()) / freq, data))
+    ranked.sort(key=lambda x: (x[0], x[1]))
+    return [data for _, _, data in ranked[:limit]]
+
+
+def merge_borda(charts, limit):
+    """Borda count: each storefront awards (feed length - rank + 1) points, so depth of chart position counts too."""
+    sizes = {sf: len(entries) for sf, entries in charts.items()}
+    scored = []
+    for data in _group_by_track(charts).values():
+        points = sum(sizes[sf] - rank + 1 for sf, rank in data["ranks"].items())
+        scored.append((-points, data))
+    scored.sort(key=lambda x: x[0])
+    return [data for _, data in scored[:limit]]
+
+
+MERGE_STRATEGIES = {
+    "frequency_rank": merge_frequency_rank,
+    "borda": merge_borda
+}
+
+
+def aggregate_regional_chart(region_cfg, limit=50):
+    """Fetch a region's storefronts and merge them; each result carries title, artist, cover, apple_id and ranks."""
+    charts = fetch_storefronts(
+        region_cfg["storefronts"],
+        limit=region_cfg.get("perStorefront", 25),
+        deadline=region_cfg.get("deadlineSeconds", 8.0)
+    )
+    merge = MERGE_STRATEGIES[region_cfg.get("merge", "frequency_rank")]
+    return merge(charts, limit)
@@ -0,0 +1,274 @@
+# utils/saavn_client.py
+"""
+JioSaavn API client over a pool of interchangeable mirrors.
+
+Each mirror's latency (EWMA plus recent samples) and error rate (EWMA, decaying
+while the mirror gets no traffic) are tracked from real traffic. Requests go to
+the best-scoring mirror; if it hasn't answered within its own p95 latency (timed
+from when the request actually starts, not from when it was queued), a hedged
+duplicate is sent to the next mirror and the caller gets whichever non-5xx answer
+arrives first. Hedges run on a small pool, are skipped when that pool is busy, and
+are capped at HEDGE_MAX_FRACTION of requests. 4xx answers are real answers; only
+connection errors and 5xx count against a mirror.
+
+    from utils.saavn_client import saavn_get
+    r = saavn_get("/search/songs", params={"query": q, "limit": 10})
+"""
+import os
+import heapq
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.http_client import http_get
+
+SAAVN_MIRRORS = [m.strip().rstrip("/") for m in os.getenv(
+    "SAAVN_MIRRORS", "https://saavn.sumit.co/api,https://saavn.dev/api"
+).split(",") if m.strip()]
+
+EWMA_ALPHA = 0.2
+# Assumed latency for a mirror with no samples yet, so it still gets tried
+UNKNOWN_LATENCY_MS = 400.0
+# Hedge after the primary's p95, clamped to this range; the default applies until enough samples exist
+HEDGE_MIN_MS = 150.0
+HEDGE_MAX_MS = 3000.0
+HEDGE_DEFAULT_MS = 800.0
+HEDGE_MIN_SAMPLES = 20
+# At most this share of requests may be hedged (token bucket, small burst allowed)
+HEDGE_MAX_FRACTION = float(os.getenv("SAAVN_HEDGE_MAX_FRACTION", "0.1"))
+HEDGE_BURST = 5.0
+LATENCY_SAMPLES = 100
+# A mirror's error rate halves every this many seconds, so one that stopped getting traffic is retried
+ERROR_HALF_LIFE_SECONDS = 120.0
+
+
+class _MirrorStats:
+    def __init__(self):
+        self.ewma_ms = None
+        self.error_rate = 0.0
+        self.error_rate_at = time.monotonic()
+        self.samples = deque(maxlen=LATENCY_SAMPLES)
+        self.requests = 0
+        self.errors = 0
+        self.hedges_won = 0
+
+    def current_error_rate(self, now=None):
+        elapsed = (now or time.monotonic()) - self.error_rate_at
+        return self.error_rate * 0.5 ** (elapsed / ERROR_HALF_LIFE_SECONDS)
+
+    def score(self):
+        latency = self.ewma_ms if self.ewma_ms is not None else UNKNOWN_LATENCY_MS
+        return latency * (1 + 4 * self.current_error_rate())
+
+    def p95(self):
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class _HedgeTimer:
+    """One daemon thread that runs callbacks at their deadlines (instead of a timer thread per request)."""
+
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def schedule(self, delay, fn):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="SaavnHedgeTimer")
+                self._thread.daemon = True
+                self._thread.start()
+            self._seq += 1
+            heapq.heappush(self._heap, (time.monotonic() + delay, self._seq, fn))
+            self._cond.notify()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._cond.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                _, _, fn = heapq.heappop(self._heap)
+            try:
+                fn()
+            except Exception as e:
+                print(f"[SAAVN] Hedge callback failed: {e}")
+
+
+class _Attempt:
+    """Outcomes of one get(): the primary request and its (possible) hedge, first good answer wins."""
+
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.launched = 1
+        self.primary_done = False
+        self.outcomes = []   # [(mirror, response or None, error or None)]
+
+    def add(self, mirror, resp, error, primary=False):
+        with self.cond:
+            self.outcomes.append((mirror, resp, error))
+            if primary:
+                self.primary_done = True
+            self.cond.notify_all()
+
+    def winner(self):
+        return next(((m, r) for m, r, _ in self.outcomes if r is not None and r.status_code < 500), None)
+
+    def wait(self):
+        """Block until a good answer arrives or every launched request has finished."""
+        with self.cond:
+            while self.winner() is None and not (self.primary_done and len(self.outcomes) >= self.launched):
+                self.cond.wait()
+            return self.winner()
+
+
+class SaavnClient:
+    def __init__(self, mirrors, max_workers=4, primary_workers=64):
+        self.mirrors = list(mirrors)
+        self._stats = {m: _MirrorStats() for m in self.mirrors}
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        # Primaries run off the caller's thread so a hedge can answer first; hedges get their own small pool
+        self._primary_executor = ThreadPoolExecutor(max_workers=primary_workers, thread_name_prefix="saavn")
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="saavn-hedge")
+        self._timer = _HedgeTimer()
+        self._hedges_active = 0
+        self._hedge_tokens = HEDGE_BURST
+        self._hedges_sent = 0
+        self._hedges_skipped = 0
+
+    def _record(self, mirror, elapsed_ms, failed):
+        with self._lock:
+            stats = self._stats[mirror]
+            now = time.monotonic()
+            stats.requests += 1
+            stats.errors += int(failed)
+            stats.error_rate = (1 - EWMA_ALPHA) * stats.current_error_rate(now) + EWMA_ALPHA * (1.0 if failed else 0.0)
+            stats.error_rate_at = now
+            if not failed:
+                stats.samples.append(elapsed_ms)
+                stats.ewma_ms = elapsed_ms if stats.ewma_ms is None else (1 - EWMA_ALPHA) * stats.ewma_ms + EWMA_ALPHA * elapsed_ms
+
+    def ranked_mirrors(self):
+        with self._lock:
+            return sorted(self.mirrors, key=lambda m: self._stats[m].score())
+
+    def _hedge_delay(self, mirror):
+        with self._lock:
+            stats = self._stats[mirror]
+            if len(stats.samples) < HEDGE_MIN_SAMPLES:
+                return HEDGE_DEFAULT_MS / 1000.0
+            return min(max(stats.p95(), HEDGE_MIN_MS), HEDGE_MAX_MS) / 1000.0
+
+    def _call(self, mirror, path, params, timeout):
+        started = time.perf_counter()
+        try:
+            # No transport retries: the mirror fallback and hedge already cover a failed call
+            resp = http_get(f"{mirror}{path}", params=params, timeout=timeout, retry=False)
+        except Exception:
+            self._record(mirror, (time.perf_counter() - started) * 1000, True)
+            raise
+        self._record(mirror, (time.perf_counter() - started) * 1000, resp.status_code >= 500)
+        return resp
+
+    def _take_hedge_slot(self):
+        """A hedge may go out only if a pool worker is idle and the hedge budget has a token."""
+        with self._lock:
+            if self._hedges_active >= self._max_workers or self._hedge_tokens < 1:
+                self._hedges_skipped += 1
+                return False
+            self._hedge_tokens -= 1
+            self._hedges_active += 1
+            self._hedges_sent += 1
+            return True
+
+    def _run(self, attempt, mirror, path, params, timeout, primary=False):
+        try:
+            resp, error = self._call(mirror, path, params, timeout), None
+        except Exception as e:
+            resp, error = None, e
+        finally:
+            if not primary:
+                with self._lock:
+                    self._hedges_active -= 1
+        attempt.add(mirror, resp, error, primary=primary)
+
+    def _run_primary(self, attempt, ranked, path, params, timeout):
+        # The hedge clock starts now, when the request really goes out, not when get() queued it
+        if len(ranked) > 1:
+            self._timer.schedule(self._hedge_delay(ranked[0]),
+                                 lambda: self._maybe_hedge(attempt, ranked[1], path, params, timeout))
+        self._run(attempt, ranked[0], path, params, timeout, primary=True)
+
+    def _maybe_hedge(self, attempt, mirror, path, params, timeout):
+        with attempt.cond:
+            if attempt.primary_done or not self._take_hedge_slot():
+                return
+            attempt.launched += 1
+        self._executor.submit(self._run, attempt, mirror, path, params, timeout)
+
+    def get(self, path, params=None, timeout=10):
+        """GET `path` (e.g. "/search/songs") from the best mirror, racing a hedge to the next one when it's slow."""
+        ranked = self.ranked_mirrors()
+        primary = ranked[0]
+        attempt = _Attempt()
+        with self._lock:
+            self._hedge_tokens = min(self._hedge_tokens + HEDGE_MAX_FRACTION, HEDGE_BURST)
+        self._primary_executor.submit(self._run_primary, attempt, ranked, path, params, timeout)
+
+        won = attempt.wait()
+        if won is not None:
+            mirror, resp = won
+            if mirror != primary:
+                with self._lock:
+                    self._stats[mirror].hedges_won += 1
+            return resp
+
+        # Everything we tried failed: fall back to the next untried mirror once
+        with attempt.cond:
+            outcomes = list(attempt.outcomes)
+        tried = {m for m, _, _ in outcomes}
+        last_response = next((r for _, r, _ in reversed(outcomes) if r is not None), None)
+        last_error = next((e for _, _, e in reversed(outcomes) if e is not None), None)
+        for mirror in ranked:
+            if mirror not in tried:
+                try:
+                    resp = self._call(mirror, path, params, timeout)
+                    if resp.status_code < 500:
+                        return resp
+                    last_response = resp
+                except Exception as e:
+                    last_error = e
+                break
+        if last_response is not None:
+            return last_response
+        raise last_error
+
+    def stats(self):
+        with self._lock:
+            return {
+                "mirrors": {
+                    m: {
+                        "ewmaMs": round(s.ewma_ms, 1) if s.ewma_ms is not None else None,
+                        "errorRate": round(s.current_error_rate(), 3),
+                        "requests": s.requests,
+                        "errors": s.errors,
+                        "hedgesWon": s.hedges_won
+                    }
+                    for m, s in self._stats.items()
+                },
+                "hedges": {
+                    "sent": self._hedges_sent,
+                    "skipped": self._hedges_skipped,
+                    "active": self._hedges_active
+                }
+            }
+
+
+saavn_client = SaavnClient(SAAVN_MIRRORS)
+
+
+def saavn_get(path, params=None, timeout=10):
+    return saavn_client.get(path, params=params, timeout=timeout)
@@ -0,0 +1,53 @@
+# utils/single_flight.py
+"""
+In-process single-flight: concurrent calls for the same key share one execution.
+
+    flight = SingleFlight()
+    result, shared = flight.do(("worldwide", None), refresh_chart, "worldwide")
+
+The first caller for a key runs the function; callers arriving while it is in
+flight block until it finishes and receive the same result (or exception).
+"""
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) once per in-flight key. Returns (result, shared)."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self, key) -> bool:
+        with self._lock:
+            return key in self._calls
@@ -0,0 +1,173 @@
+# utils/source_metrics.py
+"""
+In-process request metrics per upstream source.
+
+Adapters record every upstream call here instead of writing to Mongo. Counters,
+a latency histogram and the last error accumulate in memory and are flushed to
+the `source_health` collection as one $inc/$set per source every
+`flush_interval` seconds (and at interpreter shutdown).
+"""
+import atexit
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000]
+BUCKET_LABELS = [f"le_{b}" for b in LATENCY_BUCKETS_MS] + ["gt_5000"]
+
+RATE_LIMIT_COOLDOWN = timedelta(minutes=5)
+
+
+def _bucket_label(latency_ms):
+    for bound, label in zip(LATENCY_BUCKETS_MS, BUCKET_LABELS):
+        if latency_ms <= bound:
+            return label
+    return BUCKET_LABELS[-1]
+
+
+def _empty_delta():
+    return {"requests": 0, "success": 0, "failure": 0, "latency": {}, "set": {}}
+
+
+def histogram_percentile(histogram, pct):
+    """Approximate percentile (ms) from bucket counts: the upper bound of the bucket holding it."""
+    total = sum(histogram.get(label, 0) for label in BUCKET_LABELS)
+    if not total:
+        return None
+    threshold = total * pct
+    running = 0
+    for bound, label in zip(LATENCY_BUCKETS_MS + [None], BUCKET_LABELS):
+        running += histogram.get(label, 0)
+        if running >= threshold:
+            return bound if bound is not None else LATENCY_BUCKETS_MS[-1]
+    return LATENCY_BUCKETS_MS[-1]
+
+
+class SourceMetrics:
+    def __init__(self, get_db, flush_interval=30.0):
+        self._get_db = get_db
+        self.flush_interval = flush_interval
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def record(self, source, success, error_msg=None, latency_ms=None):
+        """Record one upstream call. Returns the cooldownUntil it set, if it looked rate limited."""
+        now = datetime.now(timezone.utc)
+        cooldown_until = None
+        fields = {"lastRequest": now, "isRateLimited": False}
+        if not success:
+            fields["lastFailure"] = now
+            if error_msg:
+                fields["lastFailureReason"] = error_msg
+                if "rate" in error_msg.lower() or "429" in error_msg:
+                    cooldown_until = now + RATE_LIMIT_COOLDOWN
+                    fields["isRateLimited"] = True
+                    fields["cooldownUntil"] = cooldown_until
+
+        with self._lock:
+            delta = self._pending.setdefault(source, _empty_delta())
+            delta["requests"] += 1
+            delta["success" if success else "failure"] += 1
+            if latency_ms is not None:
+                label = _bucket_label(latency_ms)
+                delta["latency"][label] = delta["latency"].get(label, 0) + 1
+            delta["set"].update(fields)
+        return cooldown_until
+
+    def pending(self, source):
+        """Unflushed deltas for one source (copy)."""
+        with self._lock:
+            delta = self._pending.get(source)
+            if not delta:
+                return _empty_delta()
+            return {
+                "requests": delta["requests"],
+                "success": delta["success"],
+                "failure": delta["failure"],
+                "latency": dict(delta["latency"]),
+                "set": dict(delta["set"])
+            }
+
+    def pending_sources(self):
+        with self._lock:
+            return list(self._pending.keys())
+
+    def flush(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        try:
+            db = self._get_db()
+            for source, delta in pending.items():
+                inc_fields = {
+                    "requestsToday": delta["requests"],
+                    "successCount": delta["success"],
+                    "failureCount": delta["failure"]
+                }
+                for label, count in delta["latency"].items():
+                    inc_fields[f"latencyHistogram.{label}"] = count
+                db.source_health.update_one(
+                    {"source": source},
+                    {"$set": delta["set"], "$inc": inc_fields},
+                    upsert=True
+                )
+        except Exception as e:
+            print(f"[METRICS] Failed to flush source metrics, keeping them for the next flush: {e}")
+            self._merge_back(pending)
+
+    def _merge_back(self, pending):
+        with self._lock:
+            for source, old in pending.items():
+                delta = self._pending.setdefault(source, _empty_delta())
+                for key in ("requests", "success", "failure"):
+                    delta[key] += old[key]
+                for label, count in old["latency"].items():
+                    delta["latency"][label] = delta["latency"].get(label, 0) + count
+                # Newer state wins over the failed batch
+                delta["set"] = {**old["set"], **delta["set"]}
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._flush_loop, name="SourceMetricsFlusher")
+            self._thread.daemon = True
+            self._thread.start()
+        atexit.register(self.flush)
+
+    def _flush_loop(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def merged_view(self, doc, source):
+        """Persisted source_health totals for `source` merged with what is still in memory."""
+        doc = doc or {}
+        delta = self.pending(source)
+        histogram = dict(doc.get("latencyHistogram") or {})
+        for label, count in delta["latency"].items():
+            histogram[label] = histogram.get(label, 0) + count
+        state = {**doc, **delta["set"]}
+
+        def iso(value):
+            return value.isoformat() if hasattr(value, "isoformat") else value
+
+        return {
+            "lastRequest": iso(state.get("lastRequest")),
+            "requestsToday": doc.get("requestsToday", 0) + delta["requests"],
+            "successCount": doc.get("successCount", 0) + delta["success"],
+            "failureCount": doc.get("failureCount", 0) + delta["failure"],
+            "isRateLimited": state.get("isRateLimited", False),
+            "cooldownUntil": iso(state.get("cooldownUntil")),
+            "lastFailure": iso(state.get("lastFailure")),
+            "lastError": state.get("lastFailureReason"),
+            "unflushedRequests": delta["requests"],
+            "latencyHistogram": {label: histogram.get(label, 0) for label in BUCKET_LABELS},
+            "latencyP50Ms": histogram_percentile(histogram, 0.50),
+            "latencyP95Ms": histogram_percentile(histogram, 0.95)
+        }
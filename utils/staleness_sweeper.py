@@ -0,0 +1,107 @@
+# utils/staleness_sweeper.py
+"""
+Background freshness sweeper for cached artist data.
+
+Each freshness field on `artists` (lastAggregated, bio_cached_at, ...) is
+registered with its TTL and a refresher callable. Every `interval` seconds the
+sweeper runs an indexed range query per field for artists that will expire
+within the lead window, and refreshes at most `max_per_sweep` of them, most
+overdue first. This spreads refresh load over time and keeps read paths from
+ever having to trigger refreshes themselves.
+
+Older artist docs stored these fields as ISO strings; the first sweep converts
+them to datetimes once so the range queries can see them.
+"""
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+
+
+class StalenessSweeper:
+    def __init__(self, get_db, interval=60.0, max_per_sweep=10, lead_fraction=0.15):
+        self._get_db = get_db
+        self.interval = interval
+        self.max_per_sweep = max_per_sweep
+        # Refresh once an entry is within this fraction of its TTL from expiring
+        self.lead_fraction = lead_fraction
+        self._fields = {}
+        self._migrated = set()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def register(self, field, ttl: timedelta, refresher):
+        """`refresher(artist_doc)` refreshes `field` for one artist; the doc carries artistId and name."""
+        self._fields[field] = (ttl, refresher)
+
+    def _migrate_string_stamps(self, db):
+        """One-time conversion of legacy ISO-string stamps; unparseable ones become "long expired"."""
+        for field in self._fields:
+            if field in self._migrated:
+                continue
+            converted = 0
+            for doc in db.artists.find({field: {"$type": "string"}}, {field: 1}):
+                try:
+                    stamp = datetime.fromisoformat(doc[field])
+                except ValueError:
+                    stamp = datetime(1970, 1, 1, tzinfo=timezone.utc)
+                db.artists.update_one({"_id": doc["_id"], field: doc[field]}, {"$set": {field: stamp}})
+                converted += 1
+            if converted:
+                print(f"[SWEEPER] Converted {converted} legacy string {field} values to datetimes.")
+            self._migrated.add(field)
+
+    def _due(self, db, now, budget):
+        candidates = []
+        for field, (ttl, refresher) in self._fields.items():
+            due_before = now - ttl * (1 - self.lead_fraction)
+            # Don't pick the same artist again while its refresh is still in flight
+            resweep_cutoff = now - ttl * self.lead_fraction
+            query = {
+                field: {"$lt": due_before},
+                "$or": [
+                    {f"sweptAt.{field}": {"$exists": False}},
+                    {f"sweptAt.{field}": {"$lt": resweep_cutoff}}
+                ]
+            }
+            for doc in db.artists.find(query, {"artistId": 1, "name": 1, field: 1}).sort(field, 1).limit(budget):
+                stamp = doc[field]
+                if stamp.tzinfo is None:
+                    stamp = stamp.replace(tzinfo=timezone.utc)
+                candidates.append((stamp + ttl, field, doc, refresher))
+        candidates.sort(key=lambda c: c[0])
+        return candidates[:budget]
+
+    def sweep_once(self) -> int:
+        """Refresh up to max_per_sweep artists that are about to expire. Returns how many were refreshed."""
+        db = self._get_db()
+        self._migrate_string_stamps(db)
+        now = datetime.now(timezone.utc)
+        refreshed = 0
+        for expires_at, field, doc, refresher in self._due(db, now, self.max_per_sweep):
+            db.artists.update_one({"_id": doc["_id"]}, {"$set": {f"sweptAt.{field}": now}})
+            try:
+                refresher(doc)
+                refreshed += 1
+            except Exception as e:
+                print(f"[SWEEPER] Refreshing {field} for {doc.get('artistId')} failed: {e}")
+        if refreshed:
+            print(f"[SWEEPER] Refreshed {refreshed} expiring artist entries.")
+        return refreshed
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._sweep_loop, name="StalenessSweeper")
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _sweep_loop(self):
+        while True:
+            time.sleep(self.interval)
+            try:
+                self.sweep_once()
+            except Exception as e:
+                print(f"[SWEEPER] Sweep failed: {e}")
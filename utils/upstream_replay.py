@@ -0,0 +1,295 @@
+# utils/upstream_replay.py
+"""
+Record/replay transport for upstream HTTP APIs.
+
+Patches requests' HTTPAdapter.send so every outgoing request made through
+`requests` (MusicBrainz, Deezer, Last.fm, LRCLib, Wikidata, JioSaavn, Apple,
+Ticketmaster, YouTube Data API via utils.http_client, ...) can be:
+
+  record  - sent for real, with the response saved as a JSON fixture under
+            UPSTREAM_FIXTURES_DIR/<host>/<key>.json
+  replay  - redirected to a local stand-in HTTP server that serves the recorded
+            fixture, with configurable latency and failure injection
+
+so aggregation, chart refresh and search can be benchmarked offline and reproducibly.
+Traffic that bypasses `requests` (e.g. a googleapiclient/httplib2 client) is not
+seen here; upstream calls must go through utils.http_client to be recorded.
+
+    UPSTREAM_MODE=record python app.py        # capture fixtures while using the app
+    UPSTREAM_MODE=replay python -m scripts.benchmark_upstreams
+
+Replay knobs (env or install() kwargs):
+    REPLAY_LATENCY_MS     "recorded" (default) to reuse the captured latency, or a fixed number
+    REPLAY_LATENCY_SCALE  multiplier applied to the latency (default 1.0)
+    REPLAY_JITTER_MS      +/- uniform jitter (default 0)
+    REPLAY_FAILURE_RATE   probability of an injected failure per request (default 0)
+    REPLAY_FAILURE_HOSTS  comma-separated hosts to inject failures into (default: all)
+    REPLAY_SEED           seed for jitter/failure decisions (default 0)
+"""
+import base64
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from requests.adapters import HTTPAdapter
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_FIXTURES_DIR = os.path.join(BASE_DIR, "database", "upstream_fixtures")
+
+# Credentials never end up in fixture files or keys, so fixtures replay under any key
+REDACTED_PARAMS = {"api_key", "apikey", "key", "token", "access_token", "client_secret"}
+# Response headers that no longer describe the stored (already decoded) body
+DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+FAILURE_STATUSES = (503, 429, 500)
+
+_original_send = HTTPAdapter.send
+_state = {"mode": None, "fixtures_dir": None, "server": None}
+_stats_lock = threading.Lock()
+_stats = {"recorded": 0, "replayed": 0, "misses": 0, "injectedFailures": 0}
+
+
+def _bump(counter):
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def replay_stats():
+    with _stats_lock:
+        return dict(_stats, mode=_state["mode"])
+
+
+def fixture_key(method, url):
+    """(redacted URL, key): key is stable across param order and API keys."""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in REDACTED_PARAMS)
+    clean = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+    return clean, hashlib.sha1(f"{method.upper()} {clean}".encode("utf-8")).hexdigest()
+
+
+def _fixture_path(fixtures_dir, host, key):
+    return os.path.join(fixtures_dir, host or "_", f"{key}.json")
+
+
+def _is_local(url):
+    return (urlsplit(url).hostname or "") in ("127.0.0.1", "localhost")
+
+
+def _record(adapter, request, **kwargs):
+    response = _original_send(adapter, request, **kwargs)
+    if _is_local(request.url):
+        return response
+    try:
+        clean_url, key = fixture_key(request.method, request.url)
+        host = urlsplit(clean_url).hostname
+        path = _fixture_path(_state["fixtures_dir"], host, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fixture = {
+            "method": request.method,
+            "url": clean_url,
+            "status": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS},
+            "body": base64.b64encode(response.content).decode("ascii"),
+            "elapsedMs": round(response.elapsed.total_seconds() * 1000, 1),
+            "recordedAt": datetime.now(timezone.utc).isoformat()
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(fixture, f, indent=1)
+        os.replace(tmp_path, path)
+        _bump("recorded")
+    except Exception as e:
+        print(f"[REPLAY] Failed to record {request.url}: {e}")
+    return response
+
+
+def _replay(adapter, request, **kwargs):
+    if _is_local(request.url):
+        return _original_send(adapter, request, **kwargs)
+    clean_url, key = fixture_key(request.method, request.url)
+    server = _state["server"]
+    redirected = request.copy()
+    redirected.url = f"http://127.0.0.1:{server.port}/{key}"
+    redirected.headers["X-Replay-Host"] = urlsplit(clean_url).hostname or "_"
+    redirected.headers["X-Replay-Url"] = clean_url
+    redirected.headers.pop("Host", None)
+    kwargs["proxies"] = {}
+    response = _original_send(adapter, redirected, **kwargs)
+    # Callers see the upstream URL, not the stand-in
+    response.url = request.url
+    response.request = request
+    return response
+
+
+def _patched_send(adapter, request, **kwargs):
+    if _state["mode"] == "record":
+        return _record(adapter, request, **kwargs)
+    if _state["mode"] == "replay":
+        return _replay(adapter, request, **kwargs)
+    return _original_send(adapter, request, **kwargs)
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # Injected connection drops surface here; they're intentional
+        pass
+
+
+class ReplayServer:
+    """Local stand-in upstream serving recorded fixtures with injected latency and failures."""
+
+    def __init__(self, fixtures_dir, latency_ms="recorded", latency_scale=1.0, jitter_ms=0,
+                 failure_rate=0.0, failure_hosts=None, seed=0):
+        self.fixtures_dir = fixtures_dir
+        self.latency_ms = latency_ms
+        self.latency_scale = latency_scale
+        self.jitter_ms = jitter_ms
+        self.failure_rate = failure_rate
+        self.failure_hosts = set(failure_hosts or [])
+        self.seed = seed
+        self._occurrences = {}
+        self._lock = threading.Lock()
+        self._fixtures = {}
+        self._httpd = None
+        self.port = None
+
+    def _load(self, host, key):
+        path = _fixture_path(self.fixtures_dir, host, key)
+        fixture = self._fixtures.get(path)
+        if fixture is None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                fixture = json.load(f)
+            fixture["content"] = base64.b64decode(fixture.pop("body", ""))
+            self._fixtures[path] = fixture
+        return fixture
+
+    def _rng(self, key):
+        # Seeded per (key, occurrence) so decisions don't depend on thread interleaving
+        with self._lock:
+            n = self._occurrences.get(key, 0)
+            self._occurrences[key] = n + 1
+        return random.Random(f"{self.seed}:{key}:{n}")
+
+    def _delay_seconds(self, fixture, rng):
+        if self.latency_ms == "recorded":
+            base = (fixture or {}).get("elapsedMs", 0)
+        else:
+            base = float(self.latency_ms)
+        delay = base * self.latency_scale
+        if self.jitter_ms:
+            delay += rng.uniform(-self.jitter_ms, self.jitter_ms)
+        return max(delay, 0) / 1000.0
+
+    def handle(self, handler):
+        key = handler.path.lstrip("/")
+        # Drain any request body so the keep-alive connection stays in sync
+        length = int(handler.headers.get("Content-Length") or 0)
+        if length:
+            handler.rfile.read(length)
+        host = handler.headers.get("X-Replay-Host", "_")
+        url = handler.headers.get("X-Replay-Url", "")
+        fixture = self._load(host, key)
+        rng = self._rng(key)
+        time.sleep(self._delay_seconds(fixture, rng))
+
+        if self.failure_rate and (not self.failure_hosts or host in self.failure_hosts) and rng.random() < self.failure_rate:
+            _bump("injectedFailures")
+            status = rng.choice(FAILURE_STATUSES)
+            if rng.random() < 0.25:
+                # Simulated connection drop
+                handler.close_connection = True
+                handler.connection.close()
+                return
+            return self._write(handler, status, {"Content-Type": "text/plain"}, b"injected failure")
+
+        if fixture is None:
+            _bump("misses")
+            print(f"[REPLAY] No fixture for {url}")
+            return self._write(handler, 404, {"Content-Type": "text/plain", "X-Replay-Miss": "1"}, b"no fixture recorded")
+
+        _bump("replayed")
+        self._write(handler, fixture["status"], fixture.get("headers", {}), fixture["content"])
+
+    @staticmethod
+    def _write(handler, status, headers, content):
+        handler.send_response(status)
+        for name, value in headers.items():
+            if name.lower() not in DROPPED_HEADERS:
+                handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(content)))
+        handler.end_headers()
+        if handler.command != "HEAD":
+            handler.wfile.write(content)
+
+    def start(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server.handle(self)
+
+            do_POST = do_PUT = do_DELETE = do_HEAD = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = _QuietHTTPServer(("127.0.0.1", 0), Handler)
+        self.port = self._httpd.server_address[1]
+        thread = threading.Thread(target=self._httpd.serve_forever, name="ReplayServer")
+        thread.daemon = True
+        thread.start()
+        print(f"[REPLAY] Serving fixtures from {self.fixtures_dir} on 127.0.0.1:{self.port}")
+
+    def stop(self):
+        if self._httpd:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+
+def install(mode=None, fixtures_dir=None, **server_options):
+    """
+    Enable record or replay mode (defaults from UPSTREAM_MODE / UPSTREAM_FIXTURES_DIR).
+    Returns the ReplayServer in replay mode, otherwise None.
+    """
+    mode = (mode or os.getenv("UPSTREAM_MODE", "")).lower() or None
+    if mode not in ("record", "replay"):
+        return None
+    uninstall()
+    _state["mode"] = mode
+    _state["fixtures_dir"] = fixtures_dir or os.getenv("UPSTREAM_FIXTURES_DIR", DEFAULT_FIXTURES_DIR)
+
+    if mode == "replay":
+        latency = os.getenv("REPLAY_LATENCY_MS", "recorded")
+        options = {
+            "latency_ms": latency if latency == "recorded" else float(latency),
+            "latency_scale": float(os.getenv("REPLAY_LATENCY_SCALE", "1.0")),
+            "jitter_ms": float(os.getenv("REPLAY_JITTER_MS", "0")),
+            "failure_rate": float(os.getenv("REPLAY_FAILURE_RATE", "0")),
+            "failure_hosts": [h.strip() for h in os.getenv("REPLAY_FAILURE_HOSTS", "").split(",") if h.strip()],
+            "seed": os.getenv("REPLAY_SEED", "0"),
+        }
+        options.update(server_options)
+        server = ReplayServer(_state["fixtures_dir"], **options)
+        server.start()
+        _state["server"] = server
+
+    HTTPAdapter.send = _patched_send
+    print(f"[REPLAY] Upstream transport in {mode} mode ({_state['fixtures_dir']})")
+    return _state["server"]
+
+
+def uninstall():
+    HTTPAdapter.send = _original_send
+    if _state["server"]:
+        _state["server"].stop()
+    _state.update(mode=None, server=None)
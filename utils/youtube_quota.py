@@ -0,0 +1,133 @@
+# utils/youtube_quota.py
+"""
+YouTube Data API quota accountant.
+
+Every YouTube call asks for its unit cost up front (search.list = 100,
+videos.list = 1, ...). Spend is tracked per quota day, which resets at midnight
+Pacific time like Google's quota, in a Mongo doc shared by all processes.
+Background fetches may only spend up to (budget - user reserve), so user-facing
+search keeps working; anything that would cross its limit is refused before the
+request is made, and callers fall back to JioSaavn. A quotaExceeded 403 marks
+the day as spent.
+
+    from utils.youtube_quota import youtube_quota
+    if not youtube_quota.try_spend("search"):
+        return []   # fall back to Saavn
+
+Callers that must tell "refused for quota" apart from "no results" raise QuotaRefused.
+"""
+import os
+import threading
+from datetime import datetime, timezone, timedelta
+
+from pymongo.errors import DuplicateKeyError
+
+try:
+    from zoneinfo import ZoneInfo
+    PACIFIC = ZoneInfo("America/Los_Angeles")
+except Exception:
+    # No tz database available: PST without DST is at most an hour off
+    PACIFIC = timezone(timedelta(hours=-8))
+
+# Unit cost per operation (https://developers.google.com/youtube/v3/determine_quota_cost)
+YT_COSTS = {
+    "search": 100,
+    "videos.list": 1,
+    "channels.list": 1,
+    "playlists.list": 1,
+    "playlistItems.list": 1,
+}
+
+DAILY_BUDGET = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+# Share of the daily budget only user-facing calls may spend
+USER_RESERVE_FRACTION = float(os.getenv("YOUTUBE_USER_RESERVE_FRACTION", "0.3"))
+
+
+def quota_day(now=None):
+    """The current quota day (Pacific date) and when it resets, as (YYYY-MM-DD, reset datetime UTC)."""
+    local = (now or datetime.now(timezone.utc)).astimezone(PACIFIC)
+    next_midnight = (local + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return local.strftime("%Y-%m-%d"), next_midnight.astimezone(timezone.utc)
+
+
+class QuotaRefused(Exception):
+    """A YouTube call was not made (or was rejected) because the daily quota is spent."""
+
+
+class YouTubeQuota:
+    def __init__(self, get_db, daily_budget=DAILY_BUDGET, user_reserve_fraction=USER_RESERVE_FRACTION):
+        self._get_db = get_db
+        self.daily_budget = daily_budget
+        self.user_reserve = int(daily_budget * user_reserve_fraction)
+        # Fallback accounting for when Mongo is unavailable
+        self._local = {}
+        self._lock = threading.Lock()
+
+    def _limit(self, user_facing):
+        return self.daily_budget if user_facing else self.daily_budget - self.user_reserve
+
+    def try_spend(self, operation, user_facing=True, units=None) -> bool:
+        """Reserve the cost of one `operation` call. False means don't make the call."""
+        cost = units if units is not None else YT_COSTS[operation]
+        limit = self._limit(user_facing)
+        day, _ = quota_day()
+        try:
+            # Conditional $inc: matches only while there is room; otherwise the upsert collides on _id
+            self._get_db().youtube_quota.find_one_and_update(
+                {"_id": day, "spent": {"$lte": limit - cost}},
+                {"$inc": {"spent": cost, f"byOperation.{operation.replace('.', '_')}": cost}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            print(f"[YT_QUOTA] Refusing {operation} ({'user' if user_facing else 'background'}): daily budget reached.")
+            return False
+        except Exception as e:
+            print(f"[YT_QUOTA] Quota store unavailable, using local count: {e}")
+            with self._lock:
+                spent = self._local.get(day, 0)
+                if spent + cost > limit:
+                    return False
+                self._local[day] = spent + cost
+                return True
+
+    def record_exhausted(self):
+        """YouTube said quotaExceeded: treat today's budget as spent."""
+        day, _ = quota_day()
+        print("[YT_QUOTA] YouTube reported quota exhausted; short-circuiting until reset.")
+        try:
+            self._get_db().youtube_quota.update_one({"_id": day}, {"$max": {"spent": self.daily_budget}}, upsert=True)
+        except Exception:
+            with self._lock:
+                self._local[day] = self.daily_budget
+
+    def remaining(self) -> int:
+        return self.status()["remaining"]
+
+    def status(self):
+        day, resets_at = quota_day()
+        try:
+            doc = self._get_db().youtube_quota.find_one({"_id": day}) or {}
+            spent = doc.get("spent", 0)
+        except Exception:
+            spent = self._local.get(day, 0)
+        return {
+            "day": day,
+            "spent": spent,
+            "budget": self.daily_budget,
+            "userReserve": self.user_reserve,
+            "remaining": max(self.daily_budget - spent, 0),
+            "resetsAt": resets_at.isoformat()
+        }
+
+
+def is_quota_error(resp):
+    return resp.status_code == 403 and "quota" in resp.text.lower()
+
+
+def _default_db():
+    from models.user import User
+    return User.get_db_connection()
+
+
+youtube_quota = YouTubeQuota(_default_db)